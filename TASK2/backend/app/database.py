@@ -3,29 +3,80 @@ Database configuration and session management.
 Uses SQLAlchemy async engine with PostgreSQL.
 """
 
-from sqlalchemy import text
+import asyncio
+import logging
+
+from sqlalchemy import event, make_url, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Create async engine
-# Note: statement_cache_size=0 is required for Supabase/pgbouncer compatibility
-engine = create_async_engine(
+def _create_engine(url: str, pool_size: int, max_overflow: int, statement_cache_size: int):
+    """
+    Create an async engine for the configured database.
+    
+    PostgreSQL is the production backend. SQLite (sqlite+aiosqlite) is
+    accepted as a local stand-in for benchmarks; the 'fynd' schema is
+    emulated with an attached database file next to the main one.
+    
+    Args:
+        url: Database URL
+        pool_size: Connections kept open in the pool
+        max_overflow: Extra connections allowed under load
+        statement_cache_size: asyncpg prepared statement cache size; 0
+            disables it, which pgbouncer in transaction mode requires
+    """
+    if url.startswith("sqlite"):
+        sqlite_engine = create_async_engine(url, echo=settings.debug)
+        schema_path = make_url(url).database or ":memory:"
+        if schema_path != ":memory:":
+            schema_path = f"{schema_path}.fynd"
+        
+        @event.listens_for(sqlite_engine.sync_engine, "connect")
+        def _attach_schema(dbapi_connection, connection_record):
+            dbapi_connection.execute(f"ATTACH DATABASE '{schema_path}' AS fynd")
+        
+        return sqlite_engine
+    
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        connect_args={
+            "statement_cache_size": statement_cache_size,
+            "prepared_statement_cache_size": statement_cache_size,
+        },
+    )
+
+
+# Write engine: submissions, workers, reprocessing, migrations
+engine = _create_engine(
     settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    connect_args={
-        "statement_cache_size": 0,
-        "prepared_statement_cache_size": 0,
-    },
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    statement_cache_size=settings.db_statement_cache_size,
 )
 
-# Session factory
+# Read engine: admin listings, stats and exports. A separate pool keeps
+# dashboard scans from queueing submissions behind them. SQLite shares the
+# write engine (an in-memory database is private to its engine).
+if settings.database_url.startswith("sqlite") and not settings.database_read_url:
+    read_engine = engine
+else:
+    read_engine = _create_engine(
+        settings.database_read_url or settings.database_url,
+        pool_size=settings.db_read_pool_size,
+        max_overflow=settings.db_read_max_overflow,
+        statement_cache_size=settings.db_read_statement_cache_size,
+    )
+
+# Session factories
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -34,35 +85,473 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
     pass
 
 
+# Keeps fynd.review_counters in step with fynd.reviews for every writer
+REVIEW_COUNTERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION fynd.review_counters_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.rating = NEW.rating AND OLD.status = NEW.status THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE fynd.review_counters SET count = count - 1
+        WHERE rating = OLD.rating AND status = OLD.status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO fynd.review_counters (rating, status, count)
+        VALUES (NEW.rating, NEW.status, 1)
+        ON CONFLICT (rating, status)
+        DO UPDATE SET count = fynd.review_counters.count + 1;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+REVIEW_COUNTERS_TRIGGER = """
+CREATE TRIGGER review_counters_sync
+AFTER INSERT OR DELETE OR UPDATE OF rating, status ON fynd.reviews
+FOR EACH ROW EXECUTE FUNCTION fynd.review_counters_sync()
+"""
+
+
+# Keeps fynd.review_rollups in step with fynd.reviews for every writer
+REVIEW_ROLLUPS_APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION fynd.review_rollups_apply(
+    ts TIMESTAMPTZ, review_rating INTEGER, review_status TEXT, delta INTEGER
+) RETURNS void AS $$
+DECLARE
+    g TEXT;
+BEGIN
+    FOREACH g IN ARRAY ARRAY['hour', 'day'] LOOP
+        INSERT INTO fynd.review_rollups AS r (
+            granularity, bucket_start, review_count, rating_sum,
+            pending_count, success_count, failed_count
+        )
+        VALUES (
+            g,
+            date_trunc(g, ts AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+            delta,
+            delta * review_rating,
+            CASE WHEN review_status = 'PENDING' THEN delta ELSE 0 END,
+            CASE WHEN review_status = 'SUCCESS' THEN delta ELSE 0 END,
+            CASE WHEN review_status = 'FAILED' THEN delta ELSE 0 END
+        )
+        ON CONFLICT (granularity, bucket_start) DO UPDATE SET
+            review_count = r.review_count + EXCLUDED.review_count,
+            rating_sum = r.rating_sum + EXCLUDED.rating_sum,
+            pending_count = r.pending_count + EXCLUDED.pending_count,
+            success_count = r.success_count + EXCLUDED.success_count,
+            failed_count = r.failed_count + EXCLUDED.failed_count;
+    END LOOP;
+END
+$$ LANGUAGE plpgsql
+"""
+
+REVIEW_ROLLUPS_FUNCTION = """
+CREATE OR REPLACE FUNCTION fynd.review_rollups_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.rating = NEW.rating AND OLD.status = NEW.status
+            AND OLD.created_at = NEW.created_at THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM fynd.review_rollups_apply(OLD.created_at, OLD.rating, OLD.status::text, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM fynd.review_rollups_apply(NEW.created_at, NEW.rating, NEW.status::text, 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+REVIEW_ROLLUPS_TRIGGER = """
+CREATE TRIGGER review_rollups_sync
+AFTER INSERT OR DELETE OR UPDATE OF rating, status, created_at ON fynd.reviews
+FOR EACH ROW EXECUTE FUNCTION fynd.review_rollups_sync()
+"""
+
+REVIEW_ROLLUPS_BACKFILL = """
+INSERT INTO fynd.review_rollups (
+    granularity, bucket_start, review_count, rating_sum,
+    pending_count, success_count, failed_count
+)
+SELECT
+    g.granularity,
+    date_trunc(g.granularity, r.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    count(*),
+    sum(r.rating),
+    count(*) FILTER (WHERE r.status = 'PENDING'),
+    count(*) FILTER (WHERE r.status = 'SUCCESS'),
+    count(*) FILTER (WHERE r.status = 'FAILED')
+FROM fynd.reviews r
+CROSS JOIN (VALUES ('hour'), ('day')) AS g(granularity)
+GROUP BY 1, 2
+"""
+
+
+# Publishes review inserts and analysis/status changes for /admin/stream.
+# The payload stays small (NOTIFY payloads are limited to 8000 bytes);
+# listeners load the row itself.
+REVIEW_NOTIFY_CHANNEL = "fynd_reviews"
+
+REVIEW_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION fynd.review_notify() RETURNS trigger AS $$
+DECLARE
+    payload json;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        payload := json_build_object(
+            'op', 'insert', 'id', NEW.id, 'rating', NEW.rating, 'status', NEW.status
+        );
+    ELSE
+        payload := json_build_object(
+            'op', 'update', 'id', NEW.id, 'rating', NEW.rating, 'status', NEW.status,
+            'old_rating', OLD.rating, 'old_status', OLD.status
+        );
+    END IF;
+    PERFORM pg_notify('fynd_reviews', payload::text);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+REVIEW_NOTIFY_TRIGGERS = {
+    "review_notify_insert": """
+    CREATE TRIGGER review_notify_insert
+    AFTER INSERT ON fynd.reviews
+    FOR EACH ROW EXECUTE FUNCTION fynd.review_notify()
+    """,
+    # Worker claims only touch claimed_at/updated_at and are not published
+    "review_notify_update": """
+    CREATE TRIGGER review_notify_update
+    AFTER UPDATE ON fynd.reviews
+    FOR EACH ROW WHEN (
+        OLD.status IS DISTINCT FROM NEW.status
+        OR OLD.rating IS DISTINCT FROM NEW.rating
+        OR OLD.ai_summary IS DISTINCT FROM NEW.ai_summary
+        OR OLD.ai_actions IS DISTINCT FROM NEW.ai_actions
+    )
+    EXECUTE FUNCTION fynd.review_notify()
+    """,
+}
+
+
+# Weighted search document: review text ranks above the AI summary
+REVIEW_SEARCH_COLUMN = """
+ALTER TABLE fynd.reviews ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(review_text, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(ai_summary, '')), 'B')
+) STORED
+"""
+
+
 async def get_db() -> AsyncSession:
     """
     Dependency that provides a database session.
     Automatically commits on success, rolls back on exception.
+    Skips the commit when the route already committed its work.
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
 
 
-async def init_db() -> None:
-    """Initialize database schema and tables."""
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency that provides a session on the read engine.
+    For admin queries; the transaction is rolled back, never committed.
+    """
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+async def set_statement_timeout(db: AsyncSession, seconds: float) -> None:
+    """
+    Bound every statement of the session's current transaction.
+    
+    PostgreSQL only. The setting is transaction-local, so it ends with the
+    commit or rollback and is safe behind pgbouncer in transaction mode.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    await db.execute(
+        text("SELECT set_config('statement_timeout', :timeout, true)"),
+        {"timeout": f"{max(int(seconds * 1000), 1)}ms"}
+    )
+
+
+SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS fynd.schema_version (
+    version INTEGER PRIMARY KEY,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+)
+"""
+
+
+async def _migrate_baseline(conn) -> None:
+    """Version 1: tables, later-added columns, indexes and the search column."""
+    await conn.run_sync(Base.metadata.create_all)
+    # Columns added after the initial release (create_all skips existing tables)
+    await conn.execute(text(
+        "ALTER TABLE fynd.reviews ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMPTZ"
+    ))
+    await conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_reviews_created_at_id "
+        "ON fynd.reviews (created_at, id)"
+    ))
+    await conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_reviews_rating_created_at_id "
+        "ON fynd.reviews (rating, created_at, id)"
+    ))
+    await conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_reviews_updated_at "
+        "ON fynd.reviews (updated_at)"
+    ))
+    # Full-text search: kept in sync by Postgres, not mapped on the model
+    await conn.execute(text(REVIEW_SEARCH_COLUMN))
+    await conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_reviews_search_vector "
+        "ON fynd.reviews USING GIN (search_vector)"
+    ))
+
+
+async def _migrate_prompt_version(conn) -> None:
+    """Version 2: record the prompt version of each analysis."""
+    await conn.execute(text(
+        "ALTER TABLE fynd.reviews ADD COLUMN IF NOT EXISTS prompt_version VARCHAR(32)"
+    ))
+
+
+async def _migrate_duplicates(conn) -> None:
+    """Version 3: near-duplicate source and spam flag of each review."""
+    await conn.execute(text(
+        "ALTER TABLE fynd.reviews ADD COLUMN IF NOT EXISTS duplicate_of INTEGER"
+    ))
+    await conn.execute(text(
+        "ALTER TABLE fynd.reviews ADD COLUMN IF NOT EXISTS spam_suspected BOOLEAN NOT NULL DEFAULT false"
+    ))
+
+
+async def _migrate_cache_expiry(conn) -> None:
+    """Version 4: index analysis cache entries by age for pruning."""
+    await conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_llm_analysis_cache_created_at "
+        "ON fynd.llm_analysis_cache (created_at)"
+    ))
+
+
+# (version, step) in order. Steps must be idempotent; never change an
+# applied step, append a new one instead.
+MIGRATIONS = [
+    (1, _migrate_baseline),
+    (2, _migrate_prompt_version),
+    (3, _migrate_duplicates),
+    (4, _migrate_cache_expiry),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+async def get_schema_version(conn) -> int:
+    """Return the applied schema version (0 for a database never migrated)."""
+    if await conn.scalar(text("SELECT to_regclass('fynd.schema_version')")) is None:
+        return 0
+    return await conn.scalar(text("SELECT coalesce(max(version), 0) FROM fynd.schema_version"))
+
+
+async def migrate(conn) -> int:
+    """
+    Apply pending migrations.
+    
+    Concurrent callers (several replicas starting at once) serialize on an
+    advisory lock; the later ones find nothing left to do.
+    
+    Returns:
+        Number of migrations applied
+    """
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('fynd.schema_version'))"))
+    await conn.execute(text("CREATE SCHEMA IF NOT EXISTS fynd"))
+    await conn.execute(text(SCHEMA_VERSION_TABLE))
+    current = await get_schema_version(conn)
+    
+    applied = 0
+    for version, step in MIGRATIONS:
+        if version <= current:
+            continue
+        logger.info(f"Applying schema migration {version}: {step.__doc__.splitlines()[0]}")
+        await step(conn)
+        await conn.execute(
+            text("INSERT INTO fynd.schema_version (version) VALUES (:version)"),
+            {"version": version}
+        )
+        applied += 1
+    return applied
+
+
+async def init_db(run_migrations: bool = settings.db_migrate_on_startup) -> None:
+    """
+    Bring the database schema up to date.
+    
+    A database already at SCHEMA_VERSION costs three small queries: the
+    version check and the trigger check for the optional features.
+    
+    Args:
+        run_migrations: Apply pending migrations and sync optional triggers.
+            When False (deploys that run `python -m app.migrate` instead),
+            only verify the schema version.
+    
+    Raises:
+        RuntimeError: If migrations are disabled and the schema is behind
+    """
     async with engine.begin() as conn:
-        # Create schema if it doesn't exist
-        await conn.execute(text("CREATE SCHEMA IF NOT EXISTS fynd"))
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
+        if engine.dialect.name != "postgresql":
+            # Benchmark stand-in: plain table creation only
+            await conn.run_sync(Base.metadata.create_all)
+            return
+        
+        current = await get_schema_version(conn)
+        if current < SCHEMA_VERSION:
+            if not run_migrations:
+                raise RuntimeError(
+                    f"Database schema is at version {current}, expected {SCHEMA_VERSION}; "
+                    "run `python -m app.migrate`"
+                )
+            await migrate(conn)
+        
+        if run_migrations:
+            await _sync_review_triggers(conn)
+
+
+async def _sync_review_triggers(conn) -> None:
+    """Install or drop the optional fynd.reviews triggers to match the settings."""
+    result = await conn.execute(text(
+        "SELECT tgname FROM pg_trigger WHERE tgrelid = 'fynd.reviews'::regclass"
+    ))
+    installed = set(result.scalars().all())
+    
+    # A dropped trigger leaves its table stale; re-enabling backfills it
+    if settings.stats_use_counters:
+        if "review_counters_sync" not in installed:
+            await _install_review_counters(conn)
+    elif "review_counters_sync" in installed:
+        await conn.execute(text("DROP TRIGGER IF EXISTS review_counters_sync ON fynd.reviews"))
+    if settings.stats_use_rollups:
+        if "review_rollups_sync" not in installed:
+            await _install_review_rollups(conn)
+    elif "review_rollups_sync" in installed:
+        await conn.execute(text("DROP TRIGGER IF EXISTS review_rollups_sync ON fynd.reviews"))
+    await _sync_review_notify(conn, installed & set(REVIEW_NOTIFY_TRIGGERS))
+
+
+async def warm_pools() -> None:
+    """
+    Open DB_POOL_PREWARM connections on each engine ahead of traffic.
+    
+    Connections are opened concurrently and returned to the pool, so the
+    first requests after startup do not each pay for a new connection.
+    """
+    if settings.db_pool_prewarm <= 0 or engine.dialect.name != "postgresql":
+        return
+    
+    pools = [(engine, settings.db_pool_size)]
+    if read_engine is not engine:
+        pools.append((read_engine, settings.db_read_pool_size))
+    
+    async def warm(target, count: int) -> None:
+        connections = await asyncio.gather(
+            *(target.connect().start() for _ in range(count)),
+            return_exceptions=True
+        )
+        for connection in connections:
+            if isinstance(connection, BaseException):
+                logger.warning(f"Connection pool pre-warm failed: {connection}")
+            else:
+                await connection.close()
+    
+    await asyncio.gather(*(
+        warm(target, min(settings.db_pool_prewarm, pool_size))
+        for target, pool_size in pools
+    ))
+
+
+async def _install_review_counters(conn) -> None:
+    """Install the counters trigger and backfill counts on first install."""
+    await conn.execute(text(REVIEW_COUNTERS_FUNCTION))
+    
+    # Block writers while checking/backfilling so no insert is counted twice or missed
+    await conn.execute(text("LOCK TABLE fynd.reviews IN SHARE ROW EXCLUSIVE MODE"))
+    installed = await conn.scalar(text(
+        "SELECT 1 FROM pg_trigger WHERE tgname = 'review_counters_sync' "
+        "AND tgrelid = 'fynd.reviews'::regclass"
+    ))
+    if installed:
+        return
+    
+    await conn.execute(text("DELETE FROM fynd.review_counters"))
+    await conn.execute(text(
+        "INSERT INTO fynd.review_counters (rating, status, count) "
+        "SELECT rating, status, count(*) FROM fynd.reviews GROUP BY rating, status"
+    ))
+    await conn.execute(text(REVIEW_COUNTERS_TRIGGER))
+
+
+async def _install_review_rollups(conn) -> None:
+    """Install the rollups trigger and backfill buckets on first install."""
+    await conn.execute(text(REVIEW_ROLLUPS_APPLY_FUNCTION))
+    await conn.execute(text(REVIEW_ROLLUPS_FUNCTION))
+    
+    # Block writers while checking/backfilling so no insert is counted twice or missed
+    await conn.execute(text("LOCK TABLE fynd.reviews IN SHARE ROW EXCLUSIVE MODE"))
+    installed = await conn.scalar(text(
+        "SELECT 1 FROM pg_trigger WHERE tgname = 'review_rollups_sync' "
+        "AND tgrelid = 'fynd.reviews'::regclass"
+    ))
+    if installed:
+        return
+    
+    await conn.execute(text("DELETE FROM fynd.review_rollups"))
+    await conn.execute(text(REVIEW_ROLLUPS_BACKFILL))
+    await conn.execute(text(REVIEW_ROLLUPS_TRIGGER))
+
+
+async def _sync_review_notify(conn, installed: set[str]) -> None:
+    """Install the NOTIFY triggers when the live feed is enabled, drop them otherwise."""
+    if not settings.admin_stream_enabled:
+        for name in installed:
+            await conn.execute(text(f"DROP TRIGGER IF EXISTS {name} ON fynd.reviews"))
+        return
+    if installed == set(REVIEW_NOTIFY_TRIGGERS):
+        return
+    
+    await conn.execute(text(REVIEW_NOTIFY_FUNCTION))
+    for name, trigger in REVIEW_NOTIFY_TRIGGERS.items():
+        if name not in installed:
+            await conn.execute(text(trigger))
 
 
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
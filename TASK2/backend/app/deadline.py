@@ -0,0 +1,36 @@
+"""
+Request deadlines.
+A submission gets an end-to-end deadline from the configured SLO; the LLM
+call, the OpenAI client and the database writes are bounded by what is
+left of it, so the fallback is served within the SLO.
+"""
+
+import time
+from typing import Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class Deadline:
+    """A point in time (monotonic clock) by which a request must answer."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+def get_request_deadline() -> Optional[Deadline]:
+    """Dependency that starts the deadline of a submission (None when the SLO is disabled)."""
+    if settings.request_slo_seconds <= 0:
+        return None
+    return Deadline(settings.request_slo_seconds)
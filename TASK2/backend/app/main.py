@@ -2,20 +2,27 @@
 FastAPI Application - Main entry point.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.config import get_settings
-from app.database import init_db, close_db
+from app.database import init_db, close_db, warm_pools
 from app.routes import reviews, admin
-from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler
+from app.middleware.metrics import PrometheusMiddleware
+from app.middleware.rate_limit import limiter, RateLimitExceeded, rate_limit_exceeded_handler
 from app.schemas import HealthResponse
+from app.services.admin_feed import get_admin_feed
+from app.services.duplicate_index import get_duplicate_detector
+from app.services.llm_service import get_llm_service
+from app.services.prompt_compiler import preload_tokenizer
+from app.services.reprocess_service import get_reprocess_service
+from app.services.review_worker import get_review_worker
 
 # Configure logging
 logging.basicConfig(
@@ -33,16 +40,30 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting application...")
     try:
-        await init_db()
+        # Pre-warm the pools and load the tokenizer while the schema
+        # version is checked
+        await asyncio.gather(init_db(), warm_pools(), preload_tokenizer())
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
     
+    # Fills in the background; submissions are served meanwhile
+    duplicate_detector = get_duplicate_detector()
+    duplicate_detector.start()
+    
+    review_worker = get_review_worker()
+    if settings.review_processing_mode == "async" and settings.review_worker_enabled:
+        await review_worker.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    await review_worker.stop()
+    await get_reprocess_service().stop()
+    await get_admin_feed().stop()
+    await duplicate_detector.stop()
     await close_db()
 
 
@@ -72,6 +93,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route request latency for /metrics
+app.add_middleware(PrometheusMiddleware)
+
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -90,7 +114,20 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.get("/health", response_model=HealthResponse, tags=["health"])
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(status="healthy", database="connected")
+    llm_service = get_llm_service()
+    return HealthResponse(
+        status="healthy",
+        database="connected",
+        llm_circuit=llm_service.breaker.state.value,
+        llm_in_flight=llm_service.in_flight
+    )
+
+
+# Prometheus scrape endpoint
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+async def metrics():
+    """Expose Prometheus metrics."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
 # Include routers
@@ -0,0 +1,107 @@
+"""
+Prometheus metrics for the feedback API.
+Defines the metric objects and helpers used to instrument hot paths.
+"""
+
+import functools
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.database import engine, read_engine
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+)
+
+LLM_CALL_DURATION = Histogram(
+    "llm_call_duration_seconds",
+    "OpenAI chat completion latency",
+    ["outcome", "prompt_version"],
+    buckets=(0.25, 0.5, 1, 2, 3, 5, 8, 13, 21, 30, 60),
+)
+
+LLM_FALLBACKS = Counter(
+    "llm_fallback_responses_total",
+    "Fallback responses served instead of an LLM analysis",
+    ["cause"],
+)
+
+LLM_HEDGES = Counter(
+    "llm_hedged_requests_total",
+    "Slow LLM calls that were hedged (primary_won, hedge_won) or not (over_budget)",
+    ["result"],
+)
+
+ANALYSIS_TIER = Counter(
+    "review_analysis_tier_total",
+    "Reviews by the tier that answered them (empty, local, duplicate, cache, llm)",
+    ["tier"],
+)
+
+SPAM_SUSPECTED = Counter(
+    "review_spam_suspected_total",
+    "Submissions flagged as part of a near-duplicate burst from one IP",
+)
+
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "Tokens reported in OpenAI usage",
+    ["type", "prompt_version"],
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database latency per ReviewService method",
+    ["method"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the SQLAlchemy pool",
+    ["pool"],
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond the pool size",
+    ["pool"],
+)
+
+
+def _watch_pool(name: str, pool) -> None:
+    """Export checked-out and overflow counts of a QueuePool."""
+    if hasattr(pool, "checkedout"):
+        DB_POOL_CHECKED_OUT.labels(pool=name).set_function(pool.checkedout)
+        DB_POOL_OVERFLOW.labels(pool=name).set_function(lambda: max(pool.overflow(), 0))
+
+
+_watch_pool("write", engine.sync_engine.pool)
+if read_engine is not engine:
+    _watch_pool("read", read_engine.sync_engine.pool)
+
+
+def observe_db_latency(func):
+    """Record the latency of an async ReviewService method."""
+    histogram = DB_QUERY_DURATION.labels(method=func.__name__)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+def record_usage(usage, prompt_version: str) -> None:
+    """Count prompt/completion tokens from an OpenAI usage object."""
+    if usage is None:
+        return
+    LLM_TOKENS.labels(type="prompt", prompt_version=prompt_version).inc(usage.prompt_tokens or 0)
+    LLM_TOKENS.labels(type="completion", prompt_version=prompt_version).inc(usage.completion_tokens or 0)
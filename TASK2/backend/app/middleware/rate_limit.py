@@ -1,38 +1,222 @@
 """
-Rate limiting middleware using SlowAPI.
-Implements IP-based rate limiting for review submissions.
+Rate limiting for review submissions.
+Implements IP-based sliding window limits with pluggable counter storage,
+so several uvicorn workers can share one limit through Postgres.
 """
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+import logging
+import math
+import time
+from typing import Optional, Protocol
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
+from sqlalchemy import text
 
 from app.config import get_settings
+from app.database import AsyncSessionLocal
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
+
+class RateLimitExceeded(Exception):
+    """Raised when a client exceeded its request limit."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Rate limit exceeded, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RateLimitStorage(Protocol):
+    """Counter storage for fixed windows."""
+
+    async def hit(self, key: str, window_start: int, window: int) -> tuple[int, int]:
+        """
+        Count a request in the window starting at `window_start`.
+
+        Returns:
+            Tuple of (count in current window, count in previous window)
+        """
+        ...
+
+
+class MemoryRateLimitStorage:
+    """Per-process counters; also used as the local pre-check."""
+
+    def __init__(self):
+        # key -> {window_start: count}, holding at most the last two windows
+        self._counts: dict[str, dict[int, int]] = {}
+        self._latest_window = 0
+
+    def peek(self, key: str, window_start: int, window: int) -> tuple[int, int]:
+        """Read counts without counting a request."""
+        windows = self._counts.get(key, {})
+        return windows.get(window_start, 0), windows.get(window_start - window, 0)
+
+    async def hit(self, key: str, window_start: int, window: int) -> tuple[int, int]:
+        if window_start > self._latest_window:
+            # New window: forget clients not seen in the last two windows
+            self._latest_window = window_start
+            self._counts = {
+                k: v for k, v in self._counts.items()
+                if max(v) >= window_start - window
+            }
+        windows = self._counts.setdefault(key, {})
+        for start in [s for s in windows if s < window_start - window]:
+            del windows[start]
+        windows[window_start] = windows.get(window_start, 0) + 1
+        return windows[window_start], windows.get(window_start - window, 0)
+
+
+class PostgresRateLimitStorage:
+    """
+    Counters shared by all processes through the existing Postgres.
+
+    Each hit is one atomic upsert that also returns the previous window's
+    count. Expired windows are deleted at most once per window.
+    """
+
+    HIT = text("""
+        WITH current AS (
+            INSERT INTO fynd.rate_limit_counters (key, window_start, count)
+            VALUES (:key, :window_start, 1)
+            ON CONFLICT (key, window_start)
+            DO UPDATE SET count = fynd.rate_limit_counters.count + 1
+            RETURNING count
+        )
+        SELECT current.count, COALESCE((
+            SELECT count FROM fynd.rate_limit_counters
+            WHERE key = :key AND window_start = :previous_start
+        ), 0)
+        FROM current
+    """)
+
+    CLEANUP = text("DELETE FROM fynd.rate_limit_counters WHERE window_start < :before")
+
+    def __init__(self):
+        self._last_cleanup = 0
+
+    async def hit(self, key: str, window_start: int, window: int) -> tuple[int, int]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(self.HIT, {
+                "key": key,
+                "window_start": window_start,
+                "previous_start": window_start - window,
+            })
+            current, previous = result.one()
+            if window_start > self._last_cleanup:
+                self._last_cleanup = window_start
+                await db.execute(self.CLEANUP, {"before": window_start - window})
+            await db.commit()
+        return current, previous
+
+
+class RateLimiter:
+    """
+    Sliding window limiter (weighted previous + current fixed window).
+
+    A local in-memory window is checked first: a request it rejects would
+    be rejected by the shared storage too, so such requests and clients
+    already known to be blocked never reach the database.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: int,
+        storage: Optional[RateLimitStorage] = None
+    ):
+        self.limit = limit
+        self.window = window
+        self.local = MemoryRateLimitStorage()
+        self.storage = storage
+        # key -> monotonic time until which the key is known to be blocked
+        self._blocked_until: dict[str, float] = {}
+        self._current_window = 0
+
+    def _estimate(self, current: int, previous: int, now: float, window_start: int) -> float:
+        """Sliding window estimate of requests in the last `window` seconds."""
+        elapsed = (now - window_start) / self.window
+        return previous * (1 - elapsed) + current
+
+    async def check(self, key: str) -> None:
+        """
+        Count a request for `key`.
+
+        Raises:
+            RateLimitExceeded: If the key is over its limit
+        """
+        now = time.time()
+        window_start = int(now // self.window) * self.window
+        retry_after = max(1, math.ceil(window_start + self.window - now))
+
+        if window_start != self._current_window:
+            self._current_window = window_start
+            monotonic_now = time.monotonic()
+            self._blocked_until = {
+                k: until for k, until in self._blocked_until.items() if until > monotonic_now
+            }
+
+        blocked_until = self._blocked_until.get(key)
+        if blocked_until is not None:
+            if time.monotonic() < blocked_until:
+                raise RateLimitExceeded(retry_after)
+            del self._blocked_until[key]
+
+        current, previous = self.local.peek(key, window_start, self.window)
+        if self._estimate(current + 1, previous, now, window_start) > self.limit:
+            raise RateLimitExceeded(retry_after)
+        await self.local.hit(key, window_start, self.window)
+
+        if self.storage is None:
+            return
+
+        try:
+            current, previous = await self.storage.hit(key, window_start, self.window)
+        except Exception as e:
+            # Fail open: the local window still bounds each process
+            logger.warning(f"Shared rate limit check failed: {e}")
+            return
+
+        if self._estimate(current, previous, now, window_start) > self.limit:
+            self._blocked_until[key] = time.monotonic() + retry_after
+            raise RateLimitExceeded(retry_after)
+
+
+def get_client_ip(request: Request) -> str:
+    """Extract client IP from request."""
+    forwarded = request.headers.get("X-Forwarded-For")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
 # Create limiter instance
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=[f"{settings.rate_limit_requests}/{settings.rate_limit_window}seconds"]
+limiter = RateLimiter(
+    limit=settings.rate_limit_requests,
+    window=settings.rate_limit_window,
+    storage=PostgresRateLimitStorage() if settings.rate_limit_storage == "postgres" else None
 )
 
 
+def get_limiter() -> RateLimiter:
+    """Get the rate limiter instance."""
+    return limiter
+
+
+async def rate_limit(request: Request) -> None:
+    """Dependency enforcing the per-IP submission limit."""
+    await limiter.check(get_client_ip(request))
+
+
 async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
     """Custom handler for rate limit exceeded errors."""
     return JSONResponse(
         status_code=429,
+        headers={"Retry-After": str(exc.retry_after)},
         content={
             "success": False,
             "ai_response": "Please wait a moment before submitting another review. We want to ensure everyone gets a chance to share their feedback."
         }
     )
-
-
-def get_limiter() -> Limiter:
-    """Get the rate limiter instance."""
-    return limiter
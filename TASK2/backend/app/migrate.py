@@ -0,0 +1,54 @@
+"""
+Schema migration entry point.
+
+Applies pending migrations and syncs the optional triggers, for deploys
+that start the API with DB_MIGRATE_ON_STARTUP=false:
+
+    python -m app.migrate
+    python -m app.migrate --check
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database import SCHEMA_VERSION, close_db, engine, get_schema_version, init_db
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Apply pending database schema migrations")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report the schema version; exit 1 if migrations are pending"
+    )
+    return parser.parse_args()
+
+
+async def main() -> int:
+    """Migrate (or check) the database and return the exit code."""
+    args = parse_args()
+
+    try:
+        if args.check:
+            async with engine.connect() as conn:
+                current = await get_schema_version(conn)
+            logger.info(f"Schema version {current}, latest {SCHEMA_VERSION}")
+            return 0 if current >= SCHEMA_VERSION else 1
+
+        await init_db(run_migrations=True)
+        logger.info(f"Schema is at version {SCHEMA_VERSION}")
+        return 0
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
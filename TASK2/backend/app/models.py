@@ -5,8 +5,8 @@ SQLAlchemy ORM models for the feedback system.
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, CheckConstraint
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, BigInteger, Boolean, String, Text, DateTime, Enum, CheckConstraint, Index
+from sqlalchemy.sql import false, func
 
 from app.database import Base
 
@@ -29,9 +29,13 @@ class Review(Base):
         ai_response: AI-generated response shown to user
         ai_summary: Internal summary for admin
         ai_actions: Recommended actions for admin
+        prompt_version: Prompt version that produced the analysis
+        duplicate_of: Review whose analysis was reused for this near-duplicate
+        spam_suspected: Part of a near-duplicate burst from one IP
         status: Processing status (pending/success/failed)
         error_message: Error details if processing failed
         ip_address: Client IP for rate limiting tracking
+        claimed_at: When a background worker claimed the review for processing
         created_at: Timestamp of submission
         updated_at: Last update timestamp
     """
@@ -46,6 +50,12 @@ class Review(Base):
     ai_response = Column(Text, nullable=True)
     ai_summary = Column(Text, nullable=True)
     ai_actions = Column(Text, nullable=True)
+    # Prompt version (template version + hash) of the analysis, for per-version cost tracking
+    prompt_version = Column(String(32), nullable=True)
+    
+    # Near-duplicate detection
+    duplicate_of = Column(Integer, nullable=True)
+    spam_suspected = Column(Boolean, nullable=False, default=False, server_default=false())
     
     # Processing metadata
     status = Column(
@@ -55,6 +65,7 @@ class Review(Base):
     )
     error_message = Column(Text, nullable=True)
     ip_address = Column(String(45), nullable=True)
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
     
     # Timestamps
     created_at = Column(
@@ -72,8 +83,163 @@ class Review(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint('rating >= 1 AND rating <= 5', name='check_rating_range'),
+        # Keyset pagination: newest first, optionally within a rating
+        Index('ix_reviews_created_at_id', 'created_at', 'id'),
+        Index('ix_reviews_rating_created_at_id', 'rating', 'created_at', 'id'),
+        # Admin ETags: max(updated_at) from the end of the index
+        Index('ix_reviews_updated_at', 'updated_at'),
         {'schema': 'fynd'}
     )
     
+    # Fetch server-generated columns via RETURNING instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self) -> str:
         return f"<Review(id={self.id}, rating={self.rating}, status={self.status})>"
+
+
+class ReviewCounter(Base):
+    """
+    Review counts per (rating, status), kept current by a database trigger.
+    
+    Lets admin statistics be read from at most 15 rows instead of scanning
+    the reviews table. See init_db for the trigger definition.
+    """
+    
+    __tablename__ = "review_counters"
+    
+    rating = Column(Integer, primary_key=True)
+    status = Column(Enum(ReviewStatus), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+    
+    __table_args__ = (
+        {'schema': 'fynd'},
+    )
+    
+    def __repr__(self) -> str:
+        return f"<ReviewCounter(rating={self.rating}, status={self.status}, count={self.count})>"
+
+
+class ReviewRollup(Base):
+    """
+    Review counts per hourly or daily UTC bucket, kept current by a trigger.
+    
+    Lets dashboard trends over months be read from a few hundred rows
+    instead of grouping the reviews table. See init_db for the trigger.
+    
+    Attributes:
+        granularity: Bucket size ("hour" or "day")
+        bucket_start: Start of the bucket (UTC)
+        review_count: Reviews created in the bucket
+        rating_sum: Sum of their ratings, for averages
+        pending_count/success_count/failed_count: Current status of those reviews
+    """
+    
+    __tablename__ = "review_rollups"
+    
+    granularity = Column(String(4), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    review_count = Column(BigInteger, nullable=False, default=0)
+    rating_sum = Column(BigInteger, nullable=False, default=0)
+    pending_count = Column(BigInteger, nullable=False, default=0)
+    success_count = Column(BigInteger, nullable=False, default=0)
+    failed_count = Column(BigInteger, nullable=False, default=0)
+    
+    __table_args__ = (
+        {'schema': 'fynd'},
+    )
+    
+    def __repr__(self) -> str:
+        return (
+            f"<ReviewRollup(granularity={self.granularity}, bucket_start={self.bucket_start}, "
+            f"review_count={self.review_count})>"
+        )
+
+
+class LLMCacheEntry(Base):
+    """
+    Persistent tier of the LLM analysis cache.
+    
+    Keyed by a hash of (model, prompt version, rating, normalized text).
+    """
+    
+    __tablename__ = "llm_analysis_cache"
+    
+    key = Column(String(64), primary_key=True)
+    user_response = Column(Text, nullable=False)
+    internal_summary = Column(Text, nullable=False)
+    recommended_actions = Column(Text, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        # Pruning of expired entries
+        Index('ix_llm_analysis_cache_created_at', 'created_at'),
+        {'schema': 'fynd'},
+    )
+    
+    def __repr__(self) -> str:
+        return f"<LLMCacheEntry(key={self.key[:12]}...)>"
+
+
+class ReprocessJob(Base):
+    """
+    Checkpointed batch job re-running LLM analysis over failed/pending reviews.
+    
+    Attributes:
+        id: Primary key
+        statuses: Comma-separated review statuses the job targets
+        state: Job state (running/paused/completed/failed)
+        last_review_id: Checkpoint - every targeted review up to this id succeeded
+        processed: Reviews analyzed so far
+        succeeded: Reviews that received a real analysis
+        error_message: Reason the job paused or failed
+    """
+    
+    __tablename__ = "reprocess_jobs"
+    
+    id = Column(Integer, primary_key=True)
+    statuses = Column(String(100), nullable=False)
+    state = Column(String(20), nullable=False, default="running")
+    last_review_id = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    succeeded = Column(Integer, nullable=False, default=0)
+    error_message = Column(Text, nullable=True)
+    
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        {'schema': 'fynd'},
+    )
+    
+    __mapper_args__ = {"eager_defaults": True}
+    
+    def __repr__(self) -> str:
+        return f"<ReprocessJob(id={self.id}, state={self.state}, last_review_id={self.last_review_id})>"
+
+
+class RateLimitCounter(Base):
+    """Request count per client key and fixed window, shared across workers."""
+    
+    __tablename__ = "rate_limit_counters"
+    
+    key = Column(String(100), primary_key=True)
+    window_start = Column(BigInteger, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        {'schema': 'fynd'},
+    )
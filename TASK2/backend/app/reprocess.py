@@ -0,0 +1,78 @@
+"""
+Reprocessing CLI entry point.
+
+Re-runs LLM analysis over failed (and optionally pending) reviews:
+
+    python -m app.reprocess --statuses failed pending --batch-size 50
+    python -m app.reprocess --resume 3
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database import AsyncSessionLocal, close_db
+from app.models import ReviewStatus
+from app.services.reprocess_service import get_reprocess_service
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Re-run LLM analysis over failed or pending reviews")
+    parser.add_argument(
+        "--statuses",
+        nargs="+",
+        choices=[ReviewStatus.FAILED.value, ReviewStatus.PENDING.value],
+        default=[ReviewStatus.FAILED.value]
+    )
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-reviews", type=int, default=None)
+    parser.add_argument("--resume", type=int, default=None, metavar="JOB_ID")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    """Create or resume a job and run it to completion in this process."""
+    args = parse_args()
+    reprocess_service = get_reprocess_service()
+
+    try:
+        async with AsyncSessionLocal() as db:
+            if args.resume is not None:
+                job = await reprocess_service.get_job(db, args.resume)
+                if job is None:
+                    raise SystemExit(f"Reprocess job {args.resume} not found")
+            else:
+                job = await reprocess_service.create_job(
+                    db,
+                    [ReviewStatus(status) for status in args.statuses]
+                )
+                await db.commit()
+            job_id = job.id
+
+        await reprocess_service.run_job(
+            job_id,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            max_reviews=args.max_reviews
+        )
+
+        async with AsyncSessionLocal() as db:
+            job = await reprocess_service.get_job(db, job_id)
+            logger.info(
+                f"Reprocess job {job.id} {job.state}: processed={job.processed} "
+                f"succeeded={job.succeeded} checkpoint={job.last_review_id}"
+            )
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,67 +2,178 @@
 Admin API routes - Internal dashboard endpoints.
 """
 
+import asyncio
 import logging
-from typing import Annotated, Optional
+from datetime import datetime, timedelta
+from typing import Annotated, AsyncIterator, Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas import AdminReviewsResponse, ReviewDetail, AdminStats
-from app.services.review_service import get_review_service, ReviewService
+from app.database import ReadSessionLocal, engine, get_db, get_read_db
+from app.models import ReviewStatus
+from app.schemas import (
+    AdminReviewsResponse,
+    AdminStats,
+    LLMCacheStats,
+    ReprocessRequest,
+    ReprocessJobResponse,
+    ReviewStatus as ReviewStatusFilter,
+    TimeseriesResponse,
+)
+from app.services.admin_cache import get_admin_cache, AdminCache
+from app.services.admin_feed import get_admin_feed, AdminFeed
+from app.services.llm_cache import get_llm_cache, LLMCache
+from app.services.review_export import (
+    EXPORT_FORMATS,
+    SERIALIZERS,
+    ExportFormatUnavailable,
+    check_parquet_available,
+)
+from app.services.reprocess_service import get_reprocess_service, ReprocessService
+from app.services.review_service import get_review_service, timeseries_range, ReviewService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
+# ReviewDetail fields only set for search results
+NO_SEARCH_FIELDS = {"rank": None, "review_text_highlight": None, "ai_summary_highlight": None}
+
+
+def serialize_reviews_page(rows: list[dict], total: int, next_cursor: Optional[str]) -> bytes:
+    """
+    Serialize a reviews page in the AdminReviewsResponse shape.
+    
+    Rows come straight from the projection query, so they are encoded with
+    orjson directly instead of being validated into models twice.
+    """
+    return orjson.dumps(
+        {"reviews": rows, "total": total, "next_cursor": next_cursor},
+        option=orjson.OPT_UTC_Z
+    )
+
+
 @router.get("/reviews", response_model=AdminReviewsResponse)
 async def get_reviews(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     review_service: Annotated[ReviewService, Depends(get_review_service)],
+    admin_cache: Annotated[AdminCache, Depends(get_admin_cache)],
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-    rating: Optional[int] = Query(default=None, ge=1, le=5)
+    rating: Optional[int] = Query(default=None, ge=1, le=5),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    q: Optional[str] = Query(
+        default=None,
+        max_length=200,
+        description="Full-text search over review text and AI summaries"
+    )
 ) -> AdminReviewsResponse:
     """
     Get all reviews for admin dashboard.
     
-    - Supports pagination via limit/offset
+    - Supports pagination via limit/offset or keyset cursor
     - Optional rating filter
+    - Optional full-text search (q): ranked results with highlights
     - Returns all AI-generated fields
-    - Ordered by most recent first
+    - Ordered by most recent first, or by relevance when searching
+    - Conditional requests: ETag / Last-Modified, 304 when unchanged
+    - Serialized once with orjson; the cached bytes are reused while valid
     """
-    reviews, total = await review_service.get_reviews(
-        db=db,
-        limit=limit,
-        offset=offset,
-        rating_filter=rating
+    search = q.strip() if q else ""
+    
+    async def load() -> bytes:
+        try:
+            if search:
+                rows, total, next_cursor = await review_service.search_reviews(
+                    db=db,
+                    search=search,
+                    limit=limit,
+                    offset=offset,
+                    rating_filter=rating,
+                    cursor=cursor
+                )
+            else:
+                rows, total, next_cursor = await review_service.get_reviews(
+                    db=db,
+                    limit=limit,
+                    offset=offset,
+                    rating_filter=rating,
+                    cursor=cursor
+                )
+                for row in rows:
+                    row.update(NO_SEARCH_FIELDS)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return serialize_reviews_page(rows, total, next_cursor)
+    
+    return await admin_cache.respond(
+        request, response, db,
+        key=("reviews", limit, offset, rating, cursor, search),
+        loader=load
     )
+
+
+@router.get("/reviews/export")
+async def export_reviews(
+    review_service: Annotated[ReviewService, Depends(get_review_service)],
+    format: Literal["ndjson", "csv", "parquet"] = Query(default="ndjson"),
+    rating: Optional[int] = Query(default=None, ge=1, le=5),
+    status: Optional[ReviewStatusFilter] = Query(default=None),
+    created_from: Optional[datetime] = Query(default=None, description="Inclusive lower bound"),
+    created_to: Optional[datetime] = Query(default=None, description="Exclusive upper bound"),
+    batch_size: int = Query(default=1000, ge=100, le=10000)
+) -> StreamingResponse:
+    """
+    Export reviews as a streamed NDJSON, CSV or Parquet download.
     
-    review_details = [
-        ReviewDetail(
-            id=r.id,
-            rating=r.rating,
-            review_text=r.review_text,
-            ai_summary=r.ai_summary,
-            ai_actions=r.ai_actions,
-            status=r.status,
-            created_at=r.created_at
-        )
-        for r in reviews
-    ]
+    - Rows are read in id order through a server-side cursor, batch_size at a time
+    - Memory use stays constant regardless of how many rows match
+    - Optional rating, status and created_at range filters
+    """
+    if format == "parquet":
+        try:
+            check_parquet_available()
+        except ExportFormatUnavailable as e:
+            raise HTTPException(status_code=501, detail=str(e))
+    
+    media_type, extension = EXPORT_FORMATS[format]
+    status_filter = ReviewStatus(status.value) if status is not None else None
+    
+    async def body() -> AsyncIterator[bytes]:
+        # Own session: the cursor must stay open for the whole response
+        async with ReadSessionLocal() as db:
+            batches = review_service.stream_reviews(
+                db,
+                rating_filter=rating,
+                status_filter=status_filter,
+                created_from=created_from,
+                created_to=created_to,
+                batch_size=batch_size
+            )
+            async for chunk in SERIALIZERS[format](batches):
+                yield chunk
     
-    return AdminReviewsResponse(
-        reviews=review_details,
-        total=total
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="reviews.{extension}"'}
     )
 
 
 @router.get("/stats", response_model=AdminStats)
 async def get_stats(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    review_service: Annotated[ReviewService, Depends(get_review_service)]
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    review_service: Annotated[ReviewService, Depends(get_review_service)],
+    admin_cache: Annotated[AdminCache, Depends(get_admin_cache)]
 ) -> AdminStats:
     """
     Get dashboard statistics.
@@ -73,5 +184,159 @@ async def get_stats(
     - Success/failed counts
     - Recent 24h activity
     - Rating distribution
+    
+    Supports conditional requests (ETag / Last-Modified, 304 when unchanged).
+    """
+    return await admin_cache.respond(
+        request, response, db,
+        key=("stats",),
+        loader=lambda: review_service.get_stats(db)
+    )
+
+
+# Range used when `from` is omitted
+DEFAULT_TIMESERIES_RANGE = {
+    "hour": timedelta(hours=48),
+    "day": timedelta(days=30),
+}
+
+
+@router.get("/stats/timeseries", response_model=TimeseriesResponse)
+async def get_stats_timeseries(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    review_service: Annotated[ReviewService, Depends(get_review_service)],
+    admin_cache: Annotated[AdminCache, Depends(get_admin_cache)],
+    start: Optional[datetime] = Query(default=None, alias="from", description="Range start (UTC if no offset)"),
+    end: Optional[datetime] = Query(default=None, alias="to", description="Range end, exclusive; defaults to now"),
+    bucket: Literal["hour", "day"] = Query(default="day")
+) -> TimeseriesResponse:
+    """
+    Get review counts, average rating and status counts per time bucket.
+    
+    - Hourly or daily UTC buckets, oldest first, empty buckets included
+    - Defaults to the last 48 hours (hour) or 30 days (day)
+    - Served from pre-aggregated rollups when STATS_USE_ROLLUPS is enabled
+    - Supports conditional requests (ETag / Last-Modified, 304 when unchanged)
     """
-    return await review_service.get_stats(db)
+    range_start, range_end = timeseries_range(start, end, bucket, DEFAULT_TIMESERIES_RANGE[bucket])
+    
+    async def load() -> TimeseriesResponse:
+        try:
+            points = await review_service.get_timeseries(
+                db, start=range_start, end=range_end, bucket=bucket
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return TimeseriesResponse(bucket=bucket, points=points)
+    
+    # Keyed on the resolved range: "last 30 days" polls share one result
+    # until the next bucket begins
+    return await admin_cache.respond(
+        request, response, db,
+        key=("timeseries", range_start, range_end, bucket),
+        loader=load
+    )
+
+
+# Comment line sent when idle so proxies keep the connection open
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    admin_feed: Annotated[AdminFeed, Depends(get_admin_feed)]
+) -> StreamingResponse:
+    """
+    Live review events as Server-Sent Events.
+    
+    - `review`: a new or changed review, in the /admin/reviews row shape
+    - `stats`: count deltas for the dashboard (total, status, rating)
+    - `resync`: events were missed; reload through the REST endpoints
+    
+    Requires ADMIN_STREAM_ENABLED and PostgreSQL (LISTEN/NOTIFY).
+    """
+    if not admin_feed.enabled or engine.dialect.name != "postgresql":
+        raise HTTPException(status_code=503, detail="Live admin stream is not enabled")
+    
+    subscription = admin_feed.subscribe()
+    
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            yield b"retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    yield await asyncio.wait_for(
+                        subscription.queue.get(), timeout=STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+        finally:
+            await admin_feed.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/llm-cache", response_model=LLMCacheStats)
+async def get_llm_cache_stats(
+    llm_cache: Annotated[LLMCache, Depends(get_llm_cache)]
+) -> LLMCacheStats:
+    """
+    Get LLM analysis cache statistics for this process.
+    
+    Returns memory/persistent hit counts, misses and hit rate.
+    """
+    return llm_cache.stats()
+
+
+@router.post("/reprocess", response_model=ReprocessJobResponse, status_code=202)
+async def start_reprocess(
+    request: ReprocessRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    reprocess_service: Annotated[ReprocessService, Depends(get_reprocess_service)]
+) -> ReprocessJobResponse:
+    """
+    Re-run LLM analysis over failed and/or pending reviews.
+    
+    - Starts a background job, or resumes one from its checkpoint
+    - Processes reviews in batches with bounded concurrency
+    - Poll GET /admin/reprocess/{job_id} for progress
+    """
+    if request.resume_job_id is not None:
+        job = await reprocess_service.get_job(db, request.resume_job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Reprocess job not found")
+    else:
+        job = await reprocess_service.create_job(
+            db,
+            [ReviewStatus(status.value) for status in request.statuses]
+        )
+    await db.commit()
+    
+    reprocess_service.start_job(
+        job.id,
+        batch_size=request.batch_size,
+        concurrency=request.concurrency,
+        max_reviews=request.max_reviews
+    )
+    return reprocess_service.to_response(job)
+
+
+# Reads the primary: a job created a moment ago may not have reached a replica
+@router.get("/reprocess/{job_id}", response_model=ReprocessJobResponse)
+async def get_reprocess_job(
+    job_id: int,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    reprocess_service: Annotated[ReprocessService, Depends(get_reprocess_service)]
+) -> ReprocessJobResponse:
+    """Get progress of a reprocessing job."""
+    job = await reprocess_service.get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Reprocess job not found")
+    return reprocess_service.to_response(job)
@@ -2,103 +2,406 @@
 Reviews API routes - User-facing endpoints for review submission.
 """
 
+import asyncio
+import json
 import logging
-from typing import Annotated
+from array import array
+from typing import Annotated, AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, Request, HTTPException
+from fastapi import APIRouter, Depends, Request, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas import ReviewCreate, ReviewResponse
+from app.config import get_settings
+from app.database import AsyncSessionLocal, get_db, set_statement_timeout
+from app.deadline import Deadline, get_request_deadline
+from app.middleware.rate_limit import get_client_ip, rate_limit
+from app.models import ReviewStatus
+from app.schemas import LLMAnalysis, ReviewCreate, ReviewResponse, ReviewStatusResponse
+from app.services.duplicate_index import get_duplicate_detector, DuplicateDetector
 from app.services.llm_service import get_llm_service, LLMService
 from app.services.review_service import get_review_service, ReviewService
+from app.services.review_worker import get_review_worker, ReviewWorker
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
+# Final writes of streamed reviews; referenced until done so a write that
+# outlives its disconnected request is not garbage collected
+_stream_writes: set[asyncio.Task] = set()
 
-def get_client_ip(request: Request) -> str:
-    """Extract client IP from request."""
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
 
+# Returned when a submission could not be processed normally
+RECEIVED_RESPONSE = ReviewResponse(
+    success=True,  # From user's perspective, submission was received
+    ai_response="Thank you for your feedback! Your review has been recorded and will be processed shortly."
+)
 
-@router.post("", response_model=ReviewResponse)
+
+async def _store_failed_review(
+    db: AsyncSession,
+    review_service: ReviewService,
+    review_data: ReviewCreate,
+    ip_address: Optional[str],
+    spam_suspected: bool,
+    error: Exception
+) -> None:
+    """
+    Last-resort write of a submission whose processing failed.
+    
+    Rolling back first also lifts the statement timeout, so this write is
+    not cut short. Errors are logged, never raised.
+    """
+    try:
+        await db.rollback()
+        review = await review_service.create_review(
+            db=db,
+            review_data=review_data,
+            ip_address=ip_address,
+            spam_suspected=spam_suspected
+        )
+        await review_service.mark_review_failed(
+            db=db,
+            review=review,
+            error_message=str(error)
+        )
+        await db.commit()
+    except Exception as save_error:
+        logger.error(f"Failed to save failed review: {save_error}")
+
+
+async def _bound_db(db: AsyncSession, deadline: Optional[Deadline]) -> None:
+    """Limit the transaction's statements to the rest of the deadline (at least the DB reserve)."""
+    if deadline is not None:
+        await set_statement_timeout(
+            db,
+            max(deadline.remaining(), settings.request_db_reserve_ms / 1000)
+        )
+
+
+@router.post("", response_model=ReviewResponse, dependencies=[Depends(rate_limit)])
 async def submit_review(
     review_data: ReviewCreate,
     request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     llm_service: Annotated[LLMService, Depends(get_llm_service)],
-    review_service: Annotated[ReviewService, Depends(get_review_service)]
+    review_service: Annotated[ReviewService, Depends(get_review_service)],
+    review_worker: Annotated[ReviewWorker, Depends(get_review_worker)],
+    duplicate_detector: Annotated[DuplicateDetector, Depends(get_duplicate_detector)],
+    deadline: Annotated[Optional[Deadline], Depends(get_request_deadline)]
 ) -> ReviewResponse:
     """
     Submit a new review.
     
     - Validates the review data
-    - Creates a database record
+    - Reuses the analysis of a near-duplicate review when one is indexed
     - Processes with LLM for AI response
-    - Updates record with results
+    - Stores the review with its results in a single INSERT
     - Returns AI-generated response
     
+    In async processing mode the review is stored as pending and returned
+    immediately; poll GET /reviews/{review_id} for the AI response.
+    
     Handles failures gracefully - user submissions are always stored.
+    The LLM call and the INSERT are bounded by the request deadline
+    (REQUEST_SLO_SECONDS); the fallback is stored when it runs out.
     """
     ip_address = get_client_ip(request)
     logger.info(f"New review submission: rating={review_data.rating}, ip={ip_address}")
     
-    try:
-        # Create the review record first (ensures we always store submissions)
+    check = duplicate_detector.check(
+        rating=review_data.rating,
+        review_text=review_data.review_text,
+        ip_address=ip_address
+    )
+    if check.analysis is not None:
+        # Near-duplicate of an analyzed review: no LLM call, in either mode
+        try:
+            await _bound_db(db, deadline)
+            review = await review_service.create_review_with_analysis(
+                db=db,
+                review_data=review_data,
+                analysis=check.analysis,
+                success=True,
+                ip_address=ip_address,
+                duplicate_of=check.duplicate_of,
+                spam_suspected=check.spam_suspected
+            )
+            await db.commit()
+            
+            return ReviewResponse(
+                success=True,
+                ai_response=check.analysis.user_response,
+                review_id=review.id,
+                status=review.status
+            )
+        except Exception as e:
+            # Continue with the regular path, which always stores the review
+            logger.error(f"Error storing near-duplicate review: {e}")
+            await db.rollback()
+    
+    if settings.review_processing_mode == "async":
+        await _bound_db(db, deadline)
         review = await review_service.create_review(
             db=db,
             review_data=review_data,
-            ip_address=ip_address
+            ip_address=ip_address,
+            spam_suspected=check.spam_suspected
         )
+        await db.commit()
+        review_worker.notify()
         
-        # Process with LLM
+        return ReviewResponse(
+            success=True,
+            ai_response="Thank you for your feedback! Your review has been received and is being processed.",
+            review_id=review.id,
+            status=ReviewStatus.PENDING
+        )
+    
+    try:
+        # Process with LLM first; no database connection is checked out yet.
+        # analyze_review never raises (it falls back), so the submission is
+        # always stored below.
         analysis, llm_success = await llm_service.analyze_review(
             rating=review_data.rating,
-            review_text=review_data.review_text
+            review_text=review_data.review_text,
+            deadline=deadline
         )
         
-        # Update review with analysis
-        await review_service.update_review_with_analysis(
+        # Store the review together with its analysis in one INSERT
+        await _bound_db(db, deadline)
+        review = await review_service.create_review_with_analysis(
             db=db,
-            review=review,
+            review_data=review_data,
             analysis=analysis,
-            success=llm_success
+            success=llm_success,
+            ip_address=ip_address,
+            spam_suspected=check.spam_suspected
         )
         
         await db.commit()
+        if llm_success:
+            duplicate_detector.add(review.id, review_data.rating, review_data.review_text, analysis, check.signature)
         
         return ReviewResponse(
             success=True,
-            ai_response=analysis.user_response
+            ai_response=analysis.user_response,
+            review_id=review.id,
+            status=review.status
         )
         
     except Exception as e:
         logger.error(f"Error processing review: {e}")
+        await _store_failed_review(db, review_service, review_data, ip_address, check.spam_suspected, e)
         
-        # Try to save the failed submission
-        try:
-            await db.rollback()
-            review = await review_service.create_review(
-                db=db,
-                review_data=review_data,
-                ip_address=ip_address
-            )
-            await review_service.mark_review_failed(
+        # Always return a friendly message to user
+        return RECEIVED_RESPONSE
+
+
+def _sse(event: str, data: str) -> str:
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _store_streamed_analysis(
+    review_service: ReviewService,
+    duplicate_detector: DuplicateDetector,
+    review_id: int,
+    review_data: ReviewCreate,
+    analysis: LLMAnalysis,
+    llm_success: bool,
+    sig: Optional[array],
+    deadline: Optional[Deadline]
+) -> ReviewStatus:
+    """
+    Store the final analysis of a streamed review.
+    
+    Returns:
+        The stored status, or PENDING if the write failed
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            await _bound_db(db, deadline)
+            stored = await review_service.get_review(db, review_id)
+            await review_service.update_review_with_analysis(
                 db=db,
-                review=review,
-                error_message=str(e)
+                review=stored,
+                analysis=analysis,
+                success=llm_success
             )
             await db.commit()
-        except Exception as save_error:
-            logger.error(f"Failed to save failed review: {save_error}")
+            status = stored.status
+        if llm_success:
+            duplicate_detector.add(review_id, review_data.rating, review_data.review_text, analysis, sig)
+        return status
+    except Exception as e:
+        logger.error(f"Failed to store streamed analysis for review {review_id}: {e}")
+        return ReviewStatus.PENDING
+
+
+@router.post("/stream", dependencies=[Depends(rate_limit)])
+async def submit_review_stream(
+    review_data: ReviewCreate,
+    request: Request,
+    llm_service: Annotated[LLMService, Depends(get_llm_service)],
+    review_service: Annotated[ReviewService, Depends(get_review_service)],
+    duplicate_detector: Annotated[DuplicateDetector, Depends(get_duplicate_detector)],
+    deadline: Annotated[Optional[Deadline], Depends(get_request_deadline)]
+) -> StreamingResponse:
+    """
+    Submit a new review and stream the AI response via Server-Sent Events.
+    
+    Events:
+    - `token`: {"delta": "..."} with new response text as it is generated
+    - `done`: the final ReviewResponse; its ai_response is authoritative.
+      Every stream ends with it, also when the review could only be stored
+      as failed
+    
+    The review is stored before streaming starts and updated with the full
+    analysis at the end. No database connection is held while streaming.
+    If the client disconnects mid-stream, the fallback analysis is stored
+    (status failed, picked up by /admin/reprocess).
+    """
+    ip_address = get_client_ip(request)
+    logger.info(f"New streamed review submission: rating={review_data.rating}, ip={ip_address}")
+    
+    async def event_stream() -> AsyncIterator[str]:
+        check = duplicate_detector.check(
+            rating=review_data.rating,
+            review_text=review_data.review_text,
+            ip_address=ip_address
+        )
+        if check.analysis is not None:
+            # Near-duplicate: send the reused response as a single token
+            try:
+                async with AsyncSessionLocal() as db:
+                    await _bound_db(db, deadline)
+                    review = await review_service.create_review_with_analysis(
+                        db=db,
+                        review_data=review_data,
+                        analysis=check.analysis,
+                        success=True,
+                        ip_address=ip_address,
+                        duplicate_of=check.duplicate_of,
+                        spam_suspected=check.spam_suspected
+                    )
+                    await db.commit()
+            except Exception as e:
+                # Continue with the regular path, which stores the review first
+                logger.error(f"Error storing near-duplicate review: {e}")
+            else:
+                yield _sse("token", json.dumps({"delta": check.analysis.user_response}))
+                response = ReviewResponse(
+                    success=True,
+                    ai_response=check.analysis.user_response,
+                    review_id=review.id,
+                    status=review.status
+                )
+                yield _sse("done", response.model_dump_json())
+                return
         
-        # Always return a friendly message to user
-        return ReviewResponse(
-            success=True,  # From user's perspective, submission was received
-            ai_response="Thank you for your feedback! Your review has been recorded and will be processed shortly."
+        try:
+            async with AsyncSessionLocal() as db:
+                await _bound_db(db, deadline)
+                review = await review_service.create_review(
+                    db=db,
+                    review_data=review_data,
+                    ip_address=ip_address,
+                    spam_suspected=check.spam_suspected
+                )
+                await db.commit()
+        except Exception as e:
+            # Same fallback as POST /reviews; the stream still ends with `done`
+            logger.error(f"Error storing streamed review: {e}")
+            async with AsyncSessionLocal() as db:
+                await _store_failed_review(db, review_service, review_data, ip_address, check.spam_suspected, e)
+            yield _sse("done", RECEIVED_RESPONSE.model_dump_json())
+            return
+        
+        analysis, llm_success = None, False
+        try:
+            async for kind, payload in llm_service.analyze_review_stream(
+                rating=review_data.rating,
+                review_text=review_data.review_text,
+                deadline=deadline
+            ):
+                if kind == "delta":
+                    yield _sse("token", json.dumps({"delta": payload}))
+                else:
+                    analysis, llm_success = payload
+        finally:
+            if analysis is None:
+                # The client went away mid-stream and the generator was closed
+                logger.warning(f"Stream for review {review.id} closed early, storing fallback")
+                analysis = llm_service.fallback_analysis(review_data.rating, review_data.review_text)
+            # Run as its own task and shield it: the cancellation that closes
+            # a disconnected stream must not cut the write short
+            write = asyncio.create_task(_store_streamed_analysis(
+                review_service,
+                duplicate_detector,
+                review.id,
+                review_data,
+                analysis,
+                llm_success,
+                check.signature,
+                deadline
+            ))
+            _stream_writes.add(write)
+            write.add_done_callback(_stream_writes.discard)
+            status = await asyncio.shield(write)
+        
+        response = ReviewResponse(
+            success=True,
+            ai_response=analysis.user_response,
+            review_id=review.id,
+            status=status
+        )
+        yield _sse("done", response.model_dump_json())
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/{review_id}", response_model=ReviewStatusResponse)
+async def get_review_status(
+    review_id: int,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    review_service: Annotated[ReviewService, Depends(get_review_service)],
+    review_worker: Annotated[ReviewWorker, Depends(get_review_worker)],
+    wait: float = Query(default=0, ge=0, le=30, description="Seconds to long-poll while pending")
+) -> ReviewStatusResponse:
+    """
+    Get the processing status and AI response of a submitted review.
+    
+    - Returns immediately when wait=0
+    - Otherwise long-polls until the review leaves the pending state or
+      the wait expires; in-process completions wake the request directly
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    
+    while True:
+        review = await review_service.get_review(db, review_id)
+        if review is None:
+            raise HTTPException(status_code=404, detail="Review not found")
+        
+        remaining = deadline - loop.time()
+        if review.status != ReviewStatus.PENDING or remaining <= 0:
+            return ReviewStatusResponse(
+                review_id=review.id,
+                status=review.status,
+                ai_response=review.ai_response
+            )
+        
+        # Release the connection while waiting and re-read fresh state
+        await db.rollback()
+        db.expunge_all()
+        await review_worker.wait_for(
+            review_id,
+            timeout=min(remaining, settings.review_worker_poll_interval)
         )
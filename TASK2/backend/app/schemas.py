@@ -2,6 +2,7 @@
 Pydantic schemas for request/response validation.
 """
 
+import re
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
@@ -9,6 +10,12 @@ from enum import Enum
 from pydantic import BaseModel, Field, field_validator
 
 
+# ASCII control characters other than tab and newlines. They are never
+# typed in a review, NUL cannot be stored, and the search highlighter uses
+# \x02/\x03 as markers
+CONTROL_CHARACTERS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
 class ReviewStatus(str, Enum):
     """Status of review processing."""
     PENDING = "pending"
@@ -36,8 +43,36 @@ class ReviewCreate(BaseModel):
     @field_validator("review_text")
     @classmethod
     def clean_review_text(cls, v: str) -> str:
-        """Strip whitespace from review text."""
-        return v.strip() if v else ""
+        """Strip whitespace and control characters from review text."""
+        return CONTROL_CHARACTERS.sub("", v).strip() if v else ""
+
+
+class ReprocessRequest(BaseModel):
+    """Schema for starting or resuming a reprocessing job."""
+    
+    statuses: List[ReviewStatus] = Field(
+        default=[ReviewStatus.FAILED],
+        description="Review statuses to re-analyze (failed and/or pending)"
+    )
+    batch_size: int = Field(default=50, ge=1, le=500)
+    concurrency: int = Field(default=4, ge=1, le=32)
+    max_reviews: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Stop after this many reviews (job can be resumed)"
+    )
+    resume_job_id: Optional[int] = Field(
+        default=None,
+        description="Continue a paused job from its checkpoint"
+    )
+    
+    @field_validator("statuses")
+    @classmethod
+    def check_statuses(cls, v: List[ReviewStatus]) -> List[ReviewStatus]:
+        """Only failed and pending reviews can be reprocessed."""
+        if not v or ReviewStatus.SUCCESS in v:
+            raise ValueError("statuses must be a non-empty subset of [failed, pending]")
+        return v
 
 
 # ============== Response Schemas ==============
@@ -47,12 +82,36 @@ class ReviewResponse(BaseModel):
     
     success: bool = Field(..., description="Whether the submission was successful")
     ai_response: str = Field(..., description="AI-generated response message")
+    review_id: Optional[int] = Field(default=None, description="ID of the stored review")
+    status: Optional[ReviewStatus] = Field(default=None, description="Processing status")
     
     class Config:
         json_schema_extra = {
             "example": {
                 "success": True,
-                "ai_response": "Thank you for your feedback! We're glad you enjoyed your experience."
+                "ai_response": "Thank you for your feedback! We're glad you enjoyed your experience.",
+                "review_id": 1,
+                "status": "success"
+            }
+        }
+
+
+class ReviewStatusResponse(BaseModel):
+    """Processing status of a submitted review."""
+    
+    review_id: int
+    status: ReviewStatus
+    ai_response: Optional[str] = Field(
+        default=None,
+        description="AI-generated response, available once processing finished"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "review_id": 1,
+                "status": "pending",
+                "ai_response": None
             }
         }
 
@@ -66,7 +125,18 @@ class ReviewDetail(BaseModel):
     ai_summary: Optional[str] = None
     ai_actions: Optional[str] = None
     status: ReviewStatus
+    spam_suspected: bool = False
+    duplicate_of: Optional[int] = Field(default=None, description="Review whose analysis was reused")
     created_at: datetime
+    rank: Optional[float] = Field(default=None, description="Search relevance, set when q is given")
+    review_text_highlight: Optional[str] = Field(
+        default=None,
+        description="HTML-escaped review text fragments with matches in <mark> tags"
+    )
+    ai_summary_highlight: Optional[str] = Field(
+        default=None,
+        description="HTML-escaped AI summary fragments with matches in <mark> tags"
+    )
     
     class Config:
         from_attributes = True
@@ -88,16 +158,35 @@ class AdminReviewsResponse(BaseModel):
     
     reviews: List[ReviewDetail]
     total: int = Field(..., description="Total number of reviews")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page, null on the last page"
+    )
     
     class Config:
         json_schema_extra = {
             "example": {
                 "reviews": [],
-                "total": 0
+                "total": 0,
+                "next_cursor": None
             }
         }
 
 
+class ReprocessJobResponse(BaseModel):
+    """Progress of a reprocessing job."""
+    
+    id: int
+    statuses: List[ReviewStatus]
+    state: str
+    last_review_id: int
+    processed: int
+    succeeded: int
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
 class AdminStats(BaseModel):
     """Statistics for admin dashboard."""
     
@@ -109,6 +198,41 @@ class AdminStats(BaseModel):
     rating_distribution: dict[int, int]
 
 
+class TimeseriesPoint(BaseModel):
+    """Review activity within one time bucket."""
+    
+    bucket_start: datetime
+    count: int
+    average_rating: Optional[float] = None
+    pending_count: int
+    success_count: int
+    failed_count: int
+
+
+class TimeseriesResponse(BaseModel):
+    """Review activity per bucket over a time range, oldest first."""
+    
+    bucket: str = Field(..., description="Bucket size: hour or day (UTC)")
+    points: List[TimeseriesPoint]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "bucket": "day",
+                "points": [
+                    {
+                        "bucket_start": "2024-01-15T00:00:00Z",
+                        "count": 42,
+                        "average_rating": 4.1,
+                        "pending_count": 0,
+                        "success_count": 40,
+                        "failed_count": 2
+                    }
+                ]
+            }
+        }
+
+
 # ============== LLM Schemas ==============
 
 class LLMAnalysis(BaseModel):
@@ -126,6 +250,20 @@ class LLMAnalysis(BaseModel):
         ...,
         description="Recommended next actions"
     )
+    prompt_version: Optional[str] = Field(
+        default=None,
+        description="Prompt version that produced the analysis (None for fallbacks)"
+    )
+
+
+class LLMCacheStats(BaseModel):
+    """Hit/miss counters of the LLM analysis cache."""
+    
+    memory_entries: int
+    memory_hits: int
+    persistent_hits: int
+    misses: int
+    hit_rate: float
 
 
 # ============== Error Schemas ==============
@@ -148,3 +286,5 @@ class HealthResponse(BaseModel):
     
     status: str = "healthy"
     database: str = "connected"
+    llm_circuit: str = "closed"
+    llm_in_flight: int = 0
@@ -0,0 +1,181 @@
+"""
+Admin Cache - Conditional requests and a short-TTL read cache for admin routes.
+Dashboards poll the admin API; unchanged data is answered with 304 and
+concurrent identical reads share one database query.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.services.review_service import review_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Validators also roll over every ETAG_EPOCH_SECONDS: updated_at is set at
+# transaction start, so a change committed after a later one can leave
+# max(updated_at) unchanged. Such changes are picked up within one epoch.
+ETAG_EPOCH_SECONDS = 60
+
+
+class AdminCache:
+    """
+    In-process TTL cache with single-flight loading.
+
+    While a key is being loaded, other callers for the same key wait for
+    that load instead of querying the database themselves. If the load
+    fails, waiters fall back to loading on their own.
+    """
+
+    def __init__(self, ttl_seconds: float = settings.admin_cache_ttl_seconds):
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at monotonic, value)
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._pending: dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, loading it at most once at a time.
+
+        Args:
+            key: Cache key; include everything the loaded value depends on
+            loader: Coroutine function producing the value
+        """
+        if self.ttl_seconds <= 0:
+            return await loader()
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                # shield: a cancelled waiter must not cancel the shared load
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                return await loader()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError("Load cancelled"))
+            # Mark retrieved so an unobserved failure is not logged as a leak
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+        self._prune(now)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        future.set_result(value)
+        return value
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries so one-off keys do not accumulate."""
+        if len(self._entries) > 256:
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+
+    async def respond(
+        self,
+        request: Request,
+        response: Response,
+        db: AsyncSession,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Union[Response, Any]:
+        """
+        Serve an admin read with validators, a 304 or cached data.
+
+        The data version (max updated_at and row count of fynd.reviews) is
+        itself cached, so polling clients cost at most one version query
+        per TTL. Data is cached per version, so a change is visible as
+        soon as the version refreshes.
+
+        Args:
+            request: Incoming request (for If-None-Match / If-Modified-Since)
+            response: Response whose headers receive ETag and Last-Modified
+            db: Database session
+            key: Cache key of the data, without the version
+            loader: Coroutine function producing the data or JSON bytes
+
+        Returns:
+            A 304 Response when the client copy is current, otherwise the
+            data (bytes from the loader are sent as a JSON response as-is)
+        """
+        last_updated, total = await self.get_or_load(
+            ("version",),
+            lambda: review_service.get_version(db)
+        )
+        epoch = int(time.time() // ETAG_EPOCH_SECONDS)
+        stamp = last_updated.isoformat() if last_updated else ""
+        # The key covers parameters the URL leaves open (e.g. "until now")
+        digest = hashlib.sha1(
+            f"{stamp}|{total}|{epoch}|{request.url.path}?{request.url.query}|{key!r}".encode()
+        ).hexdigest()[:20]
+        headers = {"ETag": f'W/"{digest}"', "Cache-Control": "private, no-cache"}
+        if last_updated is not None:
+            headers["Last-Modified"] = format_datetime(_as_utc(last_updated), usegmt=True)
+
+        if _not_modified(request, headers["ETag"], last_updated):
+            return Response(status_code=304, headers=headers)
+
+        value = await self.get_or_load((key, stamp, total), loader)
+        if isinstance(value, bytes):
+            # Pre-serialized JSON: bypass response_model validation
+            return Response(content=value, media_type="application/json", headers=headers)
+        response.headers.update(headers)
+        return value
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Treat naive timestamps as UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _not_modified(request: Request, etag: str, last_updated: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: ignore W/ prefixes
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_updated is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have second precision
+    return _as_utc(last_updated).replace(microsecond=0) <= since
+
+
+# Global instance
+admin_cache = AdminCache()
+
+
+def get_admin_cache() -> AdminCache:
+    """Get admin cache instance."""
+    return admin_cache
@@ -0,0 +1,234 @@
+"""
+Admin Feed - Live review events for /admin/stream.
+One LISTEN connection per process receives Postgres NOTIFY events from
+fynd.reviews and fans them out to every connected admin.
+"""
+
+import asyncio
+import json
+import logging
+from collections import Counter
+from typing import Optional
+
+import orjson
+from sqlalchemy import make_url
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal, REVIEW_NOTIFY_CHANNEL
+from app.models import ReviewStatus
+from app.services.review_service import get_review_service, ReviewService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Notifications arriving within this window are loaded with one query
+BATCH_WINDOW_SECONDS = 0.1
+BATCH_MAX_SIZE = 200
+RECONNECT_DELAY_SECONDS = 2.0
+
+
+def format_sse(event: str, data: bytes) -> bytes:
+    """Format a Server-Sent Events message."""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+class Subscription:
+    """
+    One connected admin: a bounded queue of pre-formatted SSE messages.
+    
+    A consumer that falls behind by more than the queue size loses its
+    backlog and receives a single `resync` event instead, telling it to
+    reload through the REST endpoints. Memory per client stays bounded and
+    a slow client never delays the others.
+    """
+    
+    def __init__(self, max_size: int):
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=max_size)
+        self.dropped = 0
+    
+    def put(self, message: bytes) -> None:
+        """Enqueue without waiting; replace the backlog with a resync on overflow."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize() + 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(format_sse("resync", b'{"reason": "slow_consumer"}'))
+
+
+class AdminFeed:
+    """
+    Fan-out of review change notifications to connected admins.
+    
+    The listener connection is opened when the first admin subscribes and
+    closed when the last one leaves. Notifications are batched briefly so
+    a burst of writes costs one row query per batch, not one per event or
+    per admin. Each batch publishes `review` events with the listing row
+    and one `stats` event with count deltas.
+    """
+    
+    def __init__(
+        self,
+        queue_size: int = settings.admin_stream_queue_size,
+        review_service: Optional[ReviewService] = None
+    ):
+        self.queue_size = queue_size
+        self.review_service = review_service or get_review_service()
+        self._subscribers: set[Subscription] = set()
+        self._notifications: asyncio.Queue[str] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the live feed is configured."""
+        return settings.admin_stream_enabled
+    
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+    
+    def subscribe(self) -> Subscription:
+        """Register an admin and make sure the listener is running."""
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="admin-feed")
+        return subscription
+    
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove an admin; stop listening once nobody is connected."""
+        self._subscribers.discard(subscription)
+        if not self._subscribers:
+            await self.stop()
+    
+    async def stop(self) -> None:
+        """Stop the listener task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    
+    def publish(self, event: str, data: bytes) -> None:
+        """Send an event to every connected admin."""
+        message = format_sse(event, data)
+        for subscription in self._subscribers:
+            subscription.put(message)
+    
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        """asyncpg listener callback; hands the payload to the dispatcher."""
+        self._notifications.put_nowait(payload)
+    
+    async def _run(self) -> None:
+        """Keep a LISTEN connection open and dispatch notifications until cancelled."""
+        import asyncpg
+        
+        url = make_url(settings.admin_stream_database_url or settings.database_url)
+        dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn, statement_cache_size=0)
+                await connection.add_listener(REVIEW_NOTIFY_CHANNEL, self._on_notification)
+                logger.info("Admin feed listening for review notifications")
+                # Events may have been missed while disconnected
+                self.publish("resync", b'{"reason": "listener_connected"}')
+                while not connection.is_closed():
+                    await self._dispatch_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Admin feed listener failed, reconnecting: {e}")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+    
+    async def _dispatch_batch(self) -> None:
+        """Wait for notifications, collect a short batch and publish it."""
+        try:
+            payloads = [await asyncio.wait_for(self._notifications.get(), timeout=5)]
+        except asyncio.TimeoutError:
+            return
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(payloads) < BATCH_MAX_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                payloads.append(await asyncio.wait_for(self._notifications.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        await self.handle_notifications(payloads)
+    
+    async def handle_notifications(self, payloads: list[str]) -> None:
+        """Publish review rows and a stats delta for a batch of NOTIFY payloads."""
+        changes = []
+        for payload in payloads:
+            try:
+                changes.append(json.loads(payload))
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring malformed review notification: {payload[:100]}")
+        
+        if not changes:
+            return
+        
+        review_ids = sorted({change["id"] for change in changes})
+        async with AsyncSessionLocal() as db:
+            rows = await self.review_service.get_reviews_by_ids(db, review_ids)
+        
+        # An insert followed by updates in the same batch is still an insert
+        ops: dict[int, str] = {}
+        for change in changes:
+            ops.setdefault(change["id"], change["op"])
+        for row in rows:
+            self.publish("review", orjson.dumps(
+                {"op": ops[row["id"]], "review": row},
+                option=orjson.OPT_UTC_Z
+            ))
+        
+        self.publish("stats", orjson.dumps(stats_delta(changes), option=orjson.OPT_NON_STR_KEYS))
+
+
+def _status_key(name: str) -> str:
+    """Map a stored enum name (e.g. SUCCESS) to its API value (success)."""
+    return ReviewStatus[name].value
+
+
+def stats_delta(changes: list[dict]) -> dict:
+    """
+    Compute AdminStats count changes from review notifications.
+
+    Returns:
+        Dict with total_reviews, per-status and per-rating deltas
+    """
+    ratings: Counter = Counter()
+    statuses: Counter = Counter()
+    total = 0
+    for change in changes:
+        if change["op"] == "insert":
+            total += 1
+        else:
+            ratings[change["old_rating"]] -= 1
+            statuses[_status_key(change["old_status"])] -= 1
+        ratings[change["rating"]] += 1
+        statuses[_status_key(change["status"])] += 1
+
+    return {
+        "total_reviews": total,
+        "status_counts": {status: delta for status, delta in statuses.items() if delta},
+        "rating_distribution": {rating: delta for rating, delta in ratings.items() if delta},
+    }
+
+
+# Global instance
+admin_feed = AdminFeed()
+
+
+def get_admin_feed() -> AdminFeed:
+    """Get admin feed instance."""
+    return admin_feed
@@ -0,0 +1,413 @@
+"""
+Duplicate Index - Near-duplicate and spam-burst detection for submissions.
+Reviews are summarized by a MinHash signature of their words and word
+pairs, which estimates how much of the text two reviews share (Jaccard
+similarity). The in-memory index finds candidates through LSH bands of the
+signature and keeps each review's analysis, so reusing one needs no query.
+"""
+
+import asyncio
+import json
+import logging
+import operator
+import re
+import time
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from typing import NamedTuple, Optional
+
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.metrics import ANALYSIS_TIER, SPAM_SUSPECTED
+from app.models import Review, ReviewStatus
+from app.schemas import LLMAnalysis
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# One-permutation MinHash: each feature hash lands in one of SIGNATURE_SIZE
+# slots, and each slot keeps its smallest value
+SIGNATURE_SIZE = 32
+# LSH: reviews sharing all ROWS slots of any of the BANDS bands are
+# candidates, then verified on the whole signature
+BANDS = 8
+ROWS = SIGNATURE_SIZE // BANDS
+# Minimum share of equal signature slots. Tuned with
+# `python -m benchmarks.duplicate_index` on the TASK1 Yelp reviews: copies
+# with one or two words edited score ~0.95, a rewritten 5-word phrase ~0.9,
+# different reviews at most ~0.25
+MIN_SIMILARITY = 0.6
+
+_HASH_MASK = (1 << 64) - 1
+# Slots store 16 bits of their minimum: two different minimums agree by
+# chance once in 65536, which barely moves the estimate
+_SLOT_MASK = (1 << 16) - 1
+# Offset per slot when an empty slot borrows its neighbour's value
+_DENSIFY_STEP = 0x9E3779B1
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def signature(text: str, min_words: int) -> Optional[array]:
+    """
+    MinHash signature of the text's words and word pairs.
+
+    Case, punctuation and whitespace are ignored; word pairs keep reviews
+    with the same words in a different order apart. Returns None for texts
+    shorter than `min_words`, where a few shared words would already look
+    like a duplicate.
+
+    Features are hashed with Python's string hash, so signatures are only
+    comparable within one process; they are never stored.
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < min_words:
+        return None
+    features = set(words)
+    features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+
+    slots: list[Optional[int]] = [None] * SIGNATURE_SIZE
+    for feature in features:
+        value = hash(feature) & _HASH_MASK
+        slot = value % SIGNATURE_SIZE
+        # The minimum is decided by the high bits; the stored low 16 bits
+        # are independent of being the minimum
+        value //= SIGNATURE_SIZE
+        current = slots[slot]
+        if current is None or value < current:
+            slots[slot] = value
+
+    # Densify: an empty slot takes the next filled slot's value, offset by
+    # the distance, the same way for every text
+    result = array("H", bytes(2 * SIGNATURE_SIZE))
+    for i in range(SIGNATURE_SIZE):
+        j, distance = i, 0
+        while slots[j] is None:
+            j = (j + 1) % SIGNATURE_SIZE
+            distance += 1
+        result[i] = (slots[j] + distance * _DENSIFY_STEP) & _SLOT_MASK
+    return result
+
+
+def similarity(a: array, b: array) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(map(operator.eq, a, b)) / SIGNATURE_SIZE
+
+
+def _band_keys(sig: array) -> list[int]:
+    return [hash(tuple(sig[band * ROWS:(band + 1) * ROWS])) & _HASH_MASK for band in range(BANDS)]
+
+
+def _pack_analysis(analysis: LLMAnalysis) -> bytes:
+    return zlib.compress(json.dumps([
+        analysis.user_response,
+        analysis.internal_summary,
+        analysis.recommended_actions,
+        analysis.prompt_version,
+    ]).encode())
+
+
+def _unpack_analysis(packed: bytes) -> LLMAnalysis:
+    user_response, internal_summary, recommended_actions, prompt_version = json.loads(zlib.decompress(packed))
+    return LLMAnalysis(
+        user_response=user_response,
+        internal_summary=internal_summary,
+        recommended_actions=recommended_actions,
+        prompt_version=prompt_version
+    )
+
+
+# Entries are review id << RATING_BITS | rating
+RATING_BITS = 3
+RATING_MASK = (1 << RATING_BITS) - 1
+# Bucket items are band key bits << POSITION_BITS | entry position
+POSITION_BITS = 32
+POSITION_MASK = (1 << POSITION_BITS) - 1
+
+
+class _Generation:
+    """Flat per-entry arrays plus one bucket table per band."""
+
+    __slots__ = ("entries", "signatures", "analyses", "bands")
+
+    def __init__(self, bucket_count: int):
+        self.entries = array("Q")
+        self.signatures = array("H")
+        self.analyses: list[bytes] = []
+        self.bands: list[list[Optional[array]]] = [[None] * bucket_count for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class MinHashIndex:
+    """
+    LSH index of review signatures and their analyses.
+
+    Signatures and bucket items live in flat arrays and analyses are
+    stored compressed, so each review costs one Python object: its
+    compressed analysis. Reviews are added to a current generation; once
+    it holds half of `max_entries`, the previous generation is dropped and
+    the current one takes its place, so eviction never scans the index.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # About 8 entries per bucket once a generation is full
+        bucket_bits = min(max((max_entries // 16).bit_length(), 8), 16)
+        self._bucket_mask = (1 << bucket_bits) - 1
+        self._current = _Generation(1 << bucket_bits)
+        self._previous = _Generation(1 << bucket_bits)
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def add(self, review_id: int, sig: array, rating: int, analysis: LLMAnalysis) -> None:
+        """Index a review with its analysis."""
+        if len(self._current) >= max(self.max_entries // 2, 1):
+            self._previous, self._current = self._current, _Generation(self._bucket_mask + 1)
+
+        generation = self._current
+        position = len(generation)
+        generation.entries.append(review_id << RATING_BITS | rating)
+        generation.signatures.extend(sig)
+        generation.analyses.append(_pack_analysis(analysis))
+        for buckets, key in zip(generation.bands, _band_keys(sig)):
+            index = key & self._bucket_mask
+            bucket = buckets[index]
+            if bucket is None:
+                bucket = buckets[index] = array("Q")
+            bucket.append((key >> POSITION_BITS) << POSITION_BITS | position)
+
+    def find(self, sig: array, rating: int) -> Optional[tuple[int, LLMAnalysis]]:
+        """
+        Most similar indexed review with the same rating.
+
+        Returns:
+            (review id, analysis) of a review at least MIN_SIMILARITY
+            similar (the newest on ties), or None
+        """
+        keys = _band_keys(sig)
+        best: Optional[tuple[float, int, _Generation, int]] = None
+        for generation in (self._current, self._previous):
+            seen = set()
+            for buckets, key in zip(generation.bands, keys):
+                bucket = buckets[key & self._bucket_mask]
+                if bucket is None:
+                    continue
+                key_bits = key >> POSITION_BITS
+                for item in bucket:
+                    position = item & POSITION_MASK
+                    if item >> POSITION_BITS != key_bits or position in seen:
+                        continue
+                    seen.add(position)
+                    entry = generation.entries[position]
+                    if entry & RATING_MASK != rating:
+                        continue
+                    start = position * SIGNATURE_SIZE
+                    score = similarity(sig, generation.signatures[start:start + SIGNATURE_SIZE])
+                    review_id = entry >> RATING_BITS
+                    if score >= MIN_SIMILARITY and (best is None or (score, review_id) > best[:2]):
+                        best = (score, review_id, generation, position)
+        if best is None:
+            return None
+        _, review_id, generation, position = best
+        return review_id, _unpack_analysis(generation.analyses[position])
+
+
+class BurstTracker:
+    """
+    Recent signatures per client IP, to spot copy-paste bursts.
+
+    A submission is suspected spam when, together with it, `threshold`
+    near-duplicate submissions came from the same IP within
+    `window_seconds`. The least recently seen IPs are forgotten past
+    `max_ips`.
+    """
+
+    def __init__(self, threshold: int, window_seconds: float, max_ips: int = 100_000):
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.max_ips = max_ips
+        self._recent: OrderedDict[str, deque[tuple[float, array]]] = OrderedDict()
+
+    def record(self, ip_address: str, sig: array) -> bool:
+        """Record a submission and return whether it completes a burst."""
+        now = time.monotonic()
+        history = self._recent.get(ip_address)
+        if history is None:
+            history = self._recent[ip_address] = deque(maxlen=max(self.threshold * 4, 16))
+        else:
+            self._recent.move_to_end(ip_address)
+        while history and now - history[0][0] > self.window_seconds:
+            history.popleft()
+
+        near = sum(1 for _, other in history if similarity(sig, other) >= MIN_SIMILARITY)
+        history.append((now, sig))
+        if len(self._recent) > self.max_ips:
+            self._recent.popitem(last=False)
+        return near + 1 >= self.threshold
+
+
+class DuplicateCheck(NamedTuple):
+    """Outcome of checking a submission against the index."""
+    signature: Optional[array] = None
+    duplicate_of: Optional[int] = None
+    analysis: Optional[LLMAnalysis] = None
+    spam_suspected: bool = False
+
+
+class DuplicateDetector:
+    """
+    Near-duplicate reuse and spam-burst flagging on the submission path.
+
+    The index holds successfully analyzed reviews of this process: it is
+    rebuilt from the most recent rows in the background at startup and
+    updated as reviews are analyzed. A submission matching an indexed
+    review with the same rating reuses that review's analysis.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = settings.duplicate_detection_enabled,
+        max_reviews: int = settings.duplicate_index_max_reviews,
+        min_words: int = settings.duplicate_min_words,
+        spam_threshold: int = settings.duplicate_spam_threshold,
+        spam_window_seconds: float = settings.duplicate_spam_window_seconds
+    ):
+        self.enabled = enabled
+        self.min_words = min_words
+        self.index = MinHashIndex(max_reviews)
+        self.bursts = BurstTracker(spam_threshold, spam_window_seconds)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Rebuild the index in the background."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self.rebuild(), name="duplicate-index-rebuild")
+
+    async def stop(self) -> None:
+        """Cancel a rebuild still in progress."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def rebuild(self, fetch_size: int = 500, chunk_size: int = 25) -> int:
+        """
+        Index the most recent successfully analyzed reviews.
+
+        Rows are signed in chunks of a few milliseconds of CPU, yielding
+        to the event loop in between, so requests are served while the
+        index fills.
+
+        Returns:
+            Number of reviews indexed
+        """
+        started = time.perf_counter()
+        indexed = 0
+        # Reviews that reused another one's analysis add nothing to the index
+        reusable = (Review.status == ReviewStatus.SUCCESS, Review.duplicate_of.is_(None))
+        async with AsyncSessionLocal() as db:
+            cutoff = await db.scalar(
+                select(Review.id)
+                .where(*reusable)
+                .order_by(Review.id.desc())
+                .offset(self.index.max_entries - 1)
+                .limit(1)
+            )
+            result = await db.stream(
+                select(
+                    Review.id, Review.rating, Review.review_text,
+                    Review.ai_response, Review.ai_summary, Review.ai_actions, Review.prompt_version
+                )
+                .where(*reusable, Review.id >= (cutoff or 0))
+                .order_by(Review.id)
+                .execution_options(yield_per=fetch_size)
+            )
+            async for rows in result.partitions(fetch_size):
+                for start in range(0, len(rows), chunk_size):
+                    for row in rows[start:start + chunk_size]:
+                        sig = signature(row.review_text, self.min_words)
+                        if sig is not None:
+                            self.index.add(row.id, sig, row.rating, LLMAnalysis(
+                                user_response=row.ai_response,
+                                internal_summary=row.ai_summary,
+                                recommended_actions=row.ai_actions,
+                                prompt_version=row.prompt_version
+                            ))
+                            indexed += 1
+                    await asyncio.sleep(0)
+
+        logger.info(
+            f"Duplicate index rebuilt: {indexed} reviews in {time.perf_counter() - started:.1f}s"
+        )
+        return indexed
+
+    def check(
+        self,
+        rating: int,
+        review_text: str,
+        ip_address: Optional[str]
+    ) -> DuplicateCheck:
+        """
+        Check a submission before it is analyzed.
+
+        Args:
+            rating: Star rating 1-5
+            review_text: Review text content
+            ip_address: Client IP, for spam-burst tracking
+
+        Returns:
+            The signature (for `add`), the matching review and its
+            analysis if one can be reused, and the spam flag
+        """
+        if not self.enabled:
+            return DuplicateCheck()
+        sig = signature(review_text, self.min_words)
+        if sig is None:
+            return DuplicateCheck()
+
+        spam_suspected = ip_address is not None and self.bursts.record(ip_address, sig)
+        if spam_suspected:
+            SPAM_SUSPECTED.inc()
+            logger.warning(f"Suspected spam burst from ip={ip_address}")
+
+        match = self.index.find(sig, rating)
+        if match is None:
+            return DuplicateCheck(sig, spam_suspected=spam_suspected)
+
+        ANALYSIS_TIER.labels(tier="duplicate").inc()
+        duplicate_of, analysis = match
+        return DuplicateCheck(sig, duplicate_of, analysis, spam_suspected)
+
+    def add(
+        self,
+        review_id: int,
+        rating: int,
+        review_text: str,
+        analysis: LLMAnalysis,
+        sig: Optional[array] = None
+    ) -> None:
+        """Index a successfully analyzed review (signed unless `sig` is given)."""
+        if not self.enabled:
+            return
+        if sig is None:
+            sig = signature(review_text, self.min_words)
+        if sig is not None:
+            self.index.add(review_id, sig, rating, analysis)
+
+
+# Global instance, constructed on first use
+duplicate_detector: Optional[DuplicateDetector] = None
+
+
+def get_duplicate_detector() -> DuplicateDetector:
+    """Get duplicate detector instance."""
+    global duplicate_detector
+    if duplicate_detector is None:
+        duplicate_detector = DuplicateDetector()
+    return duplicate_detector
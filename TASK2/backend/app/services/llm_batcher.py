@@ -0,0 +1,154 @@
+"""
+LLM Batcher - Micro-batching of concurrent review analyses.
+Collects reviews arriving within a short window into one LLM request.
+"""
+
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from app.config import get_settings
+from app.deadline import Deadline
+from app.schemas import LLMAnalysis
+
+if TYPE_CHECKING:
+    from app.services.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class _BatchItem:
+    """A review waiting to be analyzed as part of a batch."""
+    id: str
+    rating: int
+    review_text: str
+    future: asyncio.Future = field(repr=False)
+    deadline: Optional[Deadline] = None
+
+
+class LLMBatcher:
+    """
+    Groups concurrent analyze calls into batched LLM requests.
+
+    A batch is sent when it reaches max_size or max_wait_ms after its first
+    item arrived. The batch request times out at the tightest deadline of
+    its items, and is cancelled once every item's caller has stopped
+    waiting. Items missing from the batched output, or all items when the
+    batch call fails, are retried with individual calls.
+    """
+
+    def __init__(
+        self,
+        llm_service: "LLMService",
+        max_size: int = settings.llm_batch_max_size,
+        max_wait_ms: int = settings.llm_batch_max_wait_ms
+    ):
+        self.llm_service = llm_service
+        self.max_size = max_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._pending: list[_BatchItem] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._ids = itertools.count(1)
+
+    async def analyze(
+        self,
+        rating: int,
+        review_text: str,
+        deadline: Optional[Deadline] = None
+    ) -> LLMAnalysis:
+        """Queue a review for the next batch and wait for its analysis."""
+        loop = asyncio.get_running_loop()
+        item = _BatchItem(
+            id=str(next(self._ids)),
+            rating=rating,
+            review_text=review_text,
+            future=loop.create_future(),
+            deadline=deadline
+        )
+        self._pending.append(item)
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await item.future
+
+    def _flush(self) -> None:
+        """Send the pending items as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        items, self._pending = self._pending, []
+        if not items:
+            return
+
+        task = asyncio.create_task(self._run_batch(items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, items: list[_BatchItem]) -> None:
+        """Call the LLM for a batch and fan results out to the waiters."""
+        items = [item for item in items if not item.future.done()]
+        if not items:
+            return
+
+        if len(items) == 1:
+            await self._run_single(items[0])
+            return
+
+        # The request must answer within the tightest deadline of the batch
+        remaining = [item.deadline.remaining() for item in items if item.deadline is not None]
+        call = asyncio.create_task(self.llm_service._call_llm_batch(
+            [(item.id, item.rating, item.review_text) for item in items],
+            deadline=Deadline(min(remaining)) if remaining else None
+        ))
+
+        def cancel_if_abandoned(_: asyncio.Future) -> None:
+            if all(item.future.done() for item in items):
+                call.cancel()
+
+        for item in items:
+            item.future.add_done_callback(cancel_if_abandoned)
+
+        try:
+            results = await call
+        except asyncio.CancelledError:
+            if not all(item.future.done() for item in items):
+                raise
+            logger.debug(f"Batched LLM call for {len(items)} reviews cancelled, no caller is waiting")
+            return
+        except Exception as e:
+            logger.warning(f"Batched LLM call failed for {len(items)} reviews, retrying individually: {e}")
+            results = {}
+
+        retries = []
+        for item in items:
+            if item.future.done():
+                continue
+            if item.id in results:
+                item.future.set_result(results[item.id])
+            else:
+                retries.append(self._run_single(item))
+
+        if retries:
+            await asyncio.gather(*retries)
+
+    async def _run_single(self, item: _BatchItem) -> None:
+        """Analyze one item with an individual LLM call."""
+        try:
+            analysis = await self.llm_service._call_llm(item.rating, item.review_text, item.deadline)
+        except Exception as e:
+            if not item.future.done():
+                item.future.set_exception(e)
+            return
+
+        if not item.future.done():
+            item.future.set_result(analysis)
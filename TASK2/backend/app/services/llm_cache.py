@@ -0,0 +1,226 @@
+"""
+LLM Cache - Content-addressed cache for LLM analyses.
+In-process LRU tier with TTL backed by a persistent Postgres table.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models import LLMCacheEntry
+from app.schemas import LLMAnalysis, LLMCacheStats
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Expired persistent entries deleted per statement
+PRUNE_BATCH_SIZE = 1000
+
+
+class LLMCache:
+    """
+    Two-tier cache of LLM analyses keyed by a content hash.
+
+    The memory tier answers repeated content without any I/O; the
+    persistent tier shares results across processes and restarts.
+    Failures in the persistent tier are logged and treated as misses.
+    Expired persistent entries are deleted in the background, at most
+    once per `prune_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.llm_cache_max_entries,
+        ttl_seconds: int = settings.llm_cache_ttl_seconds,
+        persistent: bool = settings.llm_cache_persistent,
+        persistent_ttl_seconds: int = settings.llm_cache_persistent_ttl_seconds,
+        prune_interval_seconds: int = settings.llm_cache_prune_interval_seconds
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self.persistent_ttl_seconds = persistent_ttl_seconds
+        self.prune_interval_seconds = prune_interval_seconds
+        self._next_prune = 0.0
+        self._prune_task: Optional[asyncio.Task] = None
+
+        # key -> (expires_at monotonic, analysis)
+        self._entries: OrderedDict[str, tuple[float, LLMAnalysis]] = OrderedDict()
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_text(review_text: str) -> str:
+        """Normalize review text so trivially different copies share a key."""
+        return _WHITESPACE.sub(" ", review_text).strip().lower()
+
+    @classmethod
+    def make_key(
+        cls,
+        model: str,
+        prompt_version: str,
+        rating: int,
+        review_text: str
+    ) -> str:
+        """Build the cache key for a (model, prompt version, rating, text) tuple."""
+        payload = "\x1f".join([model, prompt_version, str(rating), cls.normalize_text(review_text)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[LLMAnalysis]:
+        """Look up an analysis, checking memory first, then the persistent tier."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, analysis = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return analysis
+            del self._entries[key]
+
+        if self.persistent:
+            analysis = await self._get_persistent(key)
+            if analysis is not None:
+                self._put_memory(key, analysis)
+                self.persistent_hits += 1
+                return analysis
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, analysis: LLMAnalysis) -> None:
+        """Store an analysis in both tiers."""
+        self._put_memory(key, analysis)
+        if self.persistent:
+            await self._set_persistent(key, analysis)
+            self._schedule_prune()
+
+    def stats(self) -> LLMCacheStats:
+        """Get hit/miss counters."""
+        lookups = self.memory_hits + self.persistent_hits + self.misses
+        hits = self.memory_hits + self.persistent_hits
+        return LLMCacheStats(
+            memory_entries=len(self._entries),
+            memory_hits=self.memory_hits,
+            persistent_hits=self.persistent_hits,
+            misses=self.misses,
+            hit_rate=round(hits / lookups, 4) if lookups else 0.0
+        )
+
+    def _put_memory(self, key: str, analysis: LLMAnalysis) -> None:
+        """Insert into the LRU tier, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, analysis)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_persistent(self, key: str) -> Optional[LLMAnalysis]:
+        """Read a non-expired entry from the cache table."""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.persistent_ttl_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(LLMCacheEntry).where(
+                        LLMCacheEntry.key == key,
+                        LLMCacheEntry.created_at >= cutoff
+                    )
+                )
+                entry = result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+        if entry is None:
+            return None
+
+        return LLMAnalysis(
+            user_response=entry.user_response,
+            internal_summary=entry.internal_summary,
+            recommended_actions=entry.recommended_actions
+        )
+
+    async def _set_persistent(self, key: str, analysis: LLMAnalysis) -> None:
+        """Upsert an entry into the cache table."""
+        values = {
+            "key": key,
+            "user_response": analysis.user_response,
+            "internal_summary": analysis.internal_summary,
+            "recommended_actions": analysis.recommended_actions,
+            "created_at": datetime.now(timezone.utc),
+        }
+        statement = insert(LLMCacheEntry).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.key],
+            set_={k: statement.excluded[k] for k in values if k != "key"}
+        )
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(statement)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _schedule_prune(self) -> None:
+        """Start a background prune if the interval has passed and none is running."""
+        now = time.monotonic()
+        if self.prune_interval_seconds <= 0 or now < self._next_prune:
+            return
+        if self._prune_task is not None and not self._prune_task.done():
+            return
+        self._next_prune = now + self.prune_interval_seconds
+        self._prune_task = asyncio.create_task(self.prune_persistent(), name="llm-cache-prune")
+
+    async def prune_persistent(self, batch_size: int = PRUNE_BATCH_SIZE) -> int:
+        """
+        Delete expired entries from the cache table.
+
+        Deletes in batches of `batch_size` rows, one short transaction each,
+        so a large backlog never holds locks for long.
+
+        Returns:
+            Number of deleted entries
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.persistent_ttl_seconds)
+        expired = (
+            select(LLMCacheEntry.key)
+            .where(LLMCacheEntry.created_at < cutoff)
+            .limit(batch_size)
+        )
+        deleted = 0
+        try:
+            while True:
+                async with AsyncSessionLocal() as db:
+                    result = await db.execute(
+                        delete(LLMCacheEntry).where(LLMCacheEntry.key.in_(expired.scalar_subquery()))
+                    )
+                    await db.commit()
+                deleted += result.rowcount
+                if result.rowcount < batch_size:
+                    break
+        except Exception as e:
+            logger.warning(f"LLM cache prune failed: {e}")
+
+        if deleted:
+            logger.info(f"Pruned {deleted} expired LLM cache entries")
+        return deleted
+
+
+# Global instance
+llm_cache = LLMCache()
+
+
+def get_llm_cache() -> LLMCache:
+    """Get LLM cache instance."""
+    return llm_cache
@@ -0,0 +1,185 @@
+"""
+LLM call limits - pacing and failure isolation for OpenAI calls.
+Token-bucket rate limiting, a failure-rate circuit breaker and the
+latency window and budget used for hedged requests.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of the circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    Capacity equals one minute of budget, so bursts up to the tier limit
+    are allowed and sustained usage is paced to the rate.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until `amount` tokens are available, then take them."""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker driven by the failure rate of recent calls.
+
+    Trips open when at least `min_calls` of the last `window` calls were
+    recorded and the failure share reaches `failure_rate`. While open,
+    calls are rejected; after `open_seconds` a single half-open probe is
+    let through and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float,
+        min_calls: int,
+        window: int,
+        open_seconds: float
+    ):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the cool-down passed."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a call may proceed; reserves the probe slot when half-open."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info("LLM circuit closed after successful probe")
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed or timed-out call."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._trip()
+            return
+
+        self._outcomes.append(False)
+        failures = self._outcomes.count(False)
+        if (
+            self._state == CircuitState.CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and failures / len(self._outcomes) >= self.failure_rate
+        ):
+            self._trip()
+
+    def release(self) -> None:
+        """Give up an allowed call without an outcome (e.g. a cancelled hedge)."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def _trip(self) -> None:
+        logger.warning(f"LLM circuit opened for {self.open_seconds}s")
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._outcomes.clear()
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls."""
+
+    def __init__(self, size: int, min_samples: int):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a successful call."""
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """The q-quantile (0-1) of the window, or None until `min_samples` were seen."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class HedgeBudget:
+    """
+    Caps hedged requests to a share of primary calls.
+
+    Every primary call earns `ratio` of a hedge, up to `burst` saved
+    hedges, and each hedge spends one. With ratio 0.1 at most ~10% extra
+    calls are made, however slow the provider gets.
+    """
+
+    def __init__(self, ratio: float, burst: float):
+        self.ratio = ratio
+        self.burst = burst
+        self.credit = burst
+
+    def earn(self) -> None:
+        """Credit a primary call."""
+        self.credit = min(self.burst, self.credit + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one hedge from the budget if available."""
+        if self.credit < 1.0:
+            return False
+        self.credit -= 1.0
+        return True
@@ -4,18 +4,49 @@ Handles OpenAI API calls with structured JSON output.
 """
 
 import json
+import time
 import asyncio
 import logging
-from typing import Optional
-
-from openai import AsyncOpenAI, APITimeoutError, APIError
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
 from app.config import get_settings
+from app.deadline import Deadline
+from app.metrics import ANALYSIS_TIER, LLM_CALL_DURATION, LLM_FALLBACKS, LLM_HEDGES, record_usage
 from app.schemas import LLMAnalysis
+from app.services.llm_batcher import LLMBatcher
+from app.services.llm_cache import get_llm_cache, LLMCache
+from app.services.local_analyzer import get_local_analyzer, LocalAnalyzer
+from app.services.llm_limits import (
+    CircuitBreaker, CircuitOpenError, CircuitState, HedgeBudget, LatencyWindow, TokenBucket
+)
+from app.services.partial_json import JSONFieldStreamer
+from app.services.prompt_compiler import get_prompt_compiler, PromptCompiler
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Recent single-review call latencies considered, and samples needed
+# before they are used for hedging and call budgets
+LATENCY_WINDOW = 200
+LATENCY_MIN_SAMPLES = 20
+# Hedges that can be saved up for a burst of slow calls
+HEDGE_BURST = 10
+
+
+def _openai():
+    """
+    The OpenAI SDK, imported on first use.
+    
+    Importing it takes longer than the rest of the application combined,
+    so it is kept off the startup path.
+    """
+    import openai
+    return openai
+
 
 class LLMService:
     """
@@ -23,56 +54,77 @@ class LLMService:
     All LLM calls are server-side only.
     """
     
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+    def __init__(
+        self,
+        cache: Optional[LLMCache] = None,
+        prompts: Optional[PromptCompiler] = None,
+        local_analyzer: Optional[LocalAnalyzer] = None
+    ):
+        self._client: Optional["AsyncOpenAI"] = None
         self.model = settings.llm_model
         self.timeout = settings.llm_timeout_seconds
+        self.timeout_percentile = settings.llm_timeout_percentile
+        self.timeout_multiplier = settings.llm_timeout_multiplier
+        self.db_reserve = settings.request_db_reserve_ms / 1000
+        self.prompts = prompts or get_prompt_compiler()
+        self.cache = cache or (get_llm_cache() if settings.llm_cache_enabled else None)
+        # Fast path tried before the cache and the LLM; any object with
+        # analyze(rating, review_text) -> Optional[LLMAnalysis] works
+        self.local_analyzer = local_analyzer or (
+            get_local_analyzer() if settings.local_analyzer_enabled else None
+        )
+        self.batcher = LLMBatcher(self) if settings.llm_batching_enabled else None
         
-        # Check if API key is present
-        if settings.openai_api_key:
-            print(f"✅ OpenAI API key is present (starts with: {settings.openai_api_key[:10]}...)")
-        else:
-            print("❌ OpenAI API key is NOT present!")
+        # Call limits: in-flight cap, per-minute pacing, circuit breaker
+        self.semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+        self.in_flight = 0
+        self.request_bucket = (
+            TokenBucket(settings.llm_requests_per_minute)
+            if settings.llm_requests_per_minute > 0 else None
+        )
+        self.token_bucket = (
+            TokenBucket(settings.llm_tokens_per_minute)
+            if settings.llm_tokens_per_minute > 0 else None
+        )
+        self.breaker = CircuitBreaker(
+            failure_rate=settings.llm_breaker_failure_rate,
+            min_calls=settings.llm_breaker_min_calls,
+            window=settings.llm_breaker_window,
+            open_seconds=settings.llm_breaker_open_seconds
+        )
+        
+        # Latencies of single-review calls: drive hedging and call budgets
+        self.latencies = LatencyWindow(LATENCY_WINDOW, LATENCY_MIN_SAMPLES)
+        
+        # Hedged requests (single-review, non-streamed calls only)
+        self.hedge_model = settings.llm_hedge_model or self.model
+        self.hedge_percentile = settings.llm_hedge_percentile
+        self.hedge_min_delay = settings.llm_hedge_min_delay_ms / 1000
+        self.hedge_budget = (
+            HedgeBudget(settings.llm_hedge_max_ratio, HEDGE_BURST)
+            if settings.llm_hedge_enabled else None
+        )
+        # Calls cancelled because the other hedged call answered first
+        self._hedge_losers: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+        
+        if not settings.openai_api_key:
+            logger.warning("OpenAI API key is not configured")
     
-    def _build_system_prompt(self) -> str:
-        """Build the system prompt for review analysis."""
-        return """You are an AI assistant that analyzes customer feedback and generates appropriate responses.
-
-Your task is to analyze a customer review and provide:
-1. A user-facing response that acknowledges their feedback appropriately
-2. An internal summary for the admin team
-3. Recommended actions for the business
-
-Guidelines:
-- For positive reviews (4-5 stars): Express gratitude and reinforce positive aspects
-- For neutral reviews (3 stars): Acknowledge the mixed experience, thank them, and express commitment to improvement
-- For negative reviews (1-2 stars): Show empathy, apologize for shortcomings, and express desire to improve
-- Be professional, warm, and concise
-- Never make promises you can't keep
-- For vague or empty reviews, provide a generic but warm response
-
-IMPORTANT: Respond ONLY with valid JSON in this exact format:
-{
-    "user_response": "Your response to show the customer",
-    "internal_summary": "Brief summary for admin team",
-    "recommended_actions": "Suggested follow-up actions"
-}"""
-    
-    def _build_user_prompt(self, rating: int, review_text: str) -> str:
-        """Build the user prompt with review details."""
-        text = review_text if review_text.strip() else "[No text provided - rating only]"
-        
-        # Truncate very long reviews for LLM
-        max_chars = 4000
-        if len(text) > max_chars:
-            text = text[:max_chars] + "... [truncated]"
-        
-        return f"""Analyze this customer review:
-
-Rating: {rating} out of 5 stars
-Review: {text}
-
-Provide your analysis as JSON."""
+    @property
+    def client(self) -> "AsyncOpenAI":
+        """OpenAI client, created (and the SDK imported) on first use."""
+        if self._client is None:
+            self._client = _openai().AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url,
+                timeout=self.timeout,
+                max_retries=settings.llm_max_retries
+            )
+        return self._client
+    
+    def fallback_analysis(self, rating: int, review_text: str) -> LLMAnalysis:
+        """Fallback analysis for a review whose LLM analysis was abandoned."""
+        return self._get_fallback_response(rating, review_text)
     
     def _get_fallback_response(self, rating: int, review_text: str) -> LLMAnalysis:
         """Generate fallback response when LLM fails."""
@@ -116,7 +168,8 @@ Provide your analysis as JSON."""
     async def analyze_review(
         self,
         rating: int,
-        review_text: str
+        review_text: str,
+        deadline: Optional[Deadline] = None
     ) -> tuple[LLMAnalysis, bool]:
         """
         Analyze a review using the LLM.
@@ -124,6 +177,8 @@ Provide your analysis as JSON."""
         Args:
             rating: Star rating 1-5
             review_text: Review text content
+            deadline: Request deadline bounding the LLM call; without one
+                the fixed LLM timeout applies
             
         Returns:
             Tuple of (LLMAnalysis, success_flag)
@@ -131,63 +186,476 @@ Provide your analysis as JSON."""
         
         # Handle empty reviews without LLM call
         if not review_text or len(review_text.strip()) < 3:
+            ANALYSIS_TIER.labels(tier="empty").inc()
             return self._get_empty_review_response(rating), True
         
+        local = self._analyze_locally(rating, review_text)
+        if local is not None:
+            return local, True
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self.model, self.prompts.version, rating, review_text)
+            cached = await self._get_cached(cache_key)
+            if cached is not None:
+                ANALYSIS_TIER.labels(tier="cache").inc()
+                return cached, True
+        
+        ANALYSIS_TIER.labels(tier="llm").inc()
+        # Skip the wait entirely while the provider is known to be failing
+        if self.breaker.state == CircuitState.OPEN:
+            LLM_FALLBACKS.labels(cause="circuit_open").inc()
+            return self._get_fallback_response(rating, review_text), False
+        
+        budget = self._call_budget(deadline)
+        if budget is None:
+            LLM_FALLBACKS.labels(cause="deadline").inc()
+            return self._get_fallback_response(rating, review_text), False
+        
         try:
-            response = await asyncio.wait_for(
-                self._call_llm(rating, review_text),
-                timeout=self.timeout
+            call_deadline = Deadline(budget)
+            call = (
+                self.batcher.analyze(rating, review_text, call_deadline)
+                if self.batcher is not None
+                else self._call_llm(rating, review_text, call_deadline)
             )
-            return response, True
+            response = await asyncio.wait_for(call, timeout=budget)
             
         except asyncio.TimeoutError:
-            logger.warning(f"LLM timeout for review (rating={rating})")
+            logger.warning(f"LLM timeout after {budget:.2f}s for review (rating={rating})")
+            # The call took at least its budget; without this sample a
+            # slower provider would be cut off at the old tail forever
+            self.latencies.observe(budget)
+            LLM_FALLBACKS.labels(cause="timeout").inc()
+            return self._get_fallback_response(rating, review_text), False
+            
+        except CircuitOpenError:
+            logger.warning(f"LLM circuit open, using fallback (rating={rating})")
+            LLM_FALLBACKS.labels(cause="circuit_open").inc()
             return self._get_fallback_response(rating, review_text), False
             
-        except APITimeoutError:
+        except _openai().APITimeoutError:
             logger.warning(f"OpenAI API timeout for review (rating={rating})")
+            LLM_FALLBACKS.labels(cause="api_timeout").inc()
             return self._get_fallback_response(rating, review_text), False
             
-        except APIError as e:
+        except _openai().APIError as e:
             logger.error(f"OpenAI API error: {e}")
+            LLM_FALLBACKS.labels(cause="api_error").inc()
             return self._get_fallback_response(rating, review_text), False
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM JSON response: {e}")
+            LLM_FALLBACKS.labels(cause="json_decode").inc()
             return self._get_fallback_response(rating, review_text), False
             
         except Exception as e:
             logger.error(f"Unexpected error in LLM analysis: {e}")
+            LLM_FALLBACKS.labels(cause="unexpected").inc()
             return self._get_fallback_response(rating, review_text), False
+        
+        # Outside the try: a cache failure must not turn a real analysis
+        # into the fallback
+        if cache_key is not None:
+            await self._store_cached(cache_key, response)
+        return response, True
+    
+    async def analyze_review_stream(
+        self,
+        rating: int,
+        review_text: str,
+        deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Analyze a review, streaming the user-facing response as it is generated.
+        
+        Yields ("delta", str) events with new user_response text, followed by
+        exactly one ("done", (LLMAnalysis, success_flag)) event. Deltas are
+        best-effort; the final analysis is authoritative (e.g. after a fallback).
+        
+        Args:
+            rating: Star rating 1-5
+            review_text: Review text content
+            deadline: Request deadline bounding the whole stream
+        """
+        if not review_text or len(review_text.strip()) < 3:
+            ANALYSIS_TIER.labels(tier="empty").inc()
+            analysis = self._get_empty_review_response(rating)
+            yield "delta", analysis.user_response
+            yield "done", (analysis, True)
+            return
+        
+        local = self._analyze_locally(rating, review_text)
+        if local is not None:
+            yield "delta", local.user_response
+            yield "done", (local, True)
+            return
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self.model, self.prompts.version, rating, review_text)
+            cached = await self._get_cached(cache_key)
+            if cached is not None:
+                ANALYSIS_TIER.labels(tier="cache").inc()
+                yield "delta", cached.user_response
+                yield "done", (cached, True)
+                return
+        
+        ANALYSIS_TIER.labels(tier="llm").inc()
+        if self.breaker.state == CircuitState.OPEN:
+            LLM_FALLBACKS.labels(cause="circuit_open").inc()
+            yield "done", (self._get_fallback_response(rating, review_text), False)
+            return
+        
+        budget = self._call_budget(deadline)
+        if budget is None:
+            LLM_FALLBACKS.labels(cause="deadline").inc()
+            yield "done", (self._get_fallback_response(rating, review_text), False)
+            return
+        
+        call_deadline = Deadline(budget)
+        streamer = JSONFieldStreamer("user_response")
+        content = []
+        
+        try:
+            stream = await asyncio.wait_for(
+                self._create_completion(
+                    messages=self.prompts.review_messages(rating, review_text),
+                    max_tokens=500,
+                    stream=True,
+                    deadline=call_deadline
+                ),
+                timeout=budget
+            )
+            chunks = stream.__aiter__()
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(),
+                            timeout=call_deadline.remaining()
+                        )
+                    except StopAsyncIteration:
+                        break
+                    if chunk.usage is not None:
+                        record_usage(chunk.usage, self.prompts.version)
+                    if not chunk.choices:
+                        continue
+                    text = chunk.choices[0].delta.content or ""
+                    content.append(text)
+                    delta = streamer.feed(text)
+                    if delta:
+                        yield "delta", delta
+            except (asyncio.TimeoutError, _openai().APIError):
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Closed early (e.g. the client disconnected): no outcome,
+                # but a half-open probe slot must be freed
+                self.breaker.release()
+                raise
+            else:
+                self.breaker.record_success()
+            finally:
+                await stream.close()
+            
+            analysis = self._parse_analysis(json.loads("".join(content)))
+            
+        except asyncio.TimeoutError:
+            logger.warning(f"LLM stream timeout for review (rating={rating})")
+            LLM_FALLBACKS.labels(cause="timeout").inc()
+            yield "done", (self._get_fallback_response(rating, review_text), False)
+            return
+            
+        except CircuitOpenError:
+            logger.warning(f"LLM circuit open, using fallback (rating={rating})")
+            LLM_FALLBACKS.labels(cause="circuit_open").inc()
+            yield "done", (self._get_fallback_response(rating, review_text), False)
+            return
+            
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse streamed LLM JSON response: {e}")
+            LLM_FALLBACKS.labels(cause="json_decode").inc()
+            yield "done", (self._get_fallback_response(rating, review_text), False)
+            return
+            
+        except _openai().APIError as e:
+            logger.error(f"OpenAI API error in streamed analysis: {e}")
+            LLM_FALLBACKS.labels(cause="api_error").inc()
+            yield "done", (self._get_fallback_response(rating, review_text), False)
+            return
+            
+        except Exception as e:
+            logger.error(f"Error in streamed LLM analysis: {e}")
+            LLM_FALLBACKS.labels(cause="unexpected").inc()
+            yield "done", (self._get_fallback_response(rating, review_text), False)
+            return
+        
+        if cache_key is not None:
+            await self._store_cached(cache_key, analysis)
+        yield "done", (analysis, True)
+    
+    def _call_budget(self, deadline: Optional[Deadline]) -> Optional[float]:
+        """
+        Seconds an LLM call may take, or None if it is not worth starting.
+        
+        Without a deadline (background processing) this is the fixed
+        timeout. Under a request deadline, time to store the review is
+        reserved and the call is also cut off at a multiple of the observed
+        tail latency. A call that would have less time than the median
+        latency is not started; the fallback is served right away.
+        """
+        if deadline is None:
+            return self.timeout
+        
+        budget = min(self.timeout, deadline.remaining() - self.db_reserve)
+        tail = self.latencies.percentile(self.timeout_percentile)
+        if tail is not None:
+            budget = min(budget, tail * self.timeout_multiplier)
+        median = self.latencies.percentile(0.5)
+        if budget <= 0 or (median is not None and budget < median):
+            return None
+        return budget
+    
+    def _analyze_locally(self, rating: int, review_text: str) -> Optional[LLMAnalysis]:
+        """Answer from the local analyzer, or None to continue to the cache and LLM."""
+        if self.local_analyzer is None:
+            return None
+        try:
+            analysis = self.local_analyzer.analyze(rating, review_text)
+        except Exception as e:
+            # e.g. a missing model file: stop trying instead of failing every review
+            logger.error(f"Local analyzer failed, disabling it: {e}")
+            self.local_analyzer = None
+            return None
+        if analysis is not None:
+            ANALYSIS_TIER.labels(tier="local").inc()
+        return analysis
+    
+    async def _get_cached(self, cache_key: str) -> Optional[LLMAnalysis]:
+        """Cached analysis for the key, tagged with the prompt version it was made with."""
+        cached = await self.cache.get(cache_key)
+        if cached is None or cached.prompt_version is not None:
+            return cached
+        # Persisted entries do not store the version; the key includes it
+        return cached.model_copy(update={"prompt_version": self.prompts.version})
+    
+    async def _store_cached(self, cache_key: str, analysis: LLMAnalysis) -> None:
+        """Cache an analysis; failures are logged, never raised to the caller."""
+        try:
+            await self.cache.set(cache_key, analysis)
+        except Exception as e:
+            logger.warning(f"LLM cache store failed: {e}")
+    
+    async def _create_completion(
+        self,
+        messages: list[dict],
+        max_tokens: int,
+        stream: bool = False,
+        model: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ):
+        """
+        Call the chat completions API within the configured limits.
+        
+        Waits for an in-flight slot and per-minute budget, then checks the
+        circuit breaker and records the call outcome on it. A streamed call
+        is only recorded here if it fails to open; the caller records its
+        outcome once the stream was read, so each call counts once. A call
+        cancelled because its hedge
+        answered first is not an outcome. With a deadline, the HTTP request
+        is given the time left once a slot was obtained.
+        
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the call
+        """
+        # Rough pre-call estimate: ~4 characters per prompt token
+        estimated_tokens = sum(len(m["content"]) for m in messages) // 4 + max_tokens
+        
+        options = {}
+        if stream:
+            # Streams only report token usage in a final chunk on request
+            options["stream_options"] = {"include_usage": True}
+        
+        async with self.semaphore:
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire()
+            if self.token_bucket is not None:
+                await self.token_bucket.acquire(estimated_tokens)
+            
+            if not self.breaker.allow_request():
+                raise CircuitOpenError("LLM circuit is open")
+            
+            self.in_flight += 1
+            start = time.perf_counter()
+            try:
+                response = await self.client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"},
+                    stream=stream,
+                    # Per-attempt timeout; the caller's wait_for also bounds SDK retries
+                    **({"timeout": deadline.remaining()} if deadline is not None else {}),
+                    **options
+                )
+            except BaseException:
+                if asyncio.current_task() in self._hedge_losers:
+                    outcome = "cancelled"
+                    self.breaker.release()
+                else:
+                    # API errors, client timeouts and wait_for cancellations
+                    outcome = "error"
+                    self.breaker.record_failure()
+                LLM_CALL_DURATION.labels(outcome=outcome, prompt_version=self.prompts.version).observe(time.perf_counter() - start)
+                raise
+            finally:
+                self.in_flight -= 1
+        
+        LLM_CALL_DURATION.labels(outcome="success", prompt_version=self.prompts.version).observe(time.perf_counter() - start)
+        if not stream:
+            self.breaker.record_success()
+            record_usage(response.usage, self.prompts.version)
+        return response
+    
+    async def _hedged_completion(
+        self,
+        messages: list[dict],
+        max_tokens: int,
+        deadline: Optional[Deadline] = None
+    ):
+        """
+        Create a completion, hedging a call that runs unusually long.
+        
+        Once the primary call has been running for the configured latency
+        percentile of recent calls (at least the minimum delay), a second
+        call goes to the hedge model if the hedge budget allows. The first
+        successful response is returned and the other call is cancelled;
+        if both fail, the primary's error is raised.
+        """
+        start = time.perf_counter()
+        if self.hedge_budget is None:
+            response = await self._create_completion(messages, max_tokens, deadline=deadline)
+            self.latencies.observe(time.perf_counter() - start)
+            return response
+        
+        self.hedge_budget.earn()
+        tasks = [asyncio.create_task(self._create_completion(messages, max_tokens, deadline=deadline))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay())
+            if not done:
+                if self.hedge_budget.try_spend():
+                    tasks.append(asyncio.create_task(
+                        self._create_completion(messages, max_tokens, model=self.hedge_model, deadline=deadline)
+                    ))
+                else:
+                    LLM_HEDGES.labels(result="over_budget").inc()
+            
+            winner = await self._first_success(tasks)
+            if winner.exception() is None:
+                if len(tasks) > 1:
+                    LLM_HEDGES.labels(result="primary_won" if winner is tasks[0] else "hedge_won").inc()
+                # When the hedge won, the primary took at least this long;
+                # recording the lower bound keeps its slow tail in the window
+                self.latencies.observe(time.perf_counter() - start)
+            return winner.result()
+        finally:
+            # Cancelled from outside (e.g. the analysis timeout)
+            for task in tasks:
+                task.cancel()
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """Seconds before hedging, or None until enough latencies were observed."""
+        threshold = self.latencies.percentile(self.hedge_percentile)
+        if threshold is None:
+            return None
+        return max(threshold, self.hedge_min_delay)
     
-    async def _call_llm(self, rating: int, review_text: str) -> LLMAnalysis:
+    async def _first_success(self, tasks: list[asyncio.Task]) -> asyncio.Task:
+        """
+        Wait for the first task to succeed and cancel the rest.
+        
+        Returns:
+            The successful task, or the first task if all of them failed
+        """
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for loser in pending:
+                        self._hedge_losers.add(loser)
+                        loser.cancel()
+                    return task
+        return tasks[0]
+    
+    async def _call_llm(
+        self,
+        rating: int,
+        review_text: str,
+        deadline: Optional[Deadline] = None
+    ) -> LLMAnalysis:
         """Make the actual LLM API call."""
         
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": self._build_system_prompt()},
-                {"role": "user", "content": self._build_user_prompt(rating, review_text)}
-            ],
-            temperature=0.7,
+        response = await self._hedged_completion(
+            messages=self.prompts.review_messages(rating, review_text),
             max_tokens=500,
-            response_format={"type": "json_object"}
+            deadline=deadline
         )
         
         content = response.choices[0].message.content
         data = json.loads(content)
         
+        return self._parse_analysis(data)
+    
+    async def _call_llm_batch(
+        self,
+        items: list[tuple[str, int, str]],
+        deadline: Optional[Deadline] = None
+    ) -> dict[str, LLMAnalysis]:
+        """
+        Analyze several reviews with a single LLM API call.
+        
+        Args:
+            items: List of (id, rating, review_text)
+            deadline: Bounds the request; without one the fixed LLM timeout applies
+            
+        Returns:
+            Mapping of item id to analysis; ids missing from the output are omitted
+        """
+        response = await self._create_completion(
+            messages=self.prompts.batch_messages(items),
+            max_tokens=500 * len(items),
+            deadline=deadline
+        )
+        
+        content = response.choices[0].message.content
+        data = json.loads(content)
+        
+        return {
+            str(result["id"]): self._parse_analysis(result)
+            for result in data.get("results", [])
+            if isinstance(result, dict) and "id" in result
+        }
+    
+    def _parse_analysis(self, data: dict) -> LLMAnalysis:
+        """Build an LLMAnalysis from parsed JSON, defaulting missing fields."""
         return LLMAnalysis(
             user_response=data.get("user_response", "Thank you for your feedback!"),
             internal_summary=data.get("internal_summary", "Review processed"),
-            recommended_actions=data.get("recommended_actions", "Review for follow-up")
+            recommended_actions=data.get("recommended_actions", "Review for follow-up"),
+            prompt_version=self.prompts.version
         )
 
 
-# Global instance
-llm_service = LLMService()
+# Global instance, constructed on first use
+llm_service: Optional[LLMService] = None
 
 
 def get_llm_service() -> LLMService:
     """Get LLM service instance."""
+    global llm_service
+    if llm_service is None:
+        llm_service = LLMService()
     return llm_service
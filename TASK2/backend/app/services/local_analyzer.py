@@ -0,0 +1,199 @@
+"""
+Local Analyzer - Fast-path review analysis without an LLM call.
+A hashed-feature logistic regression (trained offline with
+`python -m app.train_local_analyzer`) scores the sentiment of short
+reviews. When it confidently agrees with the star rating, the review is
+answered from templates; anything else is escalated to the LLM.
+"""
+
+import json
+import logging
+import math
+import re
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from app.config import get_settings
+from app.schemas import LLMAnalysis
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parent.parent / "data" / "local_analyzer.json"
+
+_TOKEN = re.compile(r"[a-z]+(?:'[a-z]+)?|[!?]")
+NEGATIONS = {
+    "not", "no", "never", "nothing", "hardly", "without",
+    "isn't", "wasn't", "aren't", "weren't", "don't", "doesn't", "didn't",
+    "won't", "wouldn't", "can't", "couldn't", "shouldn't",
+}
+# Tokens after a negation that are marked as negated
+NEGATION_SCOPE = 2
+
+# Aspect keywords used to make templated responses specific
+ASPECTS = {
+    "food": {"food", "meal", "dish", "dishes", "taste", "tasty", "flavor", "pizza", "burger", "pasta", "soup", "dessert", "delicious", "bland", "cold", "undercooked"},
+    "service": {"service", "staff", "waiter", "waitress", "server", "servers", "rude", "friendly", "attentive", "helpful"},
+    "wait times": {"wait", "waited", "waiting", "slow", "late", "forever", "quick", "fast"},
+    "prices": {"price", "prices", "expensive", "overpriced", "cheap", "value", "pricey"},
+    "cleanliness": {"clean", "dirty", "filthy", "messy", "sticky"},
+    "atmosphere": {"atmosphere", "ambiance", "ambience", "noisy", "loud", "cozy", "music", "decor"},
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens; words following a negation get a `not_` prefix."""
+    tokens, negated = [], 0
+    for token in _TOKEN.findall(text.lower()):
+        if token in NEGATIONS:
+            tokens.append(token)
+            negated = NEGATION_SCOPE
+            continue
+        tokens.append(f"not_{token}" if negated and token not in ("!", "?") else token)
+        negated = max(negated - 1, 0)
+    return tokens
+
+
+def featurize(text: str, buckets: int) -> dict[int, float]:
+    """
+    Hashed, L2-normalized binary unigram and bigram features.
+
+    Uses crc32 so bucket indexes are stable across processes and match
+    the offline training run.
+    """
+    tokens = tokenize(text)
+    grams = set(tokens)
+    grams.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    if not grams:
+        return {}
+
+    features: dict[int, float] = {}
+    for gram in grams:
+        index = zlib.crc32(gram.encode()) % buckets
+        features[index] = features.get(index, 0.0) + 1.0
+    norm = math.sqrt(sum(value * value for value in features.values()))
+    return {index: value / norm for index, value in features.items()}
+
+
+class LocalAnalyzer:
+    """
+    Sentiment model plus response templates for short reviews.
+
+    `analyze` returns None to escalate: for 3-star ratings, reviews longer
+    than `max_words`, and whenever the model is not at least `threshold`
+    confident that the text is as positive (4-5 stars) or as negative
+    (1-2 stars) as the rating.
+    """
+
+    def __init__(
+        self,
+        model_path: Optional[str] = settings.local_analyzer_model_path,
+        threshold: float = settings.local_analyzer_threshold,
+        max_words: int = settings.local_analyzer_max_words
+    ):
+        self.model_path = Path(model_path) if model_path else DEFAULT_MODEL_PATH
+        self.threshold = threshold
+        self.max_words = max_words
+        self._model: Optional[dict] = None
+
+    @property
+    def model(self) -> dict:
+        """Model weights, loaded on first use."""
+        if self._model is None:
+            with open(self.model_path) as f:
+                raw = json.load(f)
+            self._model = {
+                "version": raw["version"],
+                "buckets": raw["buckets"],
+                "bias": raw["bias"],
+                "weights": {int(index): weight for index, weight in raw["weights"].items()},
+            }
+            logger.info(f"Loaded local analyzer model {raw['version']} ({len(raw['weights'])} weights)")
+        return self._model
+
+    @property
+    def version(self) -> str:
+        """Recorded as the prompt version of locally answered reviews."""
+        return f"local+{self.model['version']}"
+
+    def positive_probability(self, text: str) -> float:
+        """Probability that the text expresses a positive experience."""
+        model = self.model
+        weights = model["weights"]
+        score = model["bias"] + sum(
+            weights.get(index, 0.0) * value
+            for index, value in featurize(text, model["buckets"]).items()
+        )
+        return 1.0 / (1.0 + math.exp(-max(min(score, 30.0), -30.0)))
+
+    def analyze(self, rating: int, review_text: str) -> Optional[LLMAnalysis]:
+        """
+        Answer a review locally, or return None to escalate to the LLM.
+
+        Args:
+            rating: Star rating 1-5
+            review_text: Review text content
+        """
+        if rating == 3 or len(review_text.split()) > self.max_words:
+            return None
+
+        positive = self.positive_probability(review_text)
+        confidence = positive if rating >= 4 else 1.0 - positive
+        if confidence < self.threshold:
+            return None
+
+        return self._respond(rating, self._aspects(review_text))
+
+    def _aspects(self, review_text: str) -> list[str]:
+        """Aspects mentioned in the review, in ASPECTS order."""
+        words = set(_TOKEN.findall(review_text.lower()))
+        return [aspect for aspect, keywords in ASPECTS.items() if words & keywords]
+
+    def _respond(self, rating: int, aspects: list[str]) -> LLMAnalysis:
+        """Templated analysis for a confidently positive or negative review."""
+        mentioned = " and ".join(aspects[:2])
+
+        if rating >= 4:
+            user_response = (
+                f"Thank you for the kind words about our {mentioned}! We're delighted you enjoyed your visit and hope to see you again soon."
+                if aspects else
+                "Thank you so much for your wonderful feedback! We're delighted you enjoyed your visit and hope to see you again soon."
+            )
+            summary = f"Positive short review ({rating} stars)."
+            actions = (
+                f"No action needed - share the praise for {mentioned} with the team."
+                if aspects else
+                "No action needed - share the positive feedback with the team."
+            )
+        else:
+            user_response = (
+                f"We're sorry about the {mentioned} during your visit. Thank you for letting us know - we'll look into it and work to do better."
+                if aspects else
+                "We're sorry your experience didn't meet expectations. Thank you for letting us know - we'll look into it and work to do better."
+            )
+            summary = f"Negative short review ({rating} stars)."
+            actions = (
+                f"Investigate the {mentioned} issue and follow up with the customer."
+                if aspects else
+                "Follow up with the customer to learn what went wrong."
+            )
+
+        if aspects:
+            summary += f" Mentions: {', '.join(aspects)}."
+
+        return LLMAnalysis(
+            user_response=user_response,
+            internal_summary=summary,
+            recommended_actions=actions,
+            prompt_version=self.version
+        )
+
+
+# Global instance
+local_analyzer = LocalAnalyzer()
+
+
+def get_local_analyzer() -> LocalAnalyzer:
+    """Get local analyzer instance."""
+    return local_analyzer
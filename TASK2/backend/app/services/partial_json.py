@@ -0,0 +1,90 @@
+"""
+Incremental extraction of a string field from partially received JSON.
+Used to stream the user-facing response while the completion is generated.
+"""
+
+import json
+import re
+from typing import Optional
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class JSONFieldStreamer:
+    """
+    Emits the decoded value of one top-level string field as JSON arrives.
+
+    Feed raw completion chunks with `feed`; each call returns the newly
+    decoded characters of the field (possibly empty). Escape sequences
+    split across chunks are held back until complete.
+    """
+
+    def __init__(self, field: str):
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._pos: Optional[int] = None  # index of next undecoded char in the value
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk of raw JSON and return newly decoded field text."""
+        self._buffer += chunk
+        if self.done:
+            return ""
+
+        if self._pos is None:
+            match = self._start.search(self._buffer)
+            if match is None:
+                return ""
+            self._pos = match.end()
+
+        out = []
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self.done = True
+                pos += 1
+                break
+            if char != "\\":
+                out.append(char)
+                pos += 1
+                continue
+
+            # Escape sequence: wait for the rest if it is incomplete
+            if pos + 1 >= len(buffer):
+                break
+            code = buffer[pos + 1]
+            if code == "u":
+                if pos + 6 > len(buffer):
+                    break
+                decoded, pos = self._decode_unicode(buffer, pos)
+                if decoded is None:
+                    break
+                out.append(decoded)
+                continue
+            out.append(_ESCAPES.get(code, code))
+            pos += 2
+
+        self._pos = pos
+        return "".join(out)
+
+    @staticmethod
+    def _decode_unicode(buffer: str, pos: int) -> tuple[Optional[str], int]:
+        """Decode a \\uXXXX escape, joining surrogate pairs when complete."""
+        high = int(buffer[pos + 2:pos + 6], 16)
+        if 0xD800 <= high <= 0xDBFF:
+            if pos + 12 > len(buffer):
+                return None, pos
+            if buffer[pos + 6:pos + 8] == "\\u":
+                return json.loads('"%s"' % buffer[pos:pos + 12]), pos + 12
+        return chr(high), pos + 6
@@ -0,0 +1,255 @@
+"""
+Prompt Compiler - Versioned prompt templates with a token budget for reviews.
+Templates are compiled once at import and identified by a version plus a
+content hash; review text over budget is trimmed at sentence boundaries,
+keeping its beginning and its end.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from functools import lru_cache
+from typing import Callable
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Bump when the wording changes; the hash below also catches edits made
+# without a bump, so cached analyses are never reused across prompts
+PROMPT_TEMPLATE_VERSION = "v2"
+
+# Shared by the single-review and batched prompts
+SYSTEM_GUIDELINES = """You are an AI assistant that analyzes customer feedback and generates appropriate responses.
+
+Your task is to analyze a customer review and provide:
+1. A user-facing response that acknowledges their feedback appropriately
+2. An internal summary for the admin team
+3. Recommended actions for the business
+
+Guidelines:
+- For positive reviews (4-5 stars): Express gratitude and reinforce positive aspects
+- For neutral reviews (3 stars): Acknowledge the mixed experience, thank them, and express commitment to improvement
+- For negative reviews (1-2 stars): Show empathy, apologize for shortcomings, and express desire to improve
+- Be professional, warm, and concise
+- Never make promises you can't keep
+- For vague or empty reviews, provide a generic but warm response
+- Text marked [...] was shortened; do not comment on the omission"""
+
+SYSTEM_PROMPT = SYSTEM_GUIDELINES + """
+
+IMPORTANT: Respond ONLY with valid JSON in this exact format:
+{
+    "user_response": "Your response to show the customer",
+    "internal_summary": "Brief summary for admin team",
+    "recommended_actions": "Suggested follow-up actions"
+}"""
+
+BATCH_SYSTEM_PROMPT = SYSTEM_GUIDELINES + """
+
+You will receive a JSON array of reviews, each with an "id", "rating" and "review".
+Analyze each review independently.
+
+IMPORTANT: Respond ONLY with valid JSON in this exact format, with one entry per input id:
+{
+    "results": [
+        {
+            "id": "The review id",
+            "user_response": "Your response to show the customer",
+            "internal_summary": "Brief summary for admin team",
+            "recommended_actions": "Suggested follow-up actions"
+        }
+    ]
+}"""
+
+USER_PROMPT = """Analyze this customer review:
+
+Rating: {rating} out of 5 stars
+Review: {review}
+
+Provide your analysis as JSON."""
+
+BATCH_USER_PROMPT = """Analyze these customer reviews:
+
+{reviews}
+
+Provide your analysis as JSON."""
+
+EMPTY_REVIEW_TEXT = "[No text provided - rating only]"
+TRIM_MARKER = " [...] "
+
+# Share of the budget kept from the start of a trimmed review; the rest
+# goes to its end, where reviews often state the verdict
+HEAD_SHARE = 0.6
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\s*\n+\s*")
+
+
+def _prompt_version(budget: int) -> str:
+    """Template version plus a hash of every template and the trim budget."""
+    content = "\x1f".join([
+        SYSTEM_PROMPT, BATCH_SYSTEM_PROMPT, USER_PROMPT, BATCH_USER_PROMPT,
+        EMPTY_REVIEW_TEXT, TRIM_MARKER, str(HEAD_SHARE), str(budget),
+    ])
+    return f"{PROMPT_TEMPLATE_VERSION}+{hashlib.sha256(content.encode()).hexdigest()[:8]}"
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) when tiktoken is unavailable."""
+    return (len(text) + 3) // 4
+
+
+@lru_cache(maxsize=8)
+def get_tokenizer(model: str) -> Callable[[str], int]:
+    """
+    Token counter for a model, built once per model.
+
+    Uses tiktoken when it is installed and its encoding can be loaded;
+    otherwise falls back to a character-based estimate. Loading may read
+    or download the encoding file, so the lifespan preloads it through
+    `preload_tokenizer` instead of the first request.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken is not installed, estimating tokens (~4 characters each)")
+        return _estimate_tokens
+
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use; offline hosts estimate instead
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens: {e}")
+        return _estimate_tokens
+
+    logger.info(f"Loaded tiktoken encoding {encoding.name} for {model}")
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+async def preload_tokenizer(model: str = settings.llm_model) -> None:
+    """Load the model's tokenizer in a worker thread, off the event loop."""
+    await asyncio.to_thread(get_tokenizer, model)
+
+
+class PromptCompiler:
+    """
+    Builds chat messages from the compiled templates.
+
+    Review text is the only variable-length part of a prompt. It is fitted
+    to `review_token_budget` tokens: whole sentences are kept from the
+    start and the end, with a [...] marker where text was removed.
+    """
+
+    def __init__(
+        self,
+        model: str = settings.llm_model,
+        review_token_budget: int = settings.llm_review_token_budget
+    ):
+        self.model = model
+        self.review_token_budget = review_token_budget
+        # Recorded on each analyzed review and part of the analysis cache key
+        self.version = _prompt_version(review_token_budget)
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the model's tokenizer (loaded on first use)."""
+        return get_tokenizer(self.model)(text)
+
+    def review_messages(self, rating: int, review_text: str) -> list[dict]:
+        """Messages for analyzing a single review."""
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": USER_PROMPT.format(
+                rating=rating,
+                review=self.fit_review(review_text)
+            )}
+        ]
+
+    def batch_messages(self, items: list[tuple[str, int, str]]) -> list[dict]:
+        """Messages for analyzing a batch of (id, rating, review_text) items."""
+        reviews = [
+            {"id": item_id, "rating": rating, "review": self.fit_review(review_text)}
+            for item_id, rating, review_text in items
+        ]
+        return [
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": BATCH_USER_PROMPT.format(
+                reviews=json.dumps(reviews, ensure_ascii=False)
+            )}
+        ]
+
+    def fit_review(self, review_text: str) -> str:
+        """Return the review text, trimmed to the token budget if needed."""
+        text = review_text.strip()
+        if not text:
+            return EMPTY_REVIEW_TEXT
+        if self.count_tokens(text) <= self.review_token_budget:
+            return text
+        return self._trim(text)
+
+    def _trim(self, text: str) -> str:
+        """Keep whole sentences from the start and the end within the budget."""
+        sentences = [s for s in _SENTENCE_BREAK.split(text) if s]
+        available = max(self.review_token_budget - self.count_tokens(TRIM_MARKER), 1)
+        head_budget = int(available * HEAD_SHARE)
+
+        head, used = [], 0
+        for sentence in sentences:
+            tokens = self.count_tokens(sentence) + 1
+            if used + tokens > head_budget:
+                break
+            head.append(sentence)
+            used += tokens
+        if not head:
+            # No sentence boundary early enough: fall back to whole words
+            return self._trim_words(text, head_budget, available)
+
+        # Budget the head did not use goes to the tail
+        tail, tail_budget = [], available - used
+        for sentence in reversed(sentences[len(head):]):
+            tokens = self.count_tokens(sentence) + 1
+            if tokens > tail_budget:
+                break
+            tail.append(sentence)
+            tail_budget -= tokens
+        tail.reverse()
+
+        return " ".join(head) + TRIM_MARKER + " ".join(tail)
+
+    def _trim_words(self, text: str, head_budget: int, available: int) -> str:
+        """Keep whole words from the start and the end within the budget."""
+        words = text.split()
+        head_count = self._fitting_words(words, head_budget)
+        head = " ".join(words[:head_count])
+        rest = words[head_count:]
+        tail_count = self._fitting_words(rest[::-1], available - self.count_tokens(head))
+        tail = " ".join(rest[len(rest) - tail_count:]) if tail_count else ""
+        if not head:
+            # A single word longer than the budget (e.g. a pasted URL)
+            head = text[:head_budget]
+        return head + TRIM_MARKER + tail
+
+    def _fitting_words(self, words: list[str], budget: int) -> int:
+        """Largest n such that the first n words fit the budget (binary search)."""
+        low, high = 0, len(words)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count_tokens(" ".join(words[:middle])) <= budget:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+
+# Global instance
+prompt_compiler = PromptCompiler()
+
+
+def get_prompt_compiler() -> PromptCompiler:
+    """Get prompt compiler instance."""
+    return prompt_compiler
@@ -0,0 +1,266 @@
+"""
+Reprocess Service - Re-run LLM analysis over failed or pending reviews.
+Drains outage backlogs in throttled, checkpointed batches.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models import Review, ReviewStatus, ReprocessJob
+from app.schemas import LLMAnalysis, ReprocessJobResponse
+from app.services.llm_limits import CircuitState
+from app.services.llm_service import get_llm_service, LLMService
+from app.services.review_service import get_review_service, ReviewService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class ReprocessService:
+    """
+    Checkpointed reprocessing of reviews without a real analysis.
+
+    Reviews are walked in id order, one batch at a time. Each batch is
+    analyzed with bounded concurrency (LLM pacing and the circuit breaker
+    still apply), successful results are written with one bulk UPDATE, and
+    the job checkpoint is committed in the same transaction. The checkpoint
+    only moves past reviews that all succeeded: reviews that failed (e.g. a
+    timeout or an unparseable response) are skipped for the rest of the
+    walk, then retried once, and any still failing stay ahead of the
+    checkpoint for the next resume. If the LLM circuit opens, the job
+    pauses at its last checkpoint and can be resumed.
+    """
+
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        review_service: Optional[ReviewService] = None
+    ):
+        self.llm_service = llm_service or get_llm_service()
+        self.review_service = review_service or get_review_service()
+        self._tasks: dict[int, asyncio.Task] = {}
+
+    async def create_job(self, db: AsyncSession, statuses: list[ReviewStatus]) -> ReprocessJob:
+        """Create a new job record targeting the given statuses."""
+        job = ReprocessJob(
+            statuses=",".join(status.value for status in statuses),
+            state="running"
+        )
+        db.add(job)
+        await db.flush()
+        return job
+
+    async def get_job(self, db: AsyncSession, job_id: int) -> Optional[ReprocessJob]:
+        """Get a job by id."""
+        return await db.get(ReprocessJob, job_id)
+
+    def to_response(self, job: ReprocessJob) -> ReprocessJobResponse:
+        """Convert a job record to its API schema."""
+        return ReprocessJobResponse(
+            id=job.id,
+            statuses=job.statuses.split(","),
+            state=job.state,
+            last_review_id=job.last_review_id,
+            processed=job.processed,
+            succeeded=job.succeeded,
+            error_message=job.error_message,
+            created_at=job.created_at,
+            updated_at=job.updated_at
+        )
+
+    def start_job(
+        self,
+        job_id: int,
+        batch_size: int,
+        concurrency: int,
+        max_reviews: Optional[int] = None
+    ) -> None:
+        """Run a job in the background of the current process."""
+        task = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            return
+        self._tasks[job_id] = asyncio.create_task(
+            self.run_job(job_id, batch_size, concurrency, max_reviews),
+            name=f"reprocess-job-{job_id}"
+        )
+
+    async def stop(self) -> None:
+        """Cancel background jobs; they resume from their checkpoint later."""
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+
+    async def run_job(
+        self,
+        job_id: int,
+        batch_size: int,
+        concurrency: int,
+        max_reviews: Optional[int] = None
+    ) -> None:
+        """
+        Run (or resume) a job until its backlog is drained.
+
+        Args:
+            job_id: Job to run
+            batch_size: Reviews selected and updated per batch
+            concurrency: Max concurrent LLM calls within a batch
+            max_reviews: Pause after this many reviews in this run
+        """
+        async with AsyncSessionLocal() as db:
+            job = await self.get_job(db, job_id)
+            if job is None:
+                raise ValueError(f"Reprocess job {job_id} not found")
+            job.state = "running"
+            job.error_message = None
+            await db.commit()
+            statuses = [ReviewStatus(value) for value in job.statuses.split(",")]
+            checkpoint = job.last_review_id
+
+        logger.info(f"Reprocess job {job_id} started at checkpoint {checkpoint}")
+        semaphore = asyncio.Semaphore(concurrency)
+        handled = 0
+        # Reviews that failed in this run, skipped until the retry pass
+        failed: set[int] = set()
+        retried = False
+
+        try:
+            while max_reviews is None or handled < max_reviews:
+                limit = batch_size if max_reviews is None else min(batch_size, max_reviews - handled)
+                rows = await self._next_batch(statuses, checkpoint, limit, failed)
+                if not rows:
+                    if failed and not retried:
+                        logger.info(f"Reprocess job {job_id} retrying {len(failed)} failed reviews")
+                        retried = True
+                        failed.clear()
+                        continue
+                    error_message = None
+                    if failed:
+                        error_message = f"{len(failed)} reviews still failed after a retry - resume to try them again"
+                    await self._finish(job_id, "completed", error_message)
+                    logger.info(f"Reprocess job {job_id} completed")
+                    return
+
+                outcomes = await asyncio.gather(*[
+                    self._analyze(semaphore, rating, review_text)
+                    for _, rating, review_text in rows
+                ])
+                results = []
+                for (review_id, _, _), (analysis, success) in zip(rows, outcomes):
+                    if success:
+                        results.append((review_id, analysis))
+                    else:
+                        failed.add(review_id)
+
+                # An open circuit means the provider is down again: keep the
+                # successes but do not move the checkpoint past this batch.
+                # Otherwise move it up to the first review that failed
+                paused = self.llm_service.breaker.state == CircuitState.OPEN
+                if not paused:
+                    checkpoint = min(failed) - 1 if failed else rows[-1][0]
+                handled += len(rows)
+
+                async with AsyncSessionLocal() as db:
+                    updated = await self.review_service.bulk_update_analyses(
+                        db=db,
+                        results=results
+                    )
+                    job = await self.get_job(db, job_id)
+                    job.last_review_id = checkpoint
+                    job.processed += len(rows)
+                    job.succeeded += updated
+                    await db.commit()
+
+                if paused:
+                    await self._finish(job_id, "paused", "LLM circuit open - resume once the provider recovers")
+                    logger.warning(f"Reprocess job {job_id} paused at checkpoint {checkpoint}")
+                    return
+
+            await self._finish(job_id, "paused", "Reached max_reviews for this run")
+
+        except asyncio.CancelledError:
+            await self._finish(job_id, "paused", "Interrupted")
+            raise
+        except Exception as e:
+            logger.error(f"Reprocess job {job_id} failed: {e}")
+            await self._finish(job_id, "failed", str(e))
+
+    async def _next_batch(
+        self,
+        statuses: list[ReviewStatus],
+        after_id: int,
+        limit: int,
+        skip_ids: set[int]
+    ) -> list[tuple[int, int, str]]:
+        """
+        Select the next (id, rating, review_text) rows after the checkpoint, except `skip_ids`.
+
+        Pending rows are claimed like the worker claims them (SKIP LOCKED
+        and a lease), so the worker does not analyze them at the same time.
+        """
+        now = datetime.now(timezone.utc)
+        conditions = []
+        other_statuses = [status for status in statuses if status != ReviewStatus.PENDING]
+        if other_statuses:
+            conditions.append(Review.status.in_(other_statuses))
+        if ReviewStatus.PENDING in statuses:
+            # Leave recent and currently claimed pending reviews to the worker
+            cutoff = now - timedelta(seconds=settings.review_worker_lease_seconds)
+            conditions.append(and_(
+                Review.status == ReviewStatus.PENDING,
+                Review.created_at < cutoff,
+                or_(Review.claimed_at.is_(None), Review.claimed_at < cutoff)
+            ))
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Review.id, Review.rating, Review.review_text, Review.status)
+                .where(Review.id > after_id, Review.id.notin_(skip_ids), or_(*conditions))
+                .order_by(Review.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.all()
+            pending_ids = [row.id for row in rows if row.status == ReviewStatus.PENDING]
+            if pending_ids:
+                await db.execute(
+                    update(Review).where(Review.id.in_(pending_ids)).values(claimed_at=now)
+                )
+            await db.commit()
+            return [(row.id, row.rating, row.review_text) for row in rows]
+
+    async def _analyze(
+        self,
+        semaphore: asyncio.Semaphore,
+        rating: int,
+        review_text: str
+    ) -> tuple[LLMAnalysis, bool]:
+        async with semaphore:
+            return await self.llm_service.analyze_review(rating=rating, review_text=review_text)
+
+    async def _finish(self, job_id: int, state: str, error_message: Optional[str] = None) -> None:
+        """Record the final state of a job run."""
+        async with AsyncSessionLocal() as db:
+            job = await self.get_job(db, job_id)
+            job.state = state
+            job.error_message = error_message
+            await db.commit()
+
+
+# Global instance, constructed on first use
+reprocess_service: Optional[ReprocessService] = None
+
+
+def get_reprocess_service() -> ReprocessService:
+    """Get reprocess service instance."""
+    global reprocess_service
+    if reprocess_service is None:
+        reprocess_service = ReprocessService()
+    return reprocess_service
@@ -0,0 +1,156 @@
+"""
+Serializers for the streaming review export.
+Turn batches of review rows into NDJSON, CSV or Parquet chunks without
+buffering more than one batch.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator
+
+from app.services.review_service import EXPORT_COLUMNS
+
+# format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+class ExportFormatUnavailable(Exception):
+    """Raised when an export format's optional dependency is missing."""
+    pass
+
+
+def _plain(value):
+    """Convert a column value to a JSON/CSV friendly scalar."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def to_ndjson(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """One JSON object per line, one chunk per batch."""
+    async for rows in batches:
+        yield "".join(
+            json.dumps({key: _plain(value) for key, value in row.items()}, ensure_ascii=False) + "\n"
+            for row in rows
+        ).encode()
+
+
+async def to_csv(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """CSV with a header row, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for rows in batches:
+        writer.writerows([_plain(row[column]) for column in EXPORT_COLUMNS] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file that hands written bytes back in chunks.
+    
+    Keeps its own position so Parquet footer offsets stay correct after
+    the buffer is drained.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema():
+    import pyarrow as pa
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    return pa.schema([
+        ("id", pa.int64()),
+        ("rating", pa.int8()),
+        ("review_text", pa.string()),
+        ("ai_response", pa.string()),
+        ("ai_summary", pa.string()),
+        ("ai_actions", pa.string()),
+        ("prompt_version", pa.string()),
+        ("status", pa.string()),
+        ("error_message", pa.string()),
+        ("duplicate_of", pa.int64()),
+        ("spam_suspected", pa.bool_()),
+        ("created_at", timestamp),
+        ("updated_at", timestamp),
+    ])
+
+
+def check_parquet_available() -> None:
+    """
+    Fail before streaming starts if Parquet cannot be written.
+    
+    Raises:
+        ExportFormatUnavailable: If pyarrow is not installed
+    """
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ExportFormatUnavailable("Parquet export requires the pyarrow package") from e
+
+
+async def to_parquet(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """Parquet file with one row group per batch (requires pyarrow)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        async for rows in batches:
+            columns = {
+                column: [
+                    row[column].value if isinstance(row[column], Enum) else row[column]
+                    for row in rows
+                ]
+                for column in EXPORT_COLUMNS
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+SERIALIZERS = {
+    "ndjson": to_ndjson,
+    "csv": to_csv,
+    "parquet": to_parquet,
+}
@@ -2,27 +2,178 @@
 Review Service - Business logic for review operations.
 """
 
+import base64
+import html
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, update, func, desc, or_, tuple_, literal_column, values, column, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Review, ReviewStatus
-from app.schemas import ReviewCreate, LLMAnalysis, AdminStats
+from app.config import get_settings
+from app.metrics import observe_db_latency
+from app.models import Review, ReviewCounter, ReviewRollup, ReviewStatus
+from app.schemas import ReviewCreate, LLMAnalysis, AdminStats, TimeseriesPoint
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Full-text search over review_text (weight A) and ai_summary (weight B).
+# The generated column and its GIN index are created by init_db on PostgreSQL.
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR = literal_column("fynd.reviews.search_vector", type_=TSVECTOR)
+
+# ts_headline markers, replaced by <mark> tags after HTML-escaping the
+# fragment. Submissions are stripped of control characters, and the markers
+# are also removed from the document before highlighting (older rows, LLM
+# summaries), so only ts_headline can produce them
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxFragments=2, MinWords=8, MaxWords=25, FragmentDelimiter=\" … \""
+)
+
+# Columns returned by admin listings (ReviewDetail without search fields)
+LISTING_COLUMNS = (
+    "id",
+    "rating",
+    "review_text",
+    "ai_summary",
+    "ai_actions",
+    "status",
+    "spam_suspected",
+    "duplicate_of",
+    "created_at",
+)
+
+# Columns written by the bulk export (ip_address is deliberately left out)
+EXPORT_COLUMNS = (
+    "id",
+    "rating",
+    "review_text",
+    "ai_response",
+    "ai_summary",
+    "ai_actions",
+    "prompt_version",
+    "status",
+    "error_message",
+    "duplicate_of",
+    "spam_suspected",
+    "created_at",
+    "updated_at",
+)
+
+
+BUCKET_SIZES = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+# Upper bound on points per timeseries request
+MAX_TIMESERIES_POINTS = 5000
+
+
+def _truncate(moment: datetime, bucket: str) -> datetime:
+    """Truncate a timestamp to the start of its UTC bucket (naive = UTC)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    moment = moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if bucket == "day":
+        moment = moment.replace(hour=0)
+    return moment
+
+
+def timeseries_range(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    bucket: str,
+    default_span: timedelta
+) -> tuple[datetime, datetime]:
+    """
+    Concrete bucket-aligned bounds of a timeseries request.
+    
+    An open end is now and an open start is `default_span` before the end.
+    The start is truncated to its bucket and the end rounded up to the next
+    bucket boundary, so requests covering the same buckets get the same
+    bounds (and an open range changes when a new bucket begins).
+    
+    Returns:
+        (start, end), end exclusive
+    """
+    if end is None:
+        end = datetime.now(timezone.utc)
+    elif end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    aligned_end = _truncate(end, bucket)
+    if aligned_end < end:
+        aligned_end += BUCKET_SIZES[bucket]
+    first = _truncate(start if start is not None else end - default_span, bucket)
+    return first, aligned_end
+
+
+def encode_cursor(created_at: datetime, review_id: int, rank: Optional[float] = None) -> str:
+    """
+    Encode a keyset position as an opaque cursor.
+    
+    Search results are ordered by rank first, so their cursors carry it too.
+    """
+    data = {"c": created_at.isoformat(), "i": review_id}
+    if rank is not None:
+        data["r"] = rank
+    raw = json.dumps(data)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int, Optional[float]]:
+    """
+    Decode an opaque cursor into a (created_at, id, rank) keyset position.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        rank = float(data["r"]) if "r" in data else None
+        return datetime.fromisoformat(data["c"]), int(data["i"]), rank
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _without_markers(column):
+    """SQL expression of the column with highlight markers removed."""
+    return func.translate(column, HIGHLIGHT_START + HIGHLIGHT_STOP, "")
+
+
+def _highlight(fragment: Optional[str]) -> Optional[str]:
+    """HTML-escape a ts_headline fragment, then turn its markers into <mark> tags."""
+    if fragment is None:
+        return None
+    return (
+        html.escape(fragment)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
 
 
 class ReviewService:
     """Business logic for review operations."""
     
+    def __init__(self):
+        # rating filter -> (monotonic timestamp, total)
+        self._total_cache: dict[Optional[int], tuple[float, int]] = {}
+    
+    @observe_db_latency
     async def create_review(
         self,
         db: AsyncSession,
         review_data: ReviewCreate,
-        ip_address: Optional[str] = None
+        ip_address: Optional[str] = None,
+        spam_suspected: bool = False
     ) -> Review:
         """
         Create a new review record.
@@ -31,6 +182,7 @@ class ReviewService:
             db: Database session
             review_data: Validated review data
             ip_address: Client IP for tracking
+            spam_suspected: Part of a near-duplicate burst from this IP
             
         Returns:
             Created Review instance
@@ -39,44 +191,92 @@ class ReviewService:
             rating=review_data.rating,
             review_text=review_data.review_text,
             ip_address=ip_address,
+            spam_suspected=spam_suspected,
             status=ReviewStatus.PENDING
         )
         
         db.add(review)
         await db.flush()
-        await db.refresh(review)
         
         return review
     
-    async def update_review_with_analysis(
+    @observe_db_latency
+    async def create_review_with_analysis(
         self,
         db: AsyncSession,
-        review: Review,
+        review_data: ReviewCreate,
         analysis: LLMAnalysis,
-        success: bool
+        success: bool,
+        ip_address: Optional[str] = None,
+        duplicate_of: Optional[int] = None,
+        spam_suspected: bool = False
     ) -> Review:
         """
-        Update review with LLM analysis results.
+        Create a review that has already been analyzed.
+        
+        Persists the review and its analysis with a single INSERT ... RETURNING.
         
         Args:
             db: Database session
-            review: Review to update
+            review_data: Validated review data
             analysis: LLM analysis results
             success: Whether LLM processing succeeded
+            ip_address: Client IP for tracking
+            duplicate_of: Review whose analysis was reused
+            spam_suspected: Part of a near-duplicate burst from this IP
+            
+        Returns:
+            Created Review instance
         """
+        review = Review(
+            rating=review_data.rating,
+            review_text=review_data.review_text,
+            ip_address=ip_address,
+            duplicate_of=duplicate_of,
+            spam_suspected=spam_suspected
+        )
+        self._apply_analysis(review, analysis, success)
+        
+        db.add(review)
+        await db.flush()
+        
+        return review
+    
+    def _apply_analysis(self, review: Review, analysis: LLMAnalysis, success: bool) -> None:
+        """Copy analysis results and the resulting status onto a review."""
         review.ai_response = analysis.user_response
         review.ai_summary = analysis.internal_summary
         review.ai_actions = analysis.recommended_actions
+        review.prompt_version = analysis.prompt_version
         review.status = ReviewStatus.SUCCESS if success else ReviewStatus.FAILED
         
         if not success:
             review.error_message = "LLM processing failed - fallback response used"
+    
+    @observe_db_latency
+    async def update_review_with_analysis(
+        self,
+        db: AsyncSession,
+        review: Review,
+        analysis: LLMAnalysis,
+        success: bool
+    ) -> Review:
+        """
+        Update review with LLM analysis results.
+        
+        Args:
+            db: Database session
+            review: Review to update
+            analysis: LLM analysis results
+            success: Whether LLM processing succeeded
+        """
+        self._apply_analysis(review, analysis, success)
         
         await db.flush()
-        await db.refresh(review)
         
         return review
     
+    @observe_db_latency
     async def mark_review_failed(
         self,
         db: AsyncSession,
@@ -88,93 +288,534 @@ class ReviewService:
         review.error_message = error_message
         
         await db.flush()
-        await db.refresh(review)
         
         return review
     
+    @observe_db_latency
+    async def bulk_update_analyses(
+        self,
+        db: AsyncSession,
+        results: list[tuple[int, LLMAnalysis]]
+    ) -> int:
+        """
+        Store successful analyses for many reviews in one UPDATE ... FROM (VALUES ...).
+        
+        Rows that succeeded since they were selected (e.g. a worker finished
+        them) are left untouched. The count comes from RETURNING: asyncpg
+        reports no rowcount for executemany, so a bindparam UPDATE cannot
+        tell how many rows it changed.
+        
+        Args:
+            db: Database session
+            results: List of (review id, analysis)
+            
+        Returns:
+            Number of updated rows
+        """
+        if not results:
+            return 0
+        
+        table = Review.__table__
+        batch = values(
+            column("id", Integer),
+            column("ai_response", Text),
+            column("ai_summary", Text),
+            column("ai_actions", Text),
+            column("prompt_version", String),
+            name="batch"
+        ).data([
+            (
+                review_id,
+                analysis.user_response,
+                analysis.internal_summary,
+                analysis.recommended_actions,
+                analysis.prompt_version,
+            )
+            for review_id, analysis in results
+        ])
+        statement = (
+            update(table)
+            .where(table.c.id == batch.c.id, table.c.status != ReviewStatus.SUCCESS)
+            .values(
+                ai_response=batch.c.ai_response,
+                ai_summary=batch.c.ai_summary,
+                ai_actions=batch.c.ai_actions,
+                prompt_version=batch.c.prompt_version,
+                status=ReviewStatus.SUCCESS,
+                error_message=None,
+                claimed_at=None
+            )
+            .returning(table.c.id)
+        )
+        result = await db.execute(statement)
+        return len(result.all())
+    
+    @observe_db_latency
+    async def get_review(
+        self,
+        db: AsyncSession,
+        review_id: int,
+        for_update: bool = False
+    ) -> Optional[Review]:
+        """Get a single review by id, optionally locking its row."""
+        return await db.get(Review, review_id, with_for_update=for_update)
+    
+    @observe_db_latency
+    async def claim_pending_reviews(
+        self,
+        db: AsyncSession,
+        limit: int = 1,
+        lease_seconds: int = 120
+    ) -> list[Review]:
+        """
+        Claim pending reviews for background processing.
+        
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers never
+        claim the same row. Claimed rows get a lease (claimed_at) so the
+        caller can commit and release its connection before calling the LLM;
+        rows whose lease expired (e.g. the worker crashed) become claimable again.
+        
+        Args:
+            db: Database session
+            limit: Max number of reviews to claim
+            lease_seconds: How long a claim stays valid
+            
+        Returns:
+            List of claimed reviews
+        """
+        now = datetime.now(timezone.utc)
+        query = (
+            select(Review)
+            .where(
+                Review.status == ReviewStatus.PENDING,
+                or_(
+                    Review.claimed_at.is_(None),
+                    Review.claimed_at < now - timedelta(seconds=lease_seconds)
+                )
+            )
+            .order_by(Review.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        
+        result = await db.execute(query)
+        reviews = list(result.scalars().all())
+        
+        for review in reviews:
+            review.claimed_at = now
+        await db.flush()
+        
+        return reviews
+    
+    @observe_db_latency
     async def get_reviews(
         self,
         db: AsyncSession,
         limit: int = 100,
         offset: int = 0,
-        rating_filter: Optional[int] = None
-    ) -> tuple[list[Review], int]:
+        rating_filter: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> tuple[list[dict], int, Optional[str]]:
         """
         Get reviews with optional filtering.
         
+        Selects only LISTING_COLUMNS and returns plain dicts, so no ORM
+        objects are built or tracked for a page of up to 500 reviews.
+        
         Args:
             db: Database session
             limit: Max number of results
-            offset: Pagination offset
+            offset: Pagination offset (ignored when a cursor is given)
             rating_filter: Filter by specific rating
+            cursor: Opaque keyset cursor from a previous page
             
         Returns:
-            Tuple of (reviews list, total count)
+            Tuple of (list of row dicts, total count, next cursor)
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        # Build base query
-        query = select(Review).order_by(desc(Review.created_at))
-        count_query = select(func.count(Review.id))
+        # Build base query; id breaks ties so keyset pages never overlap
+        query = (
+            select(*[getattr(Review, name) for name in LISTING_COLUMNS])
+            .order_by(desc(Review.created_at), desc(Review.id))
+        )
         
         # Apply rating filter
         if rating_filter is not None:
             query = query.where(Review.rating == rating_filter)
-            count_query = count_query.where(Review.rating == rating_filter)
         
         # Apply pagination
-        query = query.limit(limit).offset(offset)
+        if cursor is not None:
+            created_at, review_id, rank = decode_cursor(cursor)
+            if rank is not None:
+                raise ValueError("Cursor belongs to a search query")
+            query = query.where(tuple_(Review.created_at, Review.id) < (created_at, review_id))
+        else:
+            query = query.offset(offset)
         
-        # Execute queries
-        result = await db.execute(query)
-        reviews = list(result.scalars().all())
+        # Fetch one extra row to know whether another page exists
+        result = await db.execute(query.limit(limit + 1))
+        reviews = [dict(row) for row in result.mappings()]
+        
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            next_cursor = encode_cursor(reviews[-1]["created_at"], reviews[-1]["id"])
         
-        count_result = await db.execute(count_query)
-        total = count_result.scalar() or 0
+        total = await self.count_reviews(db, rating_filter)
         
-        return reviews, total
+        return reviews, total, next_cursor
     
-    async def get_stats(self, db: AsyncSession) -> AdminStats:
-        """Get statistics for admin dashboard."""
+    @observe_db_latency
+    async def get_reviews_by_ids(self, db: AsyncSession, review_ids: list[int]) -> list[dict]:
+        """Get LISTING_COLUMNS rows for the given ids (missing ids are skipped)."""
+        if not review_ids:
+            return []
+        result = await db.execute(
+            select(*[getattr(Review, name) for name in LISTING_COLUMNS])
+            .where(Review.id.in_(review_ids))
+            .order_by(Review.id)
+        )
+        return [dict(row) for row in result.mappings()]
+    
+    @observe_db_latency
+    async def search_reviews(
+        self,
+        db: AsyncSession,
+        search: str,
+        limit: int = 100,
+        offset: int = 0,
+        rating_filter: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> tuple[list[dict], int, Optional[str]]:
+        """
+        Full-text search over review text and AI summaries.
+        
+        Matches use the GIN-indexed search_vector column; results are ordered
+        by relevance, then newest first. Highlights are computed only for
+        the returned page.
+        
+        Args:
+            db: Database session
+            search: Web-search style query ("quoted phrases", or, -exclude)
+            limit: Max number of results
+            offset: Pagination offset (ignored when a cursor is given)
+            rating_filter: Filter by specific rating
+            cursor: Opaque keyset cursor from a previous page of this search
+        
+        Returns:
+            Tuple of (list of row dicts with LISTING_COLUMNS plus rank,
+            review_text_highlight and ai_summary_highlight, total matches,
+            next cursor). Highlights are HTML-escaped with matches wrapped
+            in <mark> tags.
+        
+        Raises:
+            ValueError: If the cursor is malformed or the database has no search support
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            raise ValueError("Full-text search requires PostgreSQL")
         
-        # Total reviews
-        total_result = await db.execute(select(func.count(Review.id)))
-        total_reviews = total_result.scalar() or 0
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search)
+        rank = func.ts_rank_cd(SEARCH_VECTOR, ts_query)
         
-        # Average rating
-        avg_result = await db.execute(select(func.avg(Review.rating)))
-        average_rating = round(avg_result.scalar() or 0, 2)
+        conditions = [SEARCH_VECTOR.op("@@")(ts_query)]
+        if rating_filter is not None:
+            conditions.append(Review.rating == rating_filter)
         
-        # Status counts
-        success_result = await db.execute(
-            select(func.count(Review.id)).where(Review.status == ReviewStatus.SUCCESS)
+        # Rank and page over ids only; the outer query loads rows and headlines
+        page = (
+            select(Review.id, rank.label("rank"))
+            .where(*conditions)
+            .order_by(desc(rank), desc(Review.created_at), desc(Review.id))
         )
-        success_count = success_result.scalar() or 0
+        if cursor is not None:
+            created_at, review_id, cursor_rank = decode_cursor(cursor)
+            if cursor_rank is None:
+                raise ValueError("Cursor does not belong to a search query")
+            page = page.where(
+                tuple_(rank, Review.created_at, Review.id) < (cursor_rank, created_at, review_id)
+            )
+        else:
+            page = page.offset(offset)
+        page = page.limit(limit + 1).subquery()
         
-        failed_result = await db.execute(
-            select(func.count(Review.id)).where(Review.status == ReviewStatus.FAILED)
+        query = (
+            select(
+                *[getattr(Review, name) for name in LISTING_COLUMNS],
+                page.c.rank,
+                func.ts_headline(
+                    SEARCH_CONFIG, _without_markers(Review.review_text), ts_query, HEADLINE_OPTIONS
+                ).label("review_text_highlight"),
+                func.ts_headline(
+                    SEARCH_CONFIG, _without_markers(Review.ai_summary), ts_query, HEADLINE_OPTIONS
+                ).label("ai_summary_highlight"),
+            )
+            .join(page, Review.id == page.c.id)
+            .order_by(desc(page.c.rank), desc(Review.created_at), desc(Review.id))
         )
-        failed_count = failed_result.scalar() or 0
+        results = [dict(row) for row in (await db.execute(query)).mappings()]
         
-        # Recent 24h count
-        yesterday = datetime.utcnow() - timedelta(hours=24)
-        recent_result = await db.execute(
-            select(func.count(Review.id)).where(Review.created_at >= yesterday)
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            last = results[-1]
+            next_cursor = encode_cursor(last["created_at"], last["id"], last["rank"])
+        
+        for row in results:
+            row["review_text_highlight"] = _highlight(row["review_text_highlight"])
+            row["ai_summary_highlight"] = _highlight(row["ai_summary_highlight"])
+        
+        total = (await db.execute(
+            select(func.count()).select_from(Review).where(*conditions)
+        )).scalar() or 0
+        
+        return results, total, next_cursor
+    
+    async def stream_reviews(
+        self,
+        db: AsyncSession,
+        rating_filter: Optional[int] = None,
+        status_filter: Optional[ReviewStatus] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream reviews in id order through a server-side cursor.
+        
+        Only `batch_size` rows are held in memory at a time, however many
+        match. Rows are plain dicts of EXPORT_COLUMNS, not ORM objects, so
+        nothing accumulates in the session.
+        
+        Args:
+            db: Database session, kept open until the iterator is exhausted
+            rating_filter: Filter by specific rating
+            status_filter: Filter by processing status
+            created_from: Only reviews created at or after this time
+            created_to: Only reviews created before this time
+            batch_size: Rows fetched per round trip
+        
+        Yields:
+            Lists of up to batch_size row dicts
+        """
+        query = select(*[getattr(Review, name) for name in EXPORT_COLUMNS]).order_by(Review.id)
+        if rating_filter is not None:
+            query = query.where(Review.rating == rating_filter)
+        if status_filter is not None:
+            query = query.where(Review.status == status_filter)
+        if created_from is not None:
+            query = query.where(Review.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(Review.created_at < created_to)
+        
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+    
+    @observe_db_latency
+    async def count_reviews(
+        self,
+        db: AsyncSession,
+        rating_filter: Optional[int] = None
+    ) -> int:
+        """
+        Count reviews, optionally filtered by rating.
+        
+        Served from the counters table when enabled, otherwise an exact count
+        that may be cached for reviews_total_cache_seconds.
+        """
+        if settings.stats_use_counters:
+            query = select(func.coalesce(func.sum(ReviewCounter.count), 0))
+            if rating_filter is not None:
+                query = query.where(ReviewCounter.rating == rating_filter)
+            return (await db.execute(query)).scalar() or 0
+        
+        ttl = settings.reviews_total_cache_seconds
+        now = time.monotonic()
+        cached = self._total_cache.get(rating_filter)
+        if ttl > 0 and cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        query = select(func.count(Review.id))
+        if rating_filter is not None:
+            query = query.where(Review.rating == rating_filter)
+        total = (await db.execute(query)).scalar() or 0
+        
+        if ttl > 0:
+            self._total_cache[rating_filter] = (now, total)
+        
+        return total
+    
+    @observe_db_latency
+    async def get_version(self, db: AsyncSession) -> tuple[Optional[datetime], int]:
+        """
+        Get a cheap fingerprint of the reviews table for HTTP validators.
+        
+        Returns:
+            Tuple of (latest updated_at or None, row count)
+        """
+        last_updated = (await db.execute(select(func.max(Review.updated_at)))).scalar()
+        return last_updated, await self.count_reviews(db)
+    
+    @observe_db_latency
+    async def get_stats(self, db: AsyncSession) -> AdminStats:
+        """
+        Get statistics for admin dashboard.
+        
+        Reads the trigger-maintained counters table when enabled, otherwise
+        aggregates everything in a single pass over the reviews table.
+        """
+        yesterday = datetime.now(timezone.utc) - timedelta(hours=24)
+        
+        if settings.stats_use_counters:
+            return await self._get_stats_from_counters(db, yesterday)
+        
+        query = select(
+            func.count(Review.id),
+            func.avg(Review.rating),
+            func.count(Review.id).filter(Review.status == ReviewStatus.SUCCESS),
+            func.count(Review.id).filter(Review.status == ReviewStatus.FAILED),
+            func.count(Review.id).filter(Review.created_at >= yesterday),
+            *[
+                func.count(Review.id).filter(Review.rating == rating)
+                for rating in range(1, 6)
+            ]
         )
-        recent_24h_count = recent_result.scalar() or 0
+        row = (await db.execute(query)).one()
+        total_reviews, avg_rating, success_count, failed_count, recent_24h_count = row[:5]
         
-        # Rating distribution
-        rating_dist = {}
-        for rating in range(1, 6):
-            dist_result = await db.execute(
-                select(func.count(Review.id)).where(Review.rating == rating)
+        return AdminStats(
+            total_reviews=total_reviews or 0,
+            average_rating=round(avg_rating or 0, 2),
+            success_count=success_count or 0,
+            failed_count=failed_count or 0,
+            recent_24h_count=recent_24h_count or 0,
+            rating_distribution={rating: count or 0 for rating, count in zip(range(1, 6), row[5:])}
+        )
+    
+    @observe_db_latency
+    async def get_timeseries(
+        self,
+        db: AsyncSession,
+        start: datetime,
+        end: datetime,
+        bucket: str = "day"
+    ) -> list[TimeseriesPoint]:
+        """
+        Get review activity per hourly or daily UTC bucket.
+        
+        Reads the trigger-maintained rollups table when enabled, otherwise
+        groups fynd.reviews over the range. Empty buckets are included.
+        
+        Args:
+            db: Database session
+            start: Range start; truncated to the start of its bucket
+            end: Range end (exclusive)
+            bucket: "hour" or "day"
+            
+        Returns:
+            One point per bucket, oldest first
+            
+        Raises:
+            ValueError: If the range is empty or has too many buckets
+        """
+        step = BUCKET_SIZES[bucket]
+        first = _truncate(start, bucket)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+        if end <= first:
+            raise ValueError("'to' must be after 'from'")
+        if (end - first) / step > MAX_TIMESERIES_POINTS:
+            raise ValueError(f"Range covers more than {MAX_TIMESERIES_POINTS} {bucket} buckets")
+        
+        if settings.stats_use_rollups:
+            query = (
+                select(
+                    ReviewRollup.bucket_start,
+                    ReviewRollup.review_count,
+                    ReviewRollup.rating_sum,
+                    ReviewRollup.pending_count,
+                    ReviewRollup.success_count,
+                    ReviewRollup.failed_count
+                )
+                .where(
+                    ReviewRollup.granularity == bucket,
+                    ReviewRollup.bucket_start >= first,
+                    ReviewRollup.bucket_start < end
+                )
+            )
+        else:
+            if db.get_bind().dialect.name != "postgresql":
+                raise ValueError("Timeseries without rollups requires PostgreSQL")
+            # Inline literals so the SELECT and GROUP BY expressions match exactly
+            bucket_start = func.date_trunc(
+                literal_column(f"'{bucket}'"),
+                func.timezone(literal_column("'UTC'"), Review.created_at)
+            )
+            query = (
+                select(
+                    bucket_start,
+                    func.count(Review.id),
+                    func.sum(Review.rating),
+                    func.count(Review.id).filter(Review.status == ReviewStatus.PENDING),
+                    func.count(Review.id).filter(Review.status == ReviewStatus.SUCCESS),
+                    func.count(Review.id).filter(Review.status == ReviewStatus.FAILED)
+                )
+                .where(Review.created_at >= first, Review.created_at < end)
+                .group_by(bucket_start)
             )
-            rating_dist[rating] = dist_result.scalar() or 0
+        
+        rows = {
+            _truncate(row[0], bucket): row[1:]
+            for row in (await db.execute(query)).all()
+        }
+        
+        points = []
+        current = first
+        while current < end:
+            count, rating_sum, pending, success, failed = rows.get(current, (0, 0, 0, 0, 0))
+            points.append(TimeseriesPoint(
+                bucket_start=current,
+                count=count,
+                average_rating=round(rating_sum / count, 2) if count else None,
+                pending_count=pending,
+                success_count=success,
+                failed_count=failed
+            ))
+            current += step
+        
+        return points
+    
+    async def _get_stats_from_counters(
+        self,
+        db: AsyncSession,
+        since: datetime
+    ) -> AdminStats:
+        """Build stats from the counters table plus an index-bounded recent count."""
+        result = await db.execute(
+            select(ReviewCounter.rating, ReviewCounter.status, ReviewCounter.count)
+        )
+        
+        rating_dist = {rating: 0 for rating in range(1, 6)}
+        status_counts = {status: 0 for status in ReviewStatus}
+        for rating, status, count in result.all():
+            rating_dist[rating] += count
+            status_counts[status] += count
+        
+        total_reviews = sum(rating_dist.values())
+        rating_sum = sum(rating * count for rating, count in rating_dist.items())
+        
+        recent_result = await db.execute(
+            select(func.count(Review.id)).where(Review.created_at >= since)
+        )
         
         return AdminStats(
             total_reviews=total_reviews,
-            average_rating=average_rating,
-            success_count=success_count,
-            failed_count=failed_count,
-            recent_24h_count=recent_24h_count,
+            average_rating=round(rating_sum / total_reviews, 2) if total_reviews else 0,
+            success_count=status_counts[ReviewStatus.SUCCESS],
+            failed_count=status_counts[ReviewStatus.FAILED],
+            recent_24h_count=recent_result.scalar() or 0,
             rating_distribution=rating_dist
         )
 
@@ -0,0 +1,171 @@
+"""
+Review Worker - Background processing of pending reviews.
+Claims pending rows, runs LLM analysis and writes the results back.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models import ReviewStatus
+from app.services.duplicate_index import get_duplicate_detector, DuplicateDetector
+from app.services.llm_service import get_llm_service, LLMService
+from app.services.review_service import get_review_service, ReviewService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class ReviewWorker:
+    """
+    Bounded pool of workers draining pending reviews.
+
+    Each worker claims one review at a time in a short transaction,
+    releases its connection while the LLM call is in flight, then
+    writes the analysis back in a second short transaction.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = settings.review_worker_concurrency,
+        poll_interval: float = settings.review_worker_poll_interval,
+        lease_seconds: int = settings.review_worker_lease_seconds,
+        llm_service: Optional[LLMService] = None,
+        review_service: Optional[ReviewService] = None,
+        duplicate_detector: Optional[DuplicateDetector] = None
+    ):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.llm_service = llm_service or get_llm_service()
+        self.review_service = review_service or get_review_service()
+        self.duplicate_detector = duplicate_detector or get_duplicate_detector()
+
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._waiters: dict[int, asyncio.Event] = {}
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker pool is running."""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(i), name=f"review-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        logger.info(f"Review worker pool started (concurrency={self.concurrency})")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks and wait for them to exit."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Review worker pool stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers after a new pending review was committed."""
+        self._wakeup.set()
+
+    async def wait_for(self, review_id: int, timeout: float) -> bool:
+        """
+        Wait until this process finishes the given review.
+
+        Returns:
+            True if the review was completed before the timeout
+        """
+        event = self._waiters.setdefault(review_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if self._waiters.get(review_id) is event and not event.is_set():
+                self._waiters.pop(review_id, None)
+
+    async def process_one(self) -> bool:
+        """
+        Claim and process a single pending review.
+
+        Returns:
+            True if a review was processed, False if the queue was empty
+        """
+        async with AsyncSessionLocal() as db:
+            claimed = await self.review_service.claim_pending_reviews(
+                db=db,
+                limit=1,
+                lease_seconds=self.lease_seconds
+            )
+            await db.commit()
+
+        if not claimed:
+            return False
+
+        review = claimed[0]
+        analysis, llm_success = await self.llm_service.analyze_review(
+            rating=review.rating,
+            review_text=review.review_text
+        )
+
+        async with AsyncSessionLocal() as db:
+            review = await self.review_service.get_review(db, review.id, for_update=True)
+            # A reprocess job may have analyzed it after the lease expired:
+            # keep that result rather than overwriting it
+            stored = review is not None and review.status == ReviewStatus.PENDING
+            if review is not None and not stored:
+                logger.info(f"Review {review.id} was analyzed elsewhere, discarding this result")
+            if stored:
+                await self.review_service.update_review_with_analysis(
+                    db=db,
+                    review=review,
+                    analysis=analysis,
+                    success=llm_success
+                )
+                await db.commit()
+
+        if stored and llm_success:
+            self.duplicate_detector.add(review.id, review.rating, review.review_text, analysis)
+
+        if review is not None:
+            event = self._waiters.pop(review.id, None)
+            if event is not None:
+                event.set()
+
+        return True
+
+    async def _run(self, index: int) -> None:
+        """Worker loop: drain the queue, then sleep until notified or polled."""
+        while True:
+            try:
+                while await self.process_one():
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Review worker {index} error: {e}")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+# Global instance, constructed on first use
+review_worker: Optional[ReviewWorker] = None
+
+
+def get_review_worker() -> ReviewWorker:
+    """Get review worker instance."""
+    global review_worker
+    if review_worker is None:
+        review_worker = ReviewWorker()
+    return review_worker
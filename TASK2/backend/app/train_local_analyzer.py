@@ -0,0 +1,144 @@
+"""
+Train the local analyzer model offline.
+
+Fits a hashed-feature logistic regression on labelled reviews (the TASK1
+Yelp results: 4-5 stars positive, 1-2 stars negative, 3 stars skipped)
+plus a small sentiment lexicon that covers the short phrasings those
+long reviews rarely contain, and writes the weights as JSON:
+
+    python -m app.train_local_analyzer --data ../../TASK1/task1_prompt_v3_results.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import math
+import random
+
+from app.services.local_analyzer import DEFAULT_MODEL_PATH, featurize
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+POSITIVE_LEXICON = [
+    "great", "excellent", "amazing", "awesome", "fantastic", "wonderful", "perfect",
+    "delicious", "tasty", "love", "loved", "lovely", "best", "friendly", "outstanding",
+    "superb", "brilliant", "incredible", "recommend", "highly recommend", "will be back",
+    "will come back", "good", "very good", "nice", "enjoyed", "pleasant", "fresh",
+    "attentive", "helpful", "clean", "cozy", "exceptional", "impressive", "yummy",
+    "great food", "great service", "not bad", "no complaints", "thank you",
+]
+
+NEGATIVE_LEXICON = [
+    "terrible", "awful", "horrible", "worst", "bad", "very bad", "disgusting", "rude",
+    "slow", "cold", "dirty", "filthy", "overpriced", "disappointing", "disappointed",
+    "never again", "never coming back", "won't be back", "waste", "poor", "mediocre",
+    "bland", "stale", "undercooked", "burnt", "gross", "inedible", "unprofessional",
+    "ignored", "waited forever", "not good", "not worth it", "not great", "avoid",
+    "terrible service", "bad service", "bad food", "sick", "hate", "hated",
+]
+
+
+def load_examples(paths: list[str]) -> list[tuple[str, int]]:
+    """Read (text, label) pairs from result CSVs with review_text and actual_stars."""
+    examples, seen = [], set()
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                stars = int(row["actual_stars"])
+                text = row["review_text"]
+                if stars == 3 or text in seen:
+                    continue
+                seen.add(text)
+                examples.append((text, 1 if stars >= 4 else 0))
+    return examples
+
+
+def train(
+    samples: list[tuple[dict[int, float], int, float]],
+    epochs: int,
+    learning_rate: float,
+    l2: float
+) -> tuple[dict[int, float], float]:
+    """SGD logistic regression over sparse (features, label, sample weight) samples."""
+    weights: dict[int, float] = {}
+    bias = 0.0
+    order = list(range(len(samples)))
+    rng = random.Random(0)
+    for epoch in range(epochs):
+        rng.shuffle(order)
+        rate = learning_rate / (1 + epoch * 0.1)
+        for i in order:
+            features, label, sample_weight = samples[i]
+            score = bias + sum(weights.get(k, 0.0) * v for k, v in features.items())
+            error = (1.0 / (1.0 + math.exp(-max(min(score, 30.0), -30.0))) - label) * sample_weight
+            for k, v in features.items():
+                w = weights.get(k, 0.0)
+                weights[k] = w - rate * (error * v + l2 * w)
+            bias -= rate * error
+    return weights, bias
+
+
+def predict(weights: dict[int, float], bias: float, features: dict[int, float]) -> float:
+    score = bias + sum(weights.get(k, 0.0) * v for k, v in features.items())
+    return 1.0 / (1.0 + math.exp(-max(min(score, 30.0), -30.0)))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Train the local analyzer sentiment model")
+    parser.add_argument("--data", nargs="+", required=True, help="CSV files with review_text, actual_stars")
+    parser.add_argument("--output", default=str(DEFAULT_MODEL_PATH))
+    parser.add_argument("--buckets", type=int, default=2 ** 18)
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--learning-rate", type=float, default=0.5)
+    parser.add_argument("--l2", type=float, default=1e-4)
+    parser.add_argument("--lexicon-weight", type=float, default=3.0, help="Sample weight of lexicon entries")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Share of reviews held out for evaluation")
+    parser.add_argument("--threshold", type=float, default=0.9, help="Confidence reported for coverage")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Train, report held-out accuracy and coverage, and write the model."""
+    args = parse_args()
+    examples = load_examples(args.data)
+    random.Random(42).shuffle(examples)
+    split = int(len(examples) * (1 - args.holdout))
+    train_set, holdout = examples[:split], examples[split:]
+
+    lexicon = [(phrase, 1) for phrase in POSITIVE_LEXICON] + [(phrase, 0) for phrase in NEGATIVE_LEXICON]
+    samples = [(featurize(text, args.buckets), label, 1.0) for text, label in train_set]
+    samples += [(featurize(text, args.buckets), label, args.lexicon_weight) for text, label in lexicon]
+    weights, bias = train(samples, args.epochs, args.learning_rate, args.l2)
+
+    if holdout:
+        correct = confident = confident_correct = 0
+        for text, label in holdout:
+            positive = predict(weights, bias, featurize(text, args.buckets))
+            predicted = 1 if positive >= 0.5 else 0
+            correct += predicted == label
+            if max(positive, 1 - positive) >= args.threshold:
+                confident += 1
+                confident_correct += predicted == label
+        logger.info(
+            f"Held-out reviews: {len(holdout)}, accuracy {correct / len(holdout):.2%}, "
+            f"confident@{args.threshold} {confident / len(holdout):.2%} "
+            f"with accuracy {confident_correct / max(confident, 1):.2%}"
+        )
+
+    weights = {k: round(w, 4) for k, w in weights.items() if abs(w) >= 1e-3}
+    body = {"buckets": args.buckets, "bias": round(bias, 4), "weights": {str(k): w for k, w in sorted(weights.items())}}
+    body["version"] = hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()[:8]
+    with open(args.output, "w") as f:
+        json.dump(body, f, separators=(",", ":"))
+    logger.info(f"Wrote {len(weights)} weights to {args.output} (version {body['version']})")
+
+
+if __name__ == "__main__":
+    main()
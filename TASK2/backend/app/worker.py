@@ -0,0 +1,37 @@
+"""
+Standalone review worker entry point.
+
+Runs the background review processing pool without the API server:
+
+    python -m app.worker
+"""
+
+import asyncio
+import logging
+
+from app.database import close_db
+from app.services.review_worker import get_review_worker
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    """Run the worker pool until interrupted."""
+    worker = get_review_worker()
+    await worker.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await worker.stop()
+        await close_db()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Review worker interrupted")
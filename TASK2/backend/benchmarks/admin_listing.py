@@ -0,0 +1,170 @@
+"""
+Benchmark: CPU time and memory per GET /admin/reviews page.
+
+Compares the legacy listing path (full ORM Review objects, copied into
+ReviewDetail models, validated again by response_model and rendered with
+json) with the current path (column projection to plain rows, encoded
+once with orjson). Reviews are seeded with long texts so serialization
+cost is visible.
+
+    python -m benchmarks.admin_listing --limit 500 --text-length 2000
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.admin_listing
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import tracemalloc
+
+# The admin routes import the LLM service, whose client needs a key to construct
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from pydantic import TypeAdapter
+from sqlalchemy import desc, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database import Base
+from app.models import Review, ReviewStatus
+from app.routes.admin import NO_SEARCH_FIELDS, serialize_reviews_page
+from app.schemas import AdminReviewsResponse, ReviewDetail
+from app.services.review_service import ReviewService
+from benchmarks.submit_path import make_engine
+
+WORDS = "the food service staff table wait cold warm great slow friendly price menu dessert".split()
+
+
+def random_text(length: int) -> str:
+    words = []
+    while sum(len(w) + 1 for w in words) < length:
+        words.append(random.choice(WORDS))
+    return " ".join(words)
+
+
+async def seed(session_factory, count: int, text_length: int) -> None:
+    """Insert reviews with long texts and analyses."""
+    async with session_factory() as db:
+        for start in range(0, count, 500):
+            db.add_all([
+                Review(
+                    rating=random.randint(1, 5),
+                    review_text=random_text(text_length),
+                    ai_response=random_text(text_length // 2),
+                    ai_summary=random_text(text_length // 4),
+                    ai_actions=random_text(text_length // 4),
+                    status=ReviewStatus.SUCCESS,
+                    error_message=None,
+                    ip_address="127.0.0.1"
+                )
+                for _ in range(min(500, count - start))
+            ])
+            await db.flush()
+        await db.commit()
+
+
+RESPONSE_ADAPTER = TypeAdapter(AdminReviewsResponse)
+
+
+async def legacy_page(session_factory, limit: int) -> bytes:
+    """The previous listing path, reproduced step by step."""
+    async with session_factory() as db:
+        result = await db.execute(
+            select(Review).order_by(desc(Review.created_at), desc(Review.id)).limit(limit + 1)
+        )
+        reviews = list(result.scalars().all())[:limit]
+        total = (await db.execute(text("SELECT count(*) FROM fynd.reviews"))).scalar()
+
+        content = AdminReviewsResponse(
+            reviews=[
+                ReviewDetail(
+                    id=r.id,
+                    rating=r.rating,
+                    review_text=r.review_text,
+                    ai_summary=r.ai_summary,
+                    ai_actions=r.ai_actions,
+                    status=r.status,
+                    created_at=r.created_at
+                )
+                for r in reviews
+            ],
+            total=total,
+            next_cursor=None
+        )
+        # What FastAPI does with response_model: validate again, dump, render
+        validated = RESPONSE_ADAPTER.validate_python(content, from_attributes=True)
+        return json.dumps(
+            RESPONSE_ADAPTER.dump_python(validated, mode="json"),
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode()
+
+
+async def current_page(session_factory, review_service: ReviewService, limit: int) -> bytes:
+    """The current listing path, as used by GET /admin/reviews."""
+    async with session_factory() as db:
+        rows, total, next_cursor = await review_service.get_reviews(db, limit=limit)
+        for row in rows:
+            row.update(NO_SEARCH_FIELDS)
+        return serialize_reviews_page(rows, total, next_cursor)
+
+
+async def measure(name, page, iterations: int) -> None:
+    """Run a page function repeatedly and print CPU time, wall time and peak memory."""
+    await page()  # warm up connection and compiled statement caches
+
+    cpu, wall = [], []
+    for _ in range(iterations):
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        body = await page()
+        cpu.append((time.process_time() - cpu_start) * 1000)
+        wall.append((time.perf_counter() - wall_start) * 1000)
+
+    tracemalloc.start()
+    await page()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:<8} cpu/page p50={statistics.median(cpu):.2f}ms "
+        f"wall/page p50={statistics.median(wall):.2f}ms "
+        f"peak_alloc={peak / 1024 / 1024:.1f}MiB body={len(body) / 1024:.0f}KiB"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--reviews", type=int, default=2000)
+    parser.add_argument("--text-length", type=int, default=2000)
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCH_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+    )
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            await conn.execute(text("CREATE SCHEMA IF NOT EXISTS fynd"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await seed(session_factory, args.reviews, args.text_length)
+    review_service = ReviewService()
+
+    await measure("legacy", lambda: legacy_page(session_factory, args.limit), args.iterations)
+    await measure(
+        "current",
+        lambda: current_page(session_factory, review_service, args.limit),
+        args.iterations
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,140 @@
+"""
+Benchmark: near-duplicate index cost and accuracy per submission.
+
+Fills a MinHashIndex with random filler entries plus half of a set of real
+reviews (the TASK1 Yelp results), then reports the time to sign a review
+and to look it up, the share of edited copies found (words replaced,
+deleted or inserted, and rewritten phrases), matches for the held-out real
+reviews (which should find nothing), and the memory held by the index.
+
+    python -m benchmarks.duplicate_index --reviews 1000000
+"""
+
+import argparse
+import csv
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+from array import array
+
+from app.schemas import LLMAnalysis
+from app.services.duplicate_index import MinHashIndex, SIGNATURE_SIZE, signature
+
+DEFAULT_DATA = "../../TASK1/task1_prompt_v3_results.csv"
+MIN_WORDS = 8
+
+
+def load_reviews(path: str) -> list[str]:
+    """Distinct review texts with at least MIN_WORDS words."""
+    with open(path, newline="", encoding="utf-8") as f:
+        texts = [row["review_text"] for row in csv.DictReader(f)]
+    return [text for text in dict.fromkeys(texts) if len(text.split()) >= MIN_WORDS]
+
+
+def make_analysis(rng: random.Random, vocabulary: list[str]) -> LLMAnalysis:
+    """An analysis of typical length."""
+    def text(words: int) -> str:
+        return " ".join(rng.choice(vocabulary) for _ in range(words))
+    return LLMAnalysis(user_response=text(45), internal_summary=text(20), recommended_actions=text(15))
+
+
+def edit_words(rng: random.Random, vocabulary: list[str], text: str, edits: int) -> str:
+    """Replace, delete or insert `edits` random words."""
+    words = text.split()
+    for _ in range(edits):
+        i = rng.randrange(len(words))
+        operation = rng.randrange(3)
+        if operation == 0:
+            words[i] = rng.choice(vocabulary)
+        elif operation == 1 and len(words) > 1:
+            del words[i]
+        else:
+            words.insert(i, rng.choice(vocabulary))
+    return " ".join(words)
+
+
+def rewrite_phrase(rng: random.Random, vocabulary: list[str], text: str, length: int) -> str:
+    """Replace `length` consecutive words."""
+    words = text.split()
+    i = rng.randrange(max(len(words) - length, 1))
+    words[i:i + length] = [rng.choice(vocabulary) for _ in range(length)]
+    return " ".join(words)
+
+
+def timed_us(func, items: list) -> tuple[list, list[float]]:
+    """Results and per-call microseconds of func over items."""
+    results, timings = [], []
+    for item in items:
+        started = time.perf_counter()
+        results.append(func(item))
+        timings.append((time.perf_counter() - started) * 1e6)
+    return results, timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    print(
+        f"{name:<26} p50={statistics.median(timings):.1f}us "
+        f"p99={timings[int(len(timings) * 0.99)]:.1f}us max={timings[-1]:.1f}us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reviews", type=int, default=1_000_000, help="Indexed reviews")
+    parser.add_argument("--data", default=DEFAULT_DATA, help="CSV with a review_text column")
+    parser.add_argument("--copies", type=int, default=5, help="Edited copies per review and edit kind")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    reviews = load_reviews(args.data)
+    rng.shuffle(reviews)
+    indexed, held_out = reviews[:len(reviews) // 2], reviews[len(reviews) // 2:]
+    vocabulary = sorted({word for text in reviews for word in text.split()})
+
+    signatures, timings = timed_us(lambda text: signature(text, MIN_WORDS), reviews)
+    report("signature", timings)
+
+    analyses = [make_analysis(rng, vocabulary) for _ in range(1000)]
+    tracemalloc.start()
+    index = MinHashIndex(max_entries=args.reviews * 2)
+    # Signatures of unrelated texts are uniformly random; generating them
+    # directly keeps filling a large index fast
+    for review_id in range(args.reviews - len(indexed)):
+        filler = array("H", (rng.getrandbits(16) for _ in range(SIGNATURE_SIZE)))
+        index.add(review_id, filler, rng.randint(1, 5), analyses[review_id % len(analyses)])
+    for offset, sig in enumerate(signatures[:len(indexed)]):
+        index.add(args.reviews + offset, sig, 5, analyses[offset % len(analyses)])
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    gc.collect()
+    # The first call after tracemalloc stops pays for its teardown
+    index.find(signatures[0], 5)
+    print(f"index                      {len(index)} reviews, {memory / 2**20:.0f} MiB ({memory / len(index):.0f} B/review)")
+
+    found, timings = timed_us(lambda sig: index.find(sig, 5), signatures[:len(indexed)])
+    report("lookup indexed", timings)
+    print(f"indexed found              {sum(match is not None for match in found) / len(found):.1%}")
+
+    kinds = [
+        ("1 word edited", lambda text: edit_words(rng, vocabulary, text, 1)),
+        ("2 words edited", lambda text: edit_words(rng, vocabulary, text, 2)),
+        ("3-word phrase rewritten", lambda text: rewrite_phrase(rng, vocabulary, text, 3)),
+        ("5-word phrase rewritten", lambda text: rewrite_phrase(rng, vocabulary, text, 5)),
+    ]
+    for name, change in kinds:
+        copies = [signature(change(text), MIN_WORDS) for text in indexed for _ in range(args.copies)]
+        copies = [sig for sig in copies if sig is not None]
+        found, timings = timed_us(lambda sig: index.find(sig, 5), copies)
+        report(f"lookup {name}", timings)
+        print(f"{name + ' found':<26} {sum(match is not None for match in found) / len(found):.1%}")
+
+    found, timings = timed_us(lambda sig: index.find(sig, 5), signatures[len(indexed):])
+    report("lookup held-out", timings)
+    print(f"held-out matched           {sum(match is not None for match in found)} of {len(held_out)}")
+
+
+if __name__ == "__main__":
+    main()
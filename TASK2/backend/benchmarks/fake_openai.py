@@ -0,0 +1,146 @@
+"""
+Fake OpenAI-compatible server for benchmarks.
+
+Serves POST /v1/chat/completions with canned review analyses and
+configurable latency, error rate and timeout injection. Supports the
+single-review, batched and streaming request shapes used by LLMService.
+
+    python -m benchmarks.fake_openai --port 9000 --latency-ms 800 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """Failure and latency injection settings."""
+    latency_ms: float = 800
+    jitter_ms: float = 200
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 60
+
+
+ANALYSIS = {
+    "user_response": "Thank you for your feedback! We appreciate you taking the time to share your experience.",
+    "internal_summary": "Benchmark review analyzed by the fake OpenAI server.",
+    "recommended_actions": "No action required.",
+}
+
+
+def _completion_content(messages: list[dict]) -> str:
+    """Build the JSON content the model would return for these messages."""
+    system = messages[0]["content"] if messages else ""
+    if '"results"' in system:
+        # Batched prompt: answer every review id in the user message
+        user = messages[-1]["content"]
+        start, end = user.find("["), user.rfind("]")
+        items = json.loads(user[start:end + 1]) if start != -1 else []
+        return json.dumps({"results": [{"id": item["id"], **ANALYSIS} for item in items]})
+    return json.dumps(ANALYSIS)
+
+
+def create_fake_openai_app(config: FakeOpenAIConfig) -> FastAPI:
+    """Create the fake server application."""
+    app = FastAPI(title="Fake OpenAI")
+    app.state.requests = 0
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        app.state.requests += 1
+        body = await request.json()
+        roll = random.random()
+
+        if roll < config.timeout_rate:
+            await asyncio.sleep(config.timeout_seconds)
+        latency = max(0.0, random.gauss(config.latency_ms, config.jitter_ms)) / 1000
+        await asyncio.sleep(latency)
+
+        if roll >= 1 - config.error_rate:
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "Injected failure", "type": "server_error"}}
+            )
+
+        content = _completion_content(body.get("messages", []))
+        prompt_tokens = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 4
+        completion_tokens = len(content) // 4
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        base = {
+            "id": f"chatcmpl-fake-{app.state.requests}",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+        }
+
+        if body.get("stream"):
+            async def chunks():
+                for i in range(0, len(content), 16):
+                    chunk = {
+                        **base,
+                        "object": "chat.completion.chunk",
+                        "choices": [{"index": 0, "delta": {"content": content[i:i + 16]}, "finish_reason": None}],
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                    await asyncio.sleep(0.005)
+                done = {**base, "object": "chat.completion.chunk", "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+                yield f"data: {json.dumps(done)}\n\n"
+                if body.get("stream_options", {}).get("include_usage"):
+                    yield f"data: {json.dumps({**base, 'object': 'chat.completion.chunk', 'choices': [], 'usage': usage})}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(chunks(), media_type="text/event-stream")
+
+        return {
+            **base,
+            "object": "chat.completion",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        }
+
+    return app
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register fake server options on a parser."""
+    parser.add_argument("--latency-ms", type=float, default=800)
+    parser.add_argument("--jitter-ms", type=float, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-seconds", type=float, default=60)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeOpenAIConfig:
+    """Build a config from parsed arguments."""
+    return FakeOpenAIConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_seconds=args.timeout_seconds
+    )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible server")
+    parser.add_argument("--port", type=int, default=9000)
+    add_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_fake_openai_app(config_from_args(args)), host="127.0.0.1", port=args.port)
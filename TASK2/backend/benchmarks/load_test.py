@@ -0,0 +1,283 @@
+"""
+Load test: drive the API against a local database and a fake OpenAI server.
+
+Starts the fake OpenAI-compatible server and the FastAPI app in-process,
+then sends POST /reviews, GET /admin/reviews and GET /admin/stats at the
+given concurrency. Reports p50/p95/p99 latency and requests per second
+per endpoint plus connection pool saturation, and can fail on p95
+regressions against a saved baseline.
+
+    python -m benchmarks.load_test --concurrency 32 --duration 30
+    python -m benchmarks.load_test --output baseline.json
+    python -m benchmarks.load_test --baseline baseline.json --max-regression 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import httpx
+import uvicorn
+
+from benchmarks.fake_openai import add_arguments, config_from_args, create_fake_openai_app
+
+ENDPOINTS = {
+    "submit": ("POST", "/reviews"),
+    "reviews": ("GET", "/admin/reviews"),
+    "stats": ("GET", "/admin/stats"),
+}
+
+REVIEW_TEXTS = [
+    "Great food and friendly staff, will come back!",
+    "Service was slow and the soup arrived cold.",
+    "Average experience, nothing special but nothing wrong either.",
+    "The best brunch in town. The pancakes were amazing.",
+    "Waited 40 minutes for a table despite having a reservation.",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the feedback API")
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20, help="Seconds to run")
+    parser.add_argument("--mix", default="submit=4,reviews=2,stats=1", help="Endpoint weights")
+    parser.add_argument("--seed-reviews", type=int, default=1000, help="Rows inserted before the run")
+    parser.add_argument("--unique-texts", action="store_true", help="Defeat the LLM cache")
+    parser.add_argument("--app-port", type=int, default=8765)
+    parser.add_argument("--fake-port", type=int, default=8766)
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Compare p95 latencies with a previous --output")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed p95 increase (fraction)")
+    add_arguments(parser)
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """Point the app at the benchmark database and fake server before it is imported."""
+    database_url = args.database_url or "sqlite+aiosqlite:///" + os.path.join(
+        tempfile.mkdtemp(prefix="feedback-bench-"), "bench.db"
+    )
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["OPENAI_API_KEY"] = "sk-benchmark"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.fake_port}/v1"
+    os.environ["RATE_LIMIT_REQUESTS"] = str(10 ** 9)
+    if database_url.startswith("sqlite"):
+        os.environ["LLM_CACHE_PERSISTENT"] = "false"
+        os.environ["RATE_LIMIT_STORAGE"] = "memory"
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def start_server(app, port: int) -> tuple[uvicorn.Server, asyncio.Task]:
+    """Serve an ASGI app in this event loop."""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+async def seed_reviews(count: int) -> None:
+    """Insert historical reviews so admin reads have data to page through."""
+    from app.database import AsyncSessionLocal
+    from app.models import Review, ReviewStatus
+
+    async with AsyncSessionLocal() as db:
+        for start in range(0, count, 500):
+            db.add_all([
+                Review(
+                    rating=random.randint(1, 5),
+                    review_text=random.choice(REVIEW_TEXTS),
+                    ai_response="Thank you!",
+                    ai_summary="Seeded review",
+                    ai_actions="None",
+                    status=ReviewStatus.SUCCESS,
+                )
+                for _ in range(min(500, count - start))
+            ])
+            await db.flush()
+        await db.commit()
+
+
+async def sample_pool(engine, samples: list[tuple[int, int]], stop: asyncio.Event) -> None:
+    """Record (checked out connections, capacity) every 50ms."""
+    pool = engine.sync_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    while not stop.is_set():
+        samples.append((pool.checkedout(), capacity))
+        await asyncio.sleep(0.05)
+
+
+async def run_load(args: argparse.Namespace, base_url: str) -> dict[str, list[tuple[float, int]]]:
+    """Drive the endpoints until the duration elapses."""
+    weights = dict(item.split("=") for item in args.mix.split(","))
+    names = [name for name in weights if name in ENDPOINTS]
+    name_weights = [float(weights[name]) for name in names]
+    results: dict[str, list[tuple[float, int]]] = defaultdict(list)
+    deadline = time.perf_counter() + args.duration
+    counter = 0
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal counter
+        while time.perf_counter() < deadline:
+            name = random.choices(names, weights=name_weights)[0]
+            method, path = ENDPOINTS[name]
+            kwargs = {}
+            if name == "submit":
+                counter += 1
+                text = random.choice(REVIEW_TEXTS)
+                if args.unique_texts:
+                    text = f"{text} #{counter}"
+                kwargs["json"] = {"rating": random.randint(1, 5), "review_text": text}
+            elif name == "reviews":
+                kwargs["params"] = {"limit": 50}
+
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            results[name].append(((time.perf_counter() - start) * 1000, status))
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        await asyncio.gather(*[worker(client) for _ in range(args.concurrency)])
+
+    return results
+
+
+def summarize(
+    results: dict[str, list[tuple[float, int]]],
+    duration: float,
+    pool_samples: list[tuple[int, int]],
+    fake_requests: int
+) -> dict:
+    """Compute latency percentiles, throughput and pool saturation."""
+    summary = {"endpoints": {}, "duration_seconds": round(duration, 2), "llm_requests": fake_requests}
+    for name, samples in sorted(results.items()):
+        latencies = sorted(latency for latency, _ in samples)
+        errors = sum(1 for _, status in samples if status == 0 or status >= 500)
+        summary["endpoints"][name] = {
+            "requests": len(samples),
+            "errors": errors,
+            "rps": round(len(samples) / duration, 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+        }
+
+    if pool_samples:
+        capacity = pool_samples[0][1]
+        summary["pool"] = {
+            "capacity": capacity,
+            "max_checked_out": max(checked_out for checked_out, _ in pool_samples),
+            "avg_checked_out": round(sum(c for c, _ in pool_samples) / len(pool_samples), 2),
+            "saturated_pct": round(
+                100 * sum(1 for c, _ in pool_samples if c >= capacity) / len(pool_samples), 2
+            ),
+        }
+    return summary
+
+
+def print_summary(summary: dict) -> None:
+    print(f"\n{'endpoint':<10}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, row in summary["endpoints"].items():
+        print(
+            f"{name:<10}{row['requests']:>10}{row['errors']:>8}{row['rps']:>10}"
+            f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}"
+        )
+    print(f"\nLLM requests: {summary['llm_requests']} in {summary['duration_seconds']}s")
+    if "pool" in summary:
+        pool = summary["pool"]
+        print(
+            f"Pool: capacity={pool['capacity']} max_checked_out={pool['max_checked_out']} "
+            f"avg_checked_out={pool['avg_checked_out']} saturated={pool['saturated_pct']}%"
+        )
+
+
+def check_regressions(summary: dict, baseline_path: str, max_regression: float) -> list[str]:
+    """List endpoints whose p95 grew by more than max_regression."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = []
+    for name, row in summary["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if not previous or not previous["p95_ms"]:
+            continue
+        change = (row["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"]
+        if change > max_regression:
+            regressions.append(f"{name}: p95 {previous['p95_ms']}ms -> {row['p95_ms']}ms (+{change:.0%})")
+    return regressions
+
+
+async def main() -> int:
+    args = parse_args()
+    configure_environment(args)
+
+    # Import after the environment is configured: settings are read at import
+    from app.database import engine
+    from app.main import app
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    fake_app = create_fake_openai_app(config_from_args(args))
+    fake_server, fake_task = await start_server(fake_app, args.fake_port)
+    app_server, app_task = await start_server(app, args.app_port)
+
+    try:
+        await seed_reviews(args.seed_reviews)
+
+        pool_samples: list[tuple[int, int]] = []
+        stop_sampling = asyncio.Event()
+        sampler = asyncio.create_task(sample_pool(engine, pool_samples, stop_sampling))
+
+        requests_before = fake_app.state.requests
+        start = time.perf_counter()
+        results = await run_load(args, f"http://127.0.0.1:{args.app_port}")
+        duration = time.perf_counter() - start
+
+        stop_sampling.set()
+        await sampler
+    finally:
+        app_server.should_exit = True
+        fake_server.should_exit = True
+        await asyncio.gather(app_task, fake_task)
+
+    summary = summarize(results, duration, pool_samples, fake_app.state.requests - requests_before)
+    print_summary(summary)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+
+    if args.baseline:
+        regressions = check_regressions(summary, args.baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,117 @@
+"""
+Benchmark: cold start time of the API process.
+
+Each run starts a fresh interpreter and measures the time to import
+app.main, to complete the lifespan startup (schema check, pool pre-warm)
+and to answer the first GET /health. The `eager` rows import the OpenAI
+SDK up front, as app startup did before the client was made lazy.
+Each measurement also reports whether importing app.main pulled in the
+OpenAI SDK and which DDL statements the startup ran (tests/test_startup.py
+checks both).
+
+    python -m benchmarks.startup --runs 10
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.startup
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PHASES = ("import", "lifespan", "first_request", "total")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_DDL = re.compile(r"\s*(CREATE|ALTER|DROP)\b", re.IGNORECASE)
+
+
+async def measure_once(eager_openai: bool) -> dict:
+    """
+    Run one cold start in this (fresh) process.
+
+    Returns:
+        Phase timings in ms, whether the OpenAI SDK was imported by the
+        time app.main was, and the DDL statements run during startup
+    """
+    started = time.perf_counter()
+    if eager_openai:
+        import openai  # noqa: F401
+    from app.main import app
+    imported = time.perf_counter()
+    openai_imported = "openai" in sys.modules
+
+    import httpx
+    from sqlalchemy import event
+    from app.database import engine
+
+    ddl = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record_ddl(conn, cursor, statement, parameters, context, executemany):
+        if _DDL.match(statement):
+            ddl.append(statement.strip())
+
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/health")
+            response.raise_for_status()
+        answered = time.perf_counter()
+
+    return {
+        "import": (imported - started) * 1000,
+        "lifespan": (ready - imported) * 1000,
+        "first_request": (answered - ready) * 1000,
+        "total": (answered - started) * 1000,
+        "openai_imported": openai_imported,
+        "ddl": ddl,
+    }
+
+
+def run_child(database_url: str, eager_openai: bool) -> dict:
+    """Start a fresh interpreter for one measurement."""
+    env = dict(os.environ, DATABASE_URL=database_url, OPENAI_API_KEY="sk-benchmark")
+    command = [sys.executable, "-m", "benchmarks.startup", "--child"]
+    if eager_openai:
+        command.append("--eager-openai")
+    output = subprocess.run(
+        command, env=env, cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--eager-openai", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(measure_once(args.eager_openai))))
+        return
+
+    database_url = args.database_url or "sqlite+aiosqlite:///" + os.path.join(
+        tempfile.mkdtemp(prefix="feedback-bench-"), "bench.db"
+    )
+    # First start creates/migrates the schema; it is not part of the measurement
+    run_child(database_url, eager_openai=False)
+
+    for name, eager in (("eager", True), ("lazy", False)):
+        runs = [run_child(database_url, eager) for _ in range(args.runs)]
+        print(f"{name:<6} " + " ".join(
+            f"{phase}={statistics.median(run[phase] for run in runs):.0f}ms"
+            for phase in PHASES
+        ))
+
+
+if __name__ == "__main__":
+    main()
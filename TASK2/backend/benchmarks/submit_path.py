@@ -0,0 +1,158 @@
+"""
+Benchmark: database work per successful POST /reviews submission.
+
+Compares the legacy write path (INSERT + refresh, UPDATE + refresh, two
+commits) with the current single INSERT ... RETURNING path. The LLM is
+not called; a fixed analysis is used so only database cost is measured.
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.submit_path
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import Review, ReviewStatus
+from app.schemas import LLMAnalysis, ReviewCreate
+from app.services.review_service import ReviewService
+
+ANALYSIS = LLMAnalysis(
+    user_response="Thank you for your feedback!",
+    internal_summary="Positive review",
+    recommended_actions="None"
+)
+REVIEW = ReviewCreate(rating=5, review_text="Great food and friendly staff.")
+
+
+def make_engine(url: str):
+    """Create the benchmark engine; SQLite gets an attached 'fynd' schema."""
+    if url.startswith("sqlite"):
+        engine = create_async_engine(url)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _attach_schema(dbapi_connection, connection_record):
+            dbapi_connection.execute("ATTACH DATABASE ':memory:' AS fynd")
+
+        return engine
+
+    return create_async_engine(
+        url,
+        connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+    )
+
+
+class StatementCounter:
+    """Counts SQL statements and commits issued through an engine."""
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+
+    def _on_execute(self, *args) -> None:
+        self.statements += 1
+
+    def _on_commit(self, *args) -> None:
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+async def legacy_submit(session_factory) -> None:
+    """The previous write path, reproduced step by step."""
+    async with session_factory() as db:
+        review = Review(
+            rating=REVIEW.rating,
+            review_text=REVIEW.review_text,
+            status=ReviewStatus.PENDING
+        )
+        db.add(review)
+        await db.flush()
+        await db.refresh(review)
+
+        review.ai_response = ANALYSIS.user_response
+        review.ai_summary = ANALYSIS.internal_summary
+        review.ai_actions = ANALYSIS.recommended_actions
+        review.status = ReviewStatus.SUCCESS
+        await db.flush()
+        await db.refresh(review)
+
+        await db.commit()  # route
+        await db.commit()  # get_db
+
+
+async def current_submit(session_factory, review_service: ReviewService) -> None:
+    """The current write path, as used by POST /reviews and get_db."""
+    async with session_factory() as db:
+        await review_service.create_review_with_analysis(
+            db=db,
+            review_data=REVIEW,
+            analysis=ANALYSIS,
+            success=True
+        )
+        await db.commit()
+        if db.in_transaction():
+            await db.commit()
+
+
+async def measure(name, submit, counter, iterations: int) -> None:
+    """Run a submit function repeatedly and print statements and latency."""
+    await submit()  # warm up connection and compiled statement caches
+    counter.reset()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await submit()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    print(
+        f"{name:<8} statements/request={counter.statements / iterations:.1f} "
+        f"commits/request={counter.commits / iterations:.1f} "
+        f"p50={statistics.median(latencies):.2f}ms "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCH_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+    )
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            await conn.execute(text("CREATE SCHEMA IF NOT EXISTS fynd"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    counter = StatementCounter(engine)
+    review_service = ReviewService()
+
+    await measure("legacy", lambda: legacy_submit(session_factory), counter, args.iterations)
+    await measure(
+        "current",
+        lambda: current_submit(session_factory, review_service),
+        counter,
+        args.iterations
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
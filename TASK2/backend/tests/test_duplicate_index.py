@@ -0,0 +1,82 @@
+"""
+Near-duplicate index checks: edited copies are found, other reviews are not.
+
+    python -m pytest tests/test_duplicate_index.py
+"""
+
+from app.schemas import LLMAnalysis
+from app.services.duplicate_index import DuplicateDetector, MinHashIndex, signature
+
+MIN_WORDS = 8
+
+REVIEW = (
+    "We came here for a birthday dinner on a Friday night and waited almost forty minutes "
+    "for a table even though we had a reservation. The server was friendly but clearly "
+    "overwhelmed, and our appetizers arrived after the main courses. The steak was cooked "
+    "perfectly and the mashed potatoes were creamy, but the salmon was dry and the dessert "
+    "menu was missing half of its items. Parking was easy and the room looked great."
+)
+ONE_WORD_EDITED = REVIEW.replace("friendly", "polite")
+OTHER_REVIEW = (
+    "Quick lunch stop between meetings. The burrito bowl was huge, the salsa verde had a "
+    "real kick and the line moved fast even at noon. Tables were a little sticky and the "
+    "music was too loud to talk, but for the price you cannot beat it. I will be back "
+    "next week to try the fish tacos everyone keeps recommending to me."
+)
+
+
+def make_analysis(summary: str) -> LLMAnalysis:
+    return LLMAnalysis(
+        user_response="Thank you for your review!",
+        internal_summary=summary,
+        recommended_actions="None"
+    )
+
+
+def test_one_word_edit_is_found():
+    index = MinHashIndex(max_entries=1000)
+    index.add(1, signature(REVIEW, MIN_WORDS), 3, make_analysis("first"))
+    index.add(2, signature(OTHER_REVIEW, MIN_WORDS), 3, make_analysis("second"))
+
+    match = index.find(signature(ONE_WORD_EDITED, MIN_WORDS), 3)
+
+    assert match is not None
+    review_id, analysis = match
+    assert review_id == 1
+    assert analysis.internal_summary == "first"
+
+
+def test_other_review_or_rating_is_not_found():
+    index = MinHashIndex(max_entries=1000)
+    index.add(1, signature(REVIEW, MIN_WORDS), 3, make_analysis("first"))
+
+    assert index.find(signature(OTHER_REVIEW, MIN_WORDS), 3) is None
+    assert index.find(signature(ONE_WORD_EDITED, MIN_WORDS), 4) is None
+
+
+def test_short_review_is_not_signed():
+    assert signature("Great food, friendly staff.", MIN_WORDS) is None
+
+
+def test_generations_evict_oldest_reviews():
+    index = MinHashIndex(max_entries=2)
+    index.add(1, signature(REVIEW, MIN_WORDS), 3, make_analysis("first"))
+    index.add(2, signature(OTHER_REVIEW, MIN_WORDS), 3, make_analysis("second"))
+    index.add(3, signature(OTHER_REVIEW.upper(), MIN_WORDS), 3, make_analysis("third"))
+
+    assert len(index) == 2
+    assert index.find(signature(REVIEW, MIN_WORDS), 3) is None
+    assert index.find(signature(OTHER_REVIEW, MIN_WORDS), 3)[0] == 3
+
+
+def test_detector_reuses_stored_analysis():
+    detector = DuplicateDetector(
+        enabled=True, max_reviews=1000, min_words=MIN_WORDS, spam_threshold=3, spam_window_seconds=600
+    )
+    detector.add(7, 5, REVIEW, make_analysis("stored"))
+
+    check = detector.check(5, ONE_WORD_EDITED, "203.0.113.1")
+
+    assert check.duplicate_of == 7
+    assert check.analysis.internal_summary == "stored"
+    assert check.spam_suspected is False
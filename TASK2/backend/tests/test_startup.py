@@ -0,0 +1,112 @@
+"""
+Cold start checks.
+
+Each startup runs in a fresh interpreter through the startup benchmark's
+child measurement, against a temporary SQLite database (or
+BENCH_DATABASE_URL, to cover the Postgres migration path). The schema
+version check of init_db is also checked in-process against a stand-in
+PostgreSQL engine:
+
+    python -m pytest tests/test_startup.py
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app import database
+from benchmarks.startup import run_child
+
+# Generous ceiling for import, lifespan and first request: catches an eager
+# heavy import or startup work creeping back in, not small drifts
+STARTUP_BUDGET_MS = 5000
+
+
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory) -> str:
+    """A database at the current schema version."""
+    url = os.environ.get("BENCH_DATABASE_URL") or "sqlite+aiosqlite:///" + str(
+        tmp_path_factory.mktemp("startup") / "startup.db"
+    )
+    # First start creates/migrates the schema
+    run_child(url, eager_openai=False)
+    return url
+
+
+def test_importing_app_does_not_import_openai(database_url):
+    result = run_child(database_url, eager_openai=False)
+    assert result["openai_imported"] is False
+
+
+def test_cold_start_within_budget(database_url):
+    result = run_child(database_url, eager_openai=False)
+    assert result["total"] < STARTUP_BUDGET_MS, result
+
+
+@pytest.mark.skipif(
+    not os.environ.get("BENCH_DATABASE_URL", "").startswith("postgresql"),
+    reason="init_db only checks the schema version on PostgreSQL (set BENCH_DATABASE_URL)"
+)
+def test_startup_on_current_schema_runs_no_ddl(database_url, monkeypatch):
+    monkeypatch.setenv("DB_MIGRATE_ON_STARTUP", "false")
+    result = run_child(database_url, eager_openai=False)
+    assert result["ddl"] == []
+
+
+@pytest.fixture
+def schema(monkeypatch) -> SimpleNamespace:
+    """
+    Run init_db against a stand-in PostgreSQL engine.
+
+    Set `state.version` to the applied schema version; `state.calls` records
+    the migration and trigger steps init_db took.
+    """
+    state = SimpleNamespace(version=database.SCHEMA_VERSION, calls=[])
+
+    @asynccontextmanager
+    async def begin():
+        yield None
+
+    async def get_schema_version(conn) -> int:
+        state.calls.append("version")
+        return state.version
+
+    async def migrate(conn) -> int:
+        state.calls.append("migrate")
+        return database.SCHEMA_VERSION - state.version
+
+    async def sync_review_triggers(conn) -> None:
+        state.calls.append("triggers")
+
+    engine = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"), begin=begin)
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "get_schema_version", get_schema_version)
+    monkeypatch.setattr(database, "migrate", migrate)
+    monkeypatch.setattr(database, "_sync_review_triggers", sync_review_triggers)
+    return state
+
+
+def test_init_db_without_migrations_only_checks_version(schema):
+    asyncio.run(database.init_db(run_migrations=False))
+    assert schema.calls == ["version"]
+
+
+def test_init_db_without_migrations_refuses_outdated_schema(schema):
+    schema.version = database.SCHEMA_VERSION - 1
+    with pytest.raises(RuntimeError, match="python -m app.migrate"):
+        asyncio.run(database.init_db(run_migrations=False))
+    assert schema.calls == ["version"]
+
+
+def test_init_db_with_migrations_migrates_and_syncs_triggers(schema):
+    schema.version = database.SCHEMA_VERSION - 1
+    asyncio.run(database.init_db(run_migrations=True))
+    assert schema.calls == ["version", "migrate", "triggers"]
+
+
+def test_init_db_on_current_schema_skips_migrations(schema):
+    asyncio.run(database.init_db(run_migrations=True))
+    assert schema.calls == ["version", "triggers"]